@@ -2,5 +2,17 @@ from django.contrib import admin
 from .models import User, Workout, Exercise
 
 admin.site.register(User)
-admin.site.register(Workout)
-admin.site.register(Exercise)
+
+
+@admin.register(Workout)
+class WorkoutAdmin(admin.ModelAdmin):
+    list_select_related = ("user",)  # Workout.__str__ usa self.user.username
+
+
+@admin.register(Exercise)
+class ExerciseAdmin(admin.ModelAdmin):
+    def delete_queryset(self, request, queryset):
+        # Exercise.delete invalida o cache e registra a exclusão para a
+        # sincronização, o que o QuerySet.delete() não faz
+        for exercise in queryset:
+            exercise.delete()
@@ -0,0 +1,180 @@
+# apps/workout/analytics.py
+import numpy as np
+from django.db.models import FloatField
+from django.db.models.functions import Cast, TruncDate
+
+from .models import ExerciseHistory, WorkoutHistory
+
+# Janelas (em dias) da razão carga aguda / carga crônica (ACWR)
+ACUTE_WINDOW = 7
+CHRONIC_WINDOW = 28
+
+
+def load_history(user, exercise=None):
+    """Carrega o histórico de séries do usuário em arrays colunares.
+
+    Os valores são lidos com values_list e o peso já vem convertido para
+    float pelo banco, sem instanciar models nem um Decimal por série.
+    Retorna um dict de arrays ordenados por data: date (datetime64[D]),
+    exercise (int64), weight (float64), repetitions (int64) e rpe (int64).
+    Séries não realizadas (0 repetições) são descartadas.
+    """
+    # A data local é calculada uma vez por treino, não uma vez por série
+    histories = (
+        WorkoutHistory.objects.filter(user=user)
+        .annotate(day=TruncDate("date"))
+        .order_by("date", "id")
+        .values_list("id", "day")
+    )
+    history_ids, history_days = list(zip(*histories)) or [()] * 2
+    history_ids = np.array(history_ids, dtype=np.int64)
+    history_days = np.array(history_days, dtype="datetime64[D]")
+
+    rows = ExerciseHistory.objects.filter(
+        workout_history__user=user, actual_repetitions__gt=0
+    )
+    if exercise is not None:
+        rows = rows.filter(exercise=exercise)
+    rows = (
+        rows.annotate(weight=Cast("weight_used", FloatField()))
+        .order_by("id")
+        .values_list(
+            "workout_history_id", "exercise_id", "weight", "actual_repetitions", "rpe"
+        )
+    )
+    history, exercise_id, weight, repetitions, rpe = list(zip(*rows)) or [()] * 5
+
+    # Posição cronológica do treino de cada série
+    sorter = np.argsort(history_ids)
+    position = sorter[
+        np.searchsorted(history_ids, np.array(history, dtype=np.int64), sorter=sorter)
+    ]
+    order = np.argsort(position, kind="stable")
+    return {
+        "date": history_days[position][order],
+        "exercise": np.array(exercise_id, dtype=np.int64)[order],
+        "weight": np.array(weight, dtype=np.float64)[order],
+        "repetitions": np.array(repetitions, dtype=np.int64)[order],
+        "rpe": np.array(rpe, dtype=np.int64)[order],
+    }
+
+
+def estimated_1rm(weight, repetitions):
+    """1RM estimado (Epley) de cada série."""
+    return np.where(repetitions <= 1, weight, weight * (1 + repetitions / 30))
+
+
+def rpe_adjusted_load(data):
+    """1RM estimado de cada série considerando as repetições em reserva.
+
+    Uma série com RPE 8 deixou ~2 repetições em reserva, então equivale a
+    uma série até a falha com repetições + (10 - RPE).
+    """
+    reserve = np.clip(10 - data["rpe"], 0, None)
+    return estimated_1rm(data["weight"], data["repetitions"] + reserve)
+
+
+def daily_totals(data, values):
+    """Soma values por dia, em um eixo contínuo de dias.
+
+    Retorna (dias, totais); dias sem treino aparecem com total 0.
+    """
+    if not len(values):
+        return np.array([], dtype="datetime64[D]"), np.array([], dtype=np.float64)
+    start = data["date"].min()
+    offsets = (data["date"] - start).astype(np.int64)
+    totals = np.bincount(offsets, weights=values)
+    return start + np.arange(len(totals)), totals
+
+
+def rolling_sum(values, window):
+    """Soma móvel dos últimos window valores (inclusive o atual)."""
+    cumulative = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    start = np.maximum(np.arange(1, len(cumulative)) - window, 0)
+    return cumulative[1:] - cumulative[start]
+
+
+def rolling_volume(data, window=ACUTE_WINDOW):
+    """Tonelagem (peso x repetições) diária e sua soma móvel em window dias."""
+    days, tonnage = daily_totals(data, data["weight"] * data["repetitions"])
+    return days, tonnage, rolling_sum(tonnage, window)
+
+
+def personal_records(data):
+    """Marca as séries que superaram o melhor 1RM estimado do exercício.
+
+    Retorna um array booleano alinhado com data; a primeira série de cada
+    exercício sempre conta como recorde.
+    """
+    e1rm = estimated_1rm(data["weight"], data["repetitions"])
+    if not len(e1rm):
+        return np.zeros(0, dtype=bool)
+
+    # Ordena por exercício mantendo a ordem cronológica dentro de cada um
+    order = np.argsort(data["exercise"], kind="stable")
+    exercises = data["exercise"][order]
+    values = e1rm[order]
+
+    # Máximo acumulado por exercício: trabalha com a posição de cada valor
+    # (inteiros, sem erro de arredondamento) e desloca cada grupo para uma
+    # faixa própria, de forma que o máximo de um grupo não vaze para o seguinte
+    ranks = np.unique(values, return_inverse=True)[1].reshape(-1)
+    first = np.concatenate(([True], exercises[1:] != exercises[:-1]))
+    offset = (np.cumsum(first) - 1) * (ranks.max() + 1)
+    best = np.maximum.accumulate(ranks + offset) - offset
+
+    previous = np.concatenate(([-1], best[:-1]))
+    previous[first] = -1
+    records = np.empty_like(first)
+    records[order] = ranks > previous
+    return records
+
+
+def acwr(data, acute=ACUTE_WINDOW, chronic=CHRONIC_WINDOW):
+    """Razão entre carga aguda e crônica (ACWR).
+
+    A carga de cada série é a tonelagem ponderada pelo RPE; as cargas aguda e
+    crônica são as médias diárias nas respectivas janelas. Retorna (dias,
+    razão); a razão é NaN enquanto não há carga crônica.
+    """
+    load = data["weight"] * data["repetitions"] * data["rpe"] / 10
+    days, load = daily_totals(data, load)
+    acute_load = rolling_sum(load, acute) / acute
+    chronic_load = rolling_sum(load, chronic) / chronic
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(chronic_load > 0, acute_load / chronic_load, np.nan)
+    return days, ratio
+
+
+def lttb(x, y, threshold):
+    """Escolhe threshold pontos de uma série com o Largest-Triangle-Three-Buckets.
+
+    Mantém o primeiro e o último ponto e, de cada faixa intermediária, o
+    ponto que forma o maior triângulo com o ponto anterior escolhido e a
+    média da faixa seguinte, preservando picos e vales da curva. Retorna os
+    índices dos pontos escolhidos, em ordem.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # threshold - 2 faixas entre o primeiro e o último ponto
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i == threshold - 3:
+            next_x, next_y = x[-1], y[-1]
+        else:
+            next_x = x[end : edges[i + 2]].mean()
+            next_y = y[end : edges[i + 2]].mean()
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = selected[i + 1] = start + int(np.argmax(area))
+    return selected
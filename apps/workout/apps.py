@@ -3,3 +3,6 @@ from django.apps import AppConfig
 class WorkoutConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.workout'
+
+    def ready(self):
+        from . import signals  # noqa: F401 (registra os receivers)
@@ -0,0 +1,33 @@
+# apps/workout/caching.py
+import time
+
+from django.core.cache import cache
+
+# Tempo máximo que um fragmento renderizado fica em cache. A invalidação de
+# verdade é feita trocando a geração do usuário (ver signals.py); o timeout
+# apenas limita valores antigos em caches locais de outros processos.
+FRAGMENT_CACHE_TIMEOUT = 600
+
+
+def generation_cache_key(user_id):
+    return f"workout:generation:{user_id}"
+
+
+def cache_generation(user_id):
+    """Geração atual do cache do usuário, que entra na chave dos fragmentos."""
+    key = generation_cache_key(user_id)
+    generation = cache.get(key)
+    if generation is None:
+        # Começa pelo relógio: se a chave for descartada, a nova geração nunca
+        # coincide com uma anterior e fragmentos antigos não são reaproveitados
+        cache.add(key, time.time_ns(), None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_cache_generation(user_id):
+    """Invalida de uma vez todos os fragmentos em cache do usuário."""
+    try:
+        cache.incr(generation_cache_key(user_id))
+    except ValueError:  # Chave ausente
+        cache.set(generation_cache_key(user_id), time.time_ns(), None)
@@ -1,7 +1,23 @@
 # apps/workout/context_processors.py
-from .models import WorkoutSession
+from django.core.cache import cache
 from django.utils import timezone
 
+from .caching import FRAGMENT_CACHE_TIMEOUT, cache_generation
+from .models import WorkoutSession
+
+# Tempo máximo que o id da sessão atual fica em cache. A invalidação é
+# explícita (ver signals.py); o timeout apenas limita valores antigos em
+# caches locais de outros processos.
+CURRENT_SESSION_CACHE_TIMEOUT = 60
+
+
+def current_session_cache_key(user_id):
+    return f"workout:current_session:{user_id}"
+
+
+def invalidate_current_session(user_id):
+    cache.delete(current_session_cache_key(user_id))
+
 
 def current_session_status(request):
     user = request.user
@@ -11,15 +27,31 @@ def current_session_status(request):
     }
 
     if user.is_authenticated:
-        # Busca a sessão atual em andamento
-        current_session = (
-            WorkoutSession.objects.filter(user=user, date__lte=timezone.now())
-            .order_by("-date")
-            .first()
-        )
-
-        if current_session:
+        key = current_session_cache_key(user.id)
+        current_session_id = cache.get(key)
+
+        if current_session_id is None:
+            # Busca a sessão atual em andamento (0 indica que não há sessão)
+            current_session_id = (
+                WorkoutSession.objects.filter(user=user, date__lte=timezone.now())
+                .order_by("-date")
+                .values_list("id", flat=True)
+                .first()
+            ) or 0
+            cache.set(key, current_session_id, CURRENT_SESSION_CACHE_TIMEOUT)
+
+        if current_session_id:
             context["has_session"] = True
-            context["current_session_id"] = current_session.id
+            context["current_session_id"] = current_session_id
 
     return context
+
+
+def fragment_cache(request):
+    """Geração e timeout usados nas chaves dos fragmentos em {% cache %}."""
+    if not request.user.is_authenticated:
+        return {}
+    return {
+        "cache_generation": cache_generation(request.user.id),
+        "fragment_cache_timeout": FRAGMENT_CACHE_TIMEOUT,
+    }
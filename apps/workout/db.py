@@ -0,0 +1,75 @@
+# apps/workout/db.py
+import logging
+import random
+import time
+
+from django.db import OperationalError, connection, transaction
+
+logger = logging.getLogger(__name__)
+
+# Pragmas aplicados a cada nova conexão SQLite (ver signals.py)
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",  # Leituras não esperam pelas escritas
+    "synchronous": "NORMAL",  # Seguro com WAL; fsync só no checkpoint
+    "mmap_size": 256 * 1024 * 1024,  # Lê o arquivo por memória mapeada
+    "cache_size": -64000,  # Negativo: em KiB, ~64 MB por conexão
+    "busy_timeout": 5000,  # Espera até 5 s por um lock antes de falhar
+}
+
+# Novas tentativas de uma transação de escrita quando o banco está bloqueado
+WRITE_RETRIES = 5
+WRITE_RETRY_DELAY = 0.05  # Segundos; dobra a cada tentativa
+
+
+def configure_sqlite(connection):
+    with connection.cursor() as cursor:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def is_locked_error(error):
+    return isinstance(error, OperationalError) and "locked" in str(error)
+
+
+class _WriteAttempt:
+    def __init__(self, retry):
+        self.retry = retry
+        self.error = None
+
+    def __enter__(self):
+        self.atomic = transaction.atomic()
+        self.atomic.__enter__()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.atomic.__exit__(exc_type, exc, tb)  # Desfaz a tentativa com erro
+        if self.retry and is_locked_error(exc):
+            self.error = exc
+            return True  # Suprime o erro; o laço tenta de novo
+        return False
+
+
+def write_transaction(retries=WRITE_RETRIES):
+    """Transação de escrita curta, repetida se o banco estiver bloqueado.
+
+    Uso:
+
+        for attempt in write_transaction():
+            with attempt:
+                ...  # apenas as escritas; leituras e validação ficam fora
+
+    Cada tentativa roda em seu próprio transaction.atomic(). Se falhar com
+    "database is locked", é desfeita e repetida após uma espera crescente.
+    Dentro de outra transação não há como repetir só um trecho: o bloco
+    roda uma única vez e o erro é propagado.
+    """
+    retry = not connection.in_atomic_block
+    for i in range(retries):
+        attempt = _WriteAttempt(retry and i < retries - 1)
+        yield attempt
+        if attempt.error is None:
+            return
+        delay = WRITE_RETRY_DELAY * 2**i * random.uniform(0.5, 1.5)
+        logger.warning(
+            "Banco bloqueado; nova tentativa em %.2fs (%s/%s)", delay, i + 1, retries
+        )
+        time.sleep(delay)
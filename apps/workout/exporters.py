@@ -0,0 +1,175 @@
+# apps/workout/exporters.py
+import csv
+import tempfile
+
+from django.db.models import Count, Max, Min, Sum
+from django.utils import timezone
+
+from .importers import REQUIRED_COLUMNS
+from .models import Exercise, ExerciseHistory, Workout
+
+# Linhas lidas do banco por vez: o histórico nunca é carregado inteiro
+EXPORT_CHUNK_SIZE = 2000
+# Tamanho dos pedaços da planilha .xlsx enviados ao cliente
+XLSX_CHUNK_BYTES = 64 * 1024
+
+# As colunas da importação vêm primeiro, então o arquivo exportado pode ser
+# importado de volta; as colunas extras do histórico são ignoradas por ela
+HISTORY_COLUMNS = REQUIRED_COLUMNS + (
+    "Sessões",
+    "Séries feitas",
+    "Repetições feitas",
+    "Maior peso",
+    "Primeira data",
+    "Última data",
+)
+
+
+def _workout_keys(user):
+    """order_id de cada treino na planilha: {id do treino: (order_id, nome)}.
+
+    A importação agrupa os exercícios pelo order_id e exige que ele seja
+    positivo. Treinos sem ordem (0) ou com a ordem repetida recebem um número
+    livre, para que cada treino volte como um treino.
+    """
+    workouts = list(
+        Workout.objects.filter(user=user)
+        .order_by("order_id", "id")
+        .values_list("id", "order_id", "name")
+    )
+    used = set()
+    keys = {}
+    next_free = max((order_id for _, order_id, _ in workouts), default=0) + 1
+    for workout_id, order_id, name in workouts:
+        if order_id <= 0 or order_id in used:
+            order_id, next_free = next_free, next_free + 1
+        used.add(order_id)
+        keys[workout_id] = (order_id, name)
+    return keys
+
+
+def _local(date):
+    # O Excel não aceita datas com fuso: exporta no horário local, sem frações
+    return timezone.localtime(date).replace(tzinfo=None, microsecond=0)
+
+
+def workout_rows(user):
+    """Treinos e exercícios do usuário, no formato exato da importação."""
+    keys = _workout_keys(user)
+    yield REQUIRED_COLUMNS
+    exercises = (
+        Exercise.objects.filter(workout__user=user)
+        .order_by("workout__order_id", "workout_id", "id")
+        .values_list("workout_id", "name", "sets", "repetitions", "rpe")
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    for workout_id, name, sets, repetitions, rpe in exercises:
+        order_id, group = keys[workout_id]
+        yield (order_id, group, name, sets, repetitions, rpe)
+
+
+def history_rows(user):
+    """Uma linha por exercício treinado, com o histórico dele resumido.
+
+    As séries são agregadas pelo banco (GROUP BY), então cada exercício vira
+    uma linha no formato da importação, e reimportar o arquivo recria o
+    treino em vez de um exercício por série registrada.
+    """
+    keys = _workout_keys(user)
+    yield HISTORY_COLUMNS
+    exercises = (
+        ExerciseHistory.objects.filter(workout_history__user=user)
+        .values_list(
+            "workout_history__workout_id",
+            "exercise__name",
+            "exercise__sets",
+            "exercise__repetitions",
+            "exercise__rpe",
+        )
+        .annotate(
+            sessions=Count("workout_history_id", distinct=True),
+            sets_done=Count("id"),
+            repetitions_done=Sum("actual_repetitions"),
+            best_weight=Max("weight_used"),
+            first=Min("workout_history__date"),
+            last=Max("workout_history__date"),
+        )
+        .order_by(
+            "workout_history__workout__order_id",
+            "workout_history__workout_id",
+            "exercise_id",
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    for workout_id, name, sets, repetitions, rpe, *summary, first, last in exercises:
+        order_id, group = keys[workout_id]
+        yield (
+            order_id,
+            group,
+            name,
+            sets,
+            repetitions,
+            rpe,
+            *summary,
+            _local(first),
+            _local(last),
+        )
+
+
+class _Echo:
+    """Arquivo que devolve o que é escrito, para o csv.writer gerar cada linha."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows):
+    # O BOM faz o Excel reconhecer o UTF-8; a importação o ignora (utf-8-sig)
+    yield "\ufeff"
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_xlsx(rows, title):
+    """Gera a planilha em modo write_only, que grava as linhas em um arquivo
+    temporário em vez de montá-las na memória, e a envia em pedaços.
+
+    O formato .xlsx é um zip e só pode ser enviado depois de fechado, então o
+    primeiro byte sai quando a última linha foi escrita.
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title)
+    for row in rows:
+        sheet.append(row)
+    with tempfile.TemporaryFile() as f:
+        workbook.save(f)
+        f.seek(0)
+        while chunk := f.read(XLSX_CHUNK_BYTES):
+            yield chunk
+
+
+# conteúdo -> (linhas, nome do arquivo e da aba)
+CONTENTS = {
+    "historico": (history_rows, "historico"),
+    "treinos": (workout_rows, "treinos"),
+}
+FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def export(user, conteudo, formato):
+    """Exportação em streaming: retorna (gerador de pedaços, content type,
+    nome do arquivo) ou None se o conteúdo ou o formato não existem."""
+    if conteudo not in CONTENTS or formato not in FORMATS:
+        return None
+    rows, name = CONTENTS[conteudo]
+    if formato == "csv":
+        stream = stream_csv(rows(user))
+    else:
+        stream = stream_xlsx(rows(user), name)
+    return stream, FORMATS[formato], f"{name}.{formato}"
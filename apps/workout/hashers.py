@@ -0,0 +1,24 @@
+# apps/workout/hashers.py
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class BCryptSHA256PasswordHasher(hashers.BCryptSHA256PasswordHasher):
+    """bcrypt com o custo de settings.BCRYPT_ROUNDS.
+
+    O nome do algoritmo é o mesmo do Django, então os hashes já gravados
+    continuam válidos. Quando o custo muda, must_update faz o login regravar
+    a senha com o novo custo.
+    """
+
+    @property
+    def rounds(self):
+        return settings.BCRYPT_ROUNDS
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 com as iterações de settings.PBKDF2_ITERATIONS."""
+
+    @property
+    def iterations(self):
+        return settings.PBKDF2_ITERATIONS
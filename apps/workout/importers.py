@@ -0,0 +1,256 @@
+# apps/workout/importers.py
+import csv
+import io
+import itertools
+import logging
+import math
+import os
+import time
+
+from django.db import transaction
+
+from .caching import bump_cache_generation
+from .models import Workout, Exercise
+
+logger = logging.getLogger(__name__)
+
+# Colunas esperadas na planilha de importação
+REQUIRED_COLUMNS = ("order_id", "Grupo", "Exercicio", "séries", "repetições", "RPE")
+
+# Quantidade de linhas inseridas por INSERT no bulk_create
+BATCH_SIZE = 500
+
+# Limite de erros reportados ao usuário por importação
+MAX_ERRORS = 20
+
+
+def _to_int(value):
+    """Converte o valor de uma célula para int, aceitando 4, 4.0, "4" e "4,0".
+
+    Valores fracionários ("4.5") levantam ValueError em vez de serem truncados.
+    """
+    if value is None:
+        raise ValueError
+    if isinstance(value, str):
+        value = float(value.strip().replace(",", "."))
+    if isinstance(value, float):
+        if math.isnan(value) or not value.is_integer():
+            raise ValueError
+        return int(value)
+    return int(value)
+
+
+def _to_text(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return str(value).strip()
+
+
+def validate_row(row, line):
+    """Valida uma linha da planilha.
+
+    Retorna uma tupla (dados, erros), onde dados é um dict com os valores
+    já convertidos ou None se a linha for inválida.
+    """
+    errors = []
+    try:
+        order_id = _to_int(row.get("order_id"))
+        if order_id <= 0:
+            raise ValueError
+    except (TypeError, ValueError):
+        errors.append(f"Linha {line}: 'order_id' deve ser um número maior que 0.")
+        order_id = None
+
+    group = _to_text(row.get("Grupo"))
+    if len(group) < 2:
+        errors.append(f"Linha {line}: 'Grupo' deve ter pelo menos 2 caracteres.")
+
+    name = _to_text(row.get("Exercicio"))
+    if len(name) < 2:
+        errors.append(f"Linha {line}: 'Exercicio' deve ter pelo menos 2 caracteres.")
+
+    try:
+        sets = _to_int(row.get("séries"))
+        repetitions = _to_int(row.get("repetições"))
+        rpe = _to_int(row.get("RPE"))
+        if sets <= 0 or repetitions <= 0 or not (1 <= rpe <= 10):
+            errors.append(
+                f"Linha {line}: séries, repetições devem ser positivos e RPE entre 1 e 10."
+            )
+    except (TypeError, ValueError):
+        errors.append(
+            f"Linha {line}: séries, repetições e RPE devem ser números válidos."
+        )
+
+    if errors:
+        return None, errors
+
+    return {
+        "order_id": order_id,
+        "group": group[:50],
+        "name": name[:50],
+        "sets": sets,
+        "repetitions": repetitions,
+        "rpe": rpe,
+    }, []
+
+
+def _read_csv(arquivo):
+    wrapper = io.TextIOWrapper(arquivo, encoding="utf-8-sig", newline="")
+    header = wrapper.readline()
+    try:
+        dialect = csv.Sniffer().sniff(header, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    return csv.reader(itertools.chain([header], wrapper), dialect)
+
+
+def _read_xlsx(arquivo):
+    from openpyxl import load_workbook
+
+    # read_only carrega as linhas sob demanda, sem montar a planilha inteira
+    workbook = load_workbook(arquivo, read_only=True, data_only=True)
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _read_xls(arquivo):
+    # Formato legado: depende do pandas, que é opcional
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError(
+            "O pandas é necessário para importar arquivos .xls. Envie um .xlsx ou .csv."
+        )
+    df = pd.read_excel(arquivo, dtype=object)
+    yield tuple(df.columns)
+    for values in df.itertuples(index=False, name=None):
+        yield tuple(None if pd.isna(value) else value for value in values)
+
+
+READERS = {".csv": _read_csv, ".xlsx": _read_xlsx, ".xls": _read_xls}
+
+
+def read_rows(arquivo):
+    """Lê a planilha enviada linha a linha.
+
+    Retorna uma tupla (colunas, linhas), onde linhas é um iterador de pares
+    (número da linha, dict) consumido sob demanda, mantendo o uso de memória
+    constante.
+    """
+    extension = os.path.splitext(arquivo.name or "")[1].lower()
+    reader = READERS.get(extension, _read_xlsx)
+    source = iter(reader(getattr(arquivo, "file", arquivo)))
+
+    header = next(source, None) or ()
+    columns = [_to_text(column) for column in header]
+
+    def rows():
+        for line, values in enumerate(source, start=2):  # 1 é o cabeçalho
+            if values is None or all(_to_text(value) == "" for value in values):
+                continue  # Ignorar linhas em branco
+            yield line, dict(zip(columns, values))
+
+    return columns, rows()
+
+
+READ_ERROR = "Erro ao importar treinos: não foi possível ler o arquivo."
+
+
+class _ImportAborted(Exception):
+    """Usada para desfazer a transação quando alguma linha é inválida."""
+
+
+def import_workouts(user, arquivo):
+    """Importa treinos e exercícios de uma planilha (.xlsx, .csv ou .xls)."""
+    try:
+        columns, rows = read_rows(arquivo)
+    except ImportError as e:
+        return {"errors": [str(e)]}
+    except Exception:
+        logger.exception("Falha ao ler a planilha de importação")
+        return {"errors": [READ_ERROR]}
+    try:
+        return import_rows(user, columns, rows)
+    except (UnicodeDecodeError, csv.Error):
+        logger.exception("Falha ao ler a planilha de importação")
+        return {"errors": [READ_ERROR]}
+
+
+def import_rows(user, columns, rows):
+    """Importa treinos e exercícios a partir das linhas lidas por read_rows.
+
+    As linhas são consumidas em streaming: cada treino é criado ao aparecer
+    seu order_id e os exercícios são gravados com bulk_create em lotes de
+    BATCH_SIZE, tudo dentro de uma única transação. Se qualquer linha for
+    inválida a transação é desfeita e nada é gravado.
+    """
+    started = time.perf_counter()
+
+    missing = [column for column in REQUIRED_COLUMNS if column not in columns]
+    if missing:
+        return {
+            "errors": [
+                "Erro ao importar treinos: coluna(s) não encontrada(s): "
+                + ", ".join(f"'{column}'" for column in missing)
+                + "."
+            ]
+        }
+
+    errors = []
+    error_count = 0
+    report = {"rows": 0, "workouts": 0, "exercises": 0}
+    try:
+        with transaction.atomic():
+            workouts = {}  # order_id -> Workout
+            batch = []
+            for line, row in rows:
+                report["rows"] += 1
+                data, row_errors = validate_row(row, line=line)
+                if row_errors:
+                    error_count += len(row_errors)
+                    if len(errors) < MAX_ERRORS:
+                        errors.extend(row_errors)
+                    continue
+                if error_count:
+                    continue  # Já vamos desfazer; apenas seguir validando
+
+                treino = workouts.get(data["order_id"])
+                if treino is None:
+                    treino = workouts[data["order_id"]] = Workout.objects.create(
+                        name=data["group"],  # Nome será o Grupo
+                        description=f"Treino {data['order_id']}",  # Treino 1, 2, 3...
+                        user=user,
+                        order_id=data["order_id"],  # Usar o order_id da planilha
+                    )
+                batch.append(
+                    Exercise(
+                        name=data["name"],
+                        sets=data["sets"],
+                        repetitions=data["repetitions"],
+                        rpe=data["rpe"],
+                        workout=treino,
+                    )
+                )
+                if len(batch) >= BATCH_SIZE:
+                    report["exercises"] += len(Exercise.objects.bulk_create(batch))
+                    batch = []
+
+            if error_count:
+                raise _ImportAborted
+            if batch:
+                report["exercises"] += len(Exercise.objects.bulk_create(batch))
+            report["workouts"] = len(workouts)
+    except _ImportAborted:
+        if error_count > len(errors):
+            errors.append(f"... e mais {error_count - len(errors)} erro(s).")
+        return {"errors": errors}
+
+    # Os exercícios foram gravados com bulk_create, que não dispara post_save
+    bump_cache_generation(user.id)
+
+    report["elapsed"] = round(time.perf_counter() - started, 3)
+    logger.info("Importação de treinos concluída", extra={"user_id": user.id, **report})
+    return {"report": report}
@@ -0,0 +1,74 @@
+# apps/workout/jobs.py
+import logging
+
+from django.db import close_old_connections
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .importers import import_workouts
+from .models import ImportJob, Workout, WorkoutHistory, WorkoutSession
+from .provisioning import provision_members
+
+logger = logging.getLogger(__name__)
+
+
+def _run_import(job):
+    with job.arquivo.open("rb") as arquivo:
+        result = import_workouts(job.user, arquivo)
+    job.arquivo.delete(save=False)  # A planilha não é mais necessária
+    return result
+
+
+def _run_complete_workout(job):
+    workout = Workout.objects.get(id=job.payload["workout_id"], user=job.user)
+    workout_session = WorkoutSession.objects.filter(
+        id=job.payload.get("workout_session_id"), user=job.user
+    ).first()
+    # O histórico e as estatísticas ficam no dia da conclusão, não no da execução
+    completed_at = job.payload.get("completed_at")
+    workout_history = WorkoutHistory.objects.record(
+        job.user,
+        workout,
+        job.payload.get("values", {}),
+        workout_session,
+        date=parse_datetime(completed_at) if completed_at else None,
+    )
+    return {"workout_history_id": workout_history.id}
+
+
+def _run_provision_members(job):
+    with job.arquivo.open("rb") as arquivo:
+        result = provision_members(arquivo)
+    job.arquivo.delete(save=False)  # A planilha contém senhas
+    return result
+
+
+HANDLERS = {
+    ImportJob.KIND_IMPORT: _run_import,
+    ImportJob.KIND_COMPLETE_WORKOUT: _run_complete_workout,
+    ImportJob.KIND_PROVISION_MEMBERS: _run_provision_members,
+}
+
+
+def run_job(job_id):
+    """Executa um job já reservado e grava o resultado.
+
+    Chamada pelo worker em um processo separado, por isso recebe apenas o id.
+    """
+    close_old_connections()
+    job = ImportJob.objects.select_related("user").get(id=job_id)
+    try:
+        result = HANDLERS[job.kind](job)
+    except Exception as e:
+        logger.exception("Job %s falhou", job.id)
+        job.status = ImportJob.STATUS_FAILED
+        job.result = {"errors": [f"Erro inesperado: {e}"]}
+    else:
+        job.status = (
+            ImportJob.STATUS_FAILED if "errors" in result else ImportJob.STATUS_DONE
+        )
+        job.result = result
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "result", "finished_at"])
+    logger.info("Job %s finalizado com status %s", job.id, job.status)
+    return job.status
@@ -0,0 +1,96 @@
+import math
+import time
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+
+def naive_analytics(user):
+    """Implementação ingênua, percorrendo os models um a um."""
+    from apps.workout.models import ExerciseHistory
+
+    tonnage = defaultdict(float)
+    best = {}
+    records = 0
+    histories = (
+        ExerciseHistory.objects.filter(
+            workout_history__user=user, actual_repetitions__gt=0
+        )
+        .select_related("workout_history")
+        .order_by("workout_history__date", "id")
+    )
+    for history in histories:
+        day = timezone.localdate(history.workout_history.date)
+        weight = history.weight_used  # Um Decimal por série
+        repetitions = history.actual_repetitions
+        tonnage[day] += float(weight * repetitions)
+        if repetitions <= 1:
+            e1rm = float(weight)
+        else:
+            e1rm = float(weight * (1 + Decimal(repetitions) / 30))
+        if e1rm > best.get(history.exercise_id, -1):
+            best[history.exercise_id] = e1rm
+            records += 1
+
+    rolling = {}
+    for day in tonnage:
+        rolling[day] = sum(tonnage.get(day - timedelta(days=i), 0) for i in range(7))
+    return sum(tonnage.values()), records, max(rolling.values(), default=0)
+
+
+def vectorized_analytics(user):
+    from apps.workout import analytics
+
+    data = analytics.load_history(user)
+    _, tonnage, rolling = analytics.rolling_volume(data)
+    records = analytics.personal_records(data)
+    analytics.acwr(data)
+    return float(tonnage.sum()), int(records.sum()), float(rolling.max(initial=0))
+
+
+class Command(BaseCommand):
+    help = "Compara o tempo das análises com NumPy e com um loop simples no ORM."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", required=True, help="E-mail do usuário.")
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="Execuções de cada versão."
+        )
+
+    def handle(self, *args, **options):
+        from apps.workout.models import User
+
+        try:
+            user = User.objects.get(email=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"Usuário '{options['user']}' não encontrado.")
+
+        results = {}
+        for name, function in (
+            ("ORM", naive_analytics),
+            ("NumPy", vectorized_analytics),
+        ):
+            timings = []
+            for _ in range(options["repeat"]):
+                started = time.perf_counter()
+                results[name] = function(user)
+                timings.append(time.perf_counter() - started)
+            self.stdout.write(
+                f"{name}: melhor de {options['repeat']}: {min(timings):.3f}s"
+            )
+
+        tonnage, records, rolling = results["ORM"]
+        expected = results["NumPy"]
+        if records != expected[1] or not all(
+            math.isclose(a, b, rel_tol=1e-6)
+            for a, b in ((tonnage, expected[0]), (rolling, expected[2]))
+        ):
+            self.stderr.write(f"Resultados divergentes: {results}")
+        else:
+            self.stdout.write(
+                f"Tonelagem {tonnage:.1f}, {records} recorde(s), "
+                f"maior volume em 7 dias {rolling:.1f}"
+            )
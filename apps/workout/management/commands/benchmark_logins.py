@@ -0,0 +1,139 @@
+import json
+import math
+import os
+import time
+import uuid
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import override_settings
+
+from .benchmark_urls import git_revision, percentile
+
+# Configurações medidas quando nenhuma --config é passada
+DEFAULT_CONFIGS = (
+    "bcrypt:10",
+    "bcrypt:11",
+    "bcrypt:12",
+    "pbkdf2:600000",
+    "pbkdf2:1000000",
+)
+# Setting com o custo de cada algoritmo
+COST_SETTINGS = {"bcrypt": "BCRYPT_ROUNDS", "pbkdf2": "PBKDF2_ITERATIONS"}
+
+
+def parse_config(value):
+    """'bcrypt:12' -> ('bcrypt', 12)."""
+    name, _, cost = value.partition(":")
+    if name not in settings.PASSWORD_HASHER_CLASSES:
+        raise CommandError(
+            f"Algoritmo desconhecido em '{value}'. Use um de: "
+            + ", ".join(settings.PASSWORD_HASHER_CLASSES)
+            + "."
+        )
+    try:
+        cost = int(cost) if cost else getattr(settings, COST_SETTINGS[name])
+    except ValueError:
+        raise CommandError(f"Custo inválido em '{value}'.")
+    return name, cost
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede quantos logins por segundo cada configuração de criptografia de "
+        "senhas aguenta, pelo mesmo caminho da view de login."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--config",
+            action="append",
+            help=(
+                "Algoritmo e custo, como bcrypt:12 ou pbkdf2:600000. Pode ser "
+                "repetido. Sem custo, usa o das settings."
+            ),
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="Logins medidos por configuração."
+        )
+        parser.add_argument(
+            "--cores",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Núcleos usados na estimativa de capacidade.",
+        )
+        parser.add_argument(
+            "--peak",
+            type=float,
+            help="Logins por segundo esperados no pico, para estimar os núcleos.",
+        )
+        parser.add_argument("--output", help="Grava o resultado neste arquivo JSON.")
+
+    def handle(self, *args, **options):
+        from apps.workout.models import User
+
+        configs = [parse_config(c) for c in options["config"] or DEFAULT_CONFIGS]
+        password = "senha-de-medicao"
+        results = []
+        for name, cost in configs:
+            # Um usuário por configuração, com a senha gravada por ela
+            with override_settings(
+                PASSWORD_HASHERS=[settings.PASSWORD_HASHER_CLASSES[name]],
+                **{COST_SETTINGS[name]: cost},
+            ):
+                user = User.objects.create_user(
+                    f"login{uuid.uuid4().hex[:8]}",
+                    f"{uuid.uuid4().hex}@example.com",
+                    password,
+                )
+                try:
+                    timings = []
+                    for _ in range(options["repeat"]):
+                        started = time.perf_counter()
+                        result = User.objects.login(
+                            username=[user.username], password=[password]
+                        )
+                        timings.append(time.perf_counter() - started)
+                        if "logged_in_user" not in result:
+                            raise CommandError(f"Login falhou com {name}:{cost}.")
+                finally:
+                    user.delete()
+
+            per_core = 1 / float(np.mean(timings))
+            result = {
+                "hasher": name,
+                "cost": cost,
+                "p50_ms": percentile(timings, 50),
+                "p95_ms": percentile(timings, 95),
+                "logins_per_second_per_core": round(per_core, 2),
+                "logins_per_second": round(per_core * options["cores"], 2),
+            }
+            if options["peak"]:
+                result["cores_needed"] = math.ceil(options["peak"] / per_core)
+            results.append(result)
+
+            line = (
+                f"{name + ':' + str(cost):<18} p50 {result['p50_ms']:>8.2f} ms  "
+                f"p95 {result['p95_ms']:>8.2f} ms  "
+                f"{result['logins_per_second_per_core']:>7.2f} login(s)/s por núcleo  "
+                f"{result['logins_per_second']:>8.2f} login(s)/s em "
+                f"{options['cores']} núcleo(s)"
+            )
+            if options["peak"]:
+                line += f"  {result['cores_needed']} núcleo(s) para o pico"
+            self.stdout.write(line)
+
+        report = {
+            "revision": git_revision(),
+            "database": connection.vendor,
+            "repeat": options["repeat"],
+            "cores": options["cores"],
+            "peak": options["peak"],
+            "results": results,
+        }
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f"Resultado gravado em {options['output']}.")
@@ -0,0 +1,233 @@
+import json
+import subprocess
+import time
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+
+class QueryCounter:
+    """execute_wrapper que conta as consultas da requisição."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def request_plan(user):
+    """Como chamar cada view de urls.py: {nome: (método, args, dados)}.
+
+    Views ausentes do plano são chamadas com GET e sem argumentos.
+    """
+    from apps.workout.models import ImportJob, WorkoutHistory, WorkoutSession
+
+    workout = user.workout_set.order_by("order_id", "id").first()
+    session = WorkoutSession.objects.filter(user=user, completed=False).first()
+    exercise_session = session.exercise_sessions.order_by("id").first()
+    history = WorkoutHistory.objects.filter(user=user).order_by("-date").first()
+    job = ImportJob.objects.enqueue(user, ImportJob.KIND_IMPORT)
+    sets = [
+        {
+            "exercise_session": exercise_session.id,
+            "set_number": n,
+            "weight": 60,
+            "repetitions": 8,
+        }
+        for n in range(1, exercise_session.sets + 1)
+    ]
+    json_body = {"content_type": "application/json"}
+    return {
+        "view_workout": ("get", [workout.id], {}),
+        "add_exercise": (
+            "post",
+            [workout.id],
+            {"data": {"name": "Supino", "repetitions": 10, "rpe": 8, "sets": 3}},
+        ),
+        "complete_workout": ("post", [workout.id], {}),
+        "edit_workout": ("get", [workout.id], {}),
+        "delete_workout": ("post", None, {}),  # Um treino descartável por chamada
+        "view_session": ("get", [session.id], {}),
+        "save_session_series": (
+            "post",
+            [session.id],
+            {"data": {"sets": sets}, **json_body},
+        ),
+        "save_series": (
+            "patch",
+            [exercise_session.id, 1],
+            {"data": {"weight": 62.5, "repetitions": 8}, **json_body},
+        ),
+        "start_workout_session": ("post", [workout.id], {}),
+        "view_history_session": ("get", [history.workout_session_id], {}),
+        "job_status": ("get", [job.id], {}),
+        "export_history": ("get", ["csv"], {}),
+        "sync_upload": ("post", [], {"data": {"sets": sets}, **json_body}),
+    }
+
+
+def percentile(timings, q):
+    return round(float(np.percentile(timings, q)) * 1000, 2)
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede a latência (p50/p95) e o número de consultas de cada URL de "
+        "apps/workout/urls.py sobre uma base sintética, com saída em JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="Requisições medidas por URL."
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=2, help="Requisições descartadas por URL."
+        )
+        parser.add_argument("--workouts", type=int, default=20)
+        parser.add_argument("--exercises", type=int, default=5)
+        parser.add_argument("--sessions", type=int, default=1000)
+        parser.add_argument("--sets", type=int, default=4)
+        parser.add_argument(
+            "--cold",
+            action="store_true",
+            help="Limpa o cache antes de cada requisição.",
+        )
+        parser.add_argument("--output", help="Grava o resultado neste arquivo JSON.")
+        parser.add_argument(
+            "--compare", help="Arquivo JSON de uma execução anterior para comparar."
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.5,
+            help="Aumento relativo do p95 tolerado na comparação (0.5 = 50%%).",
+        )
+
+    def handle(self, *args, **options):
+        from apps.workout import seeding, urls
+        from apps.workout.models import Workout
+
+        dataset = {
+            key: options[key] for key in ("workouts", "exercises", "sessions", "sets")
+        }
+        # Usuário próprio da medição, removido no final
+        (user,) = seeding.seed(users=1, **dataset)
+        try:
+            plan = request_plan(user)
+            host = settings.ALLOWED_HOSTS[0].lstrip(".").replace("*", "localhost")
+            client = Client(SERVER_NAME=host or "localhost")
+            client.force_login(user)
+
+            results = {}
+            for pattern in urls.urlpatterns:
+                method, url_args, data = plan.get(pattern.name, ("get", [], {}))
+                timings, queries, status = [], [], None
+                for i in range(options["warmup"] + options["repeat"]):
+                    if url_args is None:
+                        disposable = Workout.objects.create(
+                            name="Descartável", description="Treino", user=user
+                        )
+                        url = reverse(pattern.name, args=[disposable.id])
+                    else:
+                        url = reverse(pattern.name, args=url_args)
+                    if options["cold"]:
+                        cache.clear()
+
+                    counter = QueryCounter()
+                    with connection.execute_wrapper(counter):
+                        started = time.perf_counter()
+                        response = getattr(client, method)(url, **data)
+                        if response.streaming:
+                            # O trabalho das respostas em streaming é feito aqui
+                            b"".join(response.streaming_content)
+                        elapsed = time.perf_counter() - started
+                    if pattern.name == "logout":
+                        client.force_login(user)
+                    if i >= options["warmup"]:
+                        timings.append(elapsed)
+                        queries.append(counter.count)
+                        status = response.status_code
+
+                results[pattern.name] = {
+                    "method": method.upper(),
+                    "status": status,
+                    "p50_ms": percentile(timings, 50),
+                    "p95_ms": percentile(timings, 95),
+                    "queries": max(queries),
+                }
+                self.stdout.write(
+                    f"{pattern.name:<26} {method.upper():<6} {status} "
+                    f"p50 {results[pattern.name]['p50_ms']:>8.2f} ms  "
+                    f"p95 {results[pattern.name]['p95_ms']:>8.2f} ms  "
+                    f"{max(queries):>3} consulta(s)"
+                )
+        finally:
+            user.delete()
+
+        report = {
+            "revision": git_revision(),
+            "debug": settings.DEBUG,
+            "database": connection.vendor,
+            "cold_cache": options["cold"],
+            "repeat": options["repeat"],
+            "dataset": dataset,
+            "results": results,
+        }
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f"Resultado gravado em {options['output']}.")
+
+        if options["compare"]:
+            self.compare(report, options["compare"], options["tolerance"])
+
+    def compare(self, report, path, tolerance):
+        """Falha se alguma URL passou a fazer mais consultas ou ficou mais
+        lenta que o tolerado em relação à execução anterior."""
+        try:
+            with open(path) as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Não foi possível ler '{path}': {e}")
+
+        regressions = []
+        for name, current in report["results"].items():
+            previous = baseline.get("results", {}).get(name)
+            if previous is None:
+                continue
+            if current["queries"] > previous["queries"]:
+                regressions.append(
+                    f"{name}: {previous['queries']} -> {current['queries']} consultas"
+                )
+            if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: p95 {previous['p95_ms']:.2f} -> "
+                    f"{current['p95_ms']:.2f} ms"
+                )
+
+        revision = baseline.get("revision") or path
+        if regressions:
+            raise CommandError(
+                f"Regressões em relação a {revision}:\n" + "\n".join(regressions)
+            )
+        self.stdout.write(f"Sem regressões em relação a {revision}.")
@@ -0,0 +1,79 @@
+import os
+
+from django.contrib.staticfiles import finders
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+# Imagens de fundo e as larguras (em pixels) das variantes WebP de cada uma.
+# As variantes ficam ao lado do original (bg.jpg -> bg-640.webp) e são
+# escolhidas por media queries em style.red.css.
+RESPONSIVE_IMAGES = {
+    "workout/images/bg.jpg": (640, 1280, 1920),
+}
+WEBP_QUALITY = 80
+
+
+def webp_variants(source, widths, quality=WEBP_QUALITY, force=False):
+    """Gera as variantes WebP de source que estão ausentes ou desatualizadas.
+
+    Retorna a lista de (caminho, bytes) das variantes geradas.
+    """
+    from PIL import Image
+
+    base = os.path.splitext(source)[0]
+    generated = []
+    with Image.open(source) as image:
+        image = image.convert("RGB")
+        for width in widths:
+            target = f"{base}-{width}.webp"
+            if (
+                not force
+                and os.path.exists(target)
+                and os.path.getmtime(target) >= os.path.getmtime(source)
+            ):
+                continue
+            width = min(width, image.width)  # Nunca amplia a imagem
+            height = round(image.height * width / image.width)
+            image.resize((width, height), Image.LANCZOS).save(
+                target, "WEBP", quality=quality, method=6
+            )
+            generated.append((target, os.path.getsize(target)))
+    return generated
+
+
+class Command(BaseCommand):
+    help = (
+        "Gera as variantes WebP das imagens de fundo e roda o collectstatic "
+        "(nomes com hash e cópias .gz/.br, no perfil de produção)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force", action="store_true", help="Regera as variantes WebP."
+        )
+        parser.add_argument(
+            "--no-collect",
+            action="store_true",
+            help="Apenas gera as variantes, sem rodar o collectstatic.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise CommandError("Instale o Pillow para gerar as variantes WebP.")
+
+        for path, widths in RESPONSIVE_IMAGES.items():
+            source = finders.find(path)
+            if source is None:
+                raise CommandError(f"Imagem '{path}' não encontrada.")
+            for target, size in webp_variants(source, widths, force=options["force"]):
+                self.stdout.write(f"{os.path.basename(target)}: {size // 1024} KB")
+
+        if not options["no_collect"]:
+            call_command(
+                "collectstatic",
+                interactive=False,
+                verbosity=options["verbosity"],
+                stdout=self.stdout,
+            )
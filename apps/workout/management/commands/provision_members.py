@@ -0,0 +1,36 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Cadastra membros em lote a partir de uma planilha (.csv ou .xlsx) com "
+        "as colunas username, email e password."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("arquivo", help="Caminho da planilha de membros.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Processos usados para criptografar as senhas.",
+        )
+
+    def handle(self, *args, **options):
+        from apps.workout.provisioning import provision_members
+
+        try:
+            arquivo = open(options["arquivo"], "rb")
+        except OSError as e:
+            raise CommandError(f"Não foi possível abrir a planilha: {e}")
+        with arquivo:
+            result = provision_members(arquivo, workers=options["workers"])
+
+        if "errors" in result:
+            raise CommandError("\n".join(result["errors"]))
+        report = result["report"]
+        self.stdout.write(
+            f"{report['created']} membro(s) cadastrado(s) em {report['elapsed']}s."
+        )
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Recalcula as estatísticas de exercícios (volume, tonelagem e 1RM estimado)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="E-mail do usuário. Sem esta opção, recalcula para todos.",
+        )
+
+    def handle(self, *args, **options):
+        from apps.workout.models import ExerciseStat, User
+
+        user = None
+        if options["user"]:
+            try:
+                user = User.objects.get(email=options["user"])
+            except User.DoesNotExist:
+                raise CommandError(f"Usuário '{options['user']}' não encontrado.")
+
+        created = ExerciseStat.objects.rebuild(user)
+        self.stdout.write(f"{created} estatística(s) recalculada(s).")
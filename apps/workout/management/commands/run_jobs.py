@@ -0,0 +1,186 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import timedelta
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+# Este módulo também é importado pelos processos do pool antes do
+# django.setup(), por isso os models só são importados dentro dos métodos.
+
+logger = logging.getLogger(__name__)
+
+# Segundos entre os heartbeats dos jobs em execução
+HEARTBEAT_INTERVAL = 30
+
+
+def _init_worker():
+    # Os processos do pool são criados com "spawn": cada um inicia o Django
+    # do zero e abre suas próprias conexões com o banco.
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "workout_tracker.settings")
+    django.setup()
+
+
+class Heartbeat(threading.Thread):
+    """Renova periodicamente o heartbeat dos jobs que este worker executa.
+
+    Roda em uma thread para continuar mesmo enquanto um job demorado executa
+    no próprio processo (--workers 0). Um job sem heartbeat recente é de um
+    worker encerrado e pode ser marcado como falho (fail_stale).
+    """
+
+    def __init__(self, interval=HEARTBEAT_INTERVAL):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.job_ids = set()
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+
+    def add(self, job_id):
+        with self.lock:
+            self.job_ids.add(job_id)
+
+    def discard(self, job_id):
+        with self.lock:
+            self.job_ids.discard(job_id)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+    def run(self):
+        from apps.workout.models import ImportJob
+
+        try:
+            while not self.stopped.wait(self.interval):
+                with self.lock:
+                    job_ids = list(self.job_ids)
+                if not job_ids:
+                    continue
+                try:
+                    ImportJob.objects.heartbeat(job_ids)
+                except Exception:  # Tenta de novo no próximo intervalo
+                    logger.exception("Falha ao renovar o heartbeat dos jobs")
+        finally:
+            connection.close()  # A conexão é desta thread
+
+
+class Command(BaseCommand):
+    help = "Executa os jobs pendentes (importações e registros de histórico)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Número de processos do pool. Use 0 para executar no próprio processo.",
+        )
+        parser.add_argument(
+            "--poll",
+            type=float,
+            default=1.0,
+            help="Intervalo, em segundos, entre consultas por novos jobs.",
+        )
+        parser.add_argument(
+            "--stale-after",
+            type=float,
+            default=300,
+            help=(
+                "Ao iniciar, marca como falhos os jobs em execução sem heartbeat "
+                "há mais que estes segundos (deixados por um worker encerrado)."
+            ),
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Processa os jobs pendentes e encerra.",
+        )
+
+    def handle(self, *args, **options):
+        from apps.workout.models import ImportJob
+
+        if options["stale_after"] <= HEARTBEAT_INTERVAL:
+            raise CommandError(
+                f"--stale-after deve ser maior que o intervalo do heartbeat "
+                f"({HEARTBEAT_INTERVAL} s)."
+            )
+        stale = ImportJob.objects.fail_stale(timedelta(seconds=options["stale_after"]))
+        if stale:
+            self.stdout.write(
+                f"{stale} job(s) interrompido(s) marcado(s) como falho(s)."
+            )
+
+        heartbeat = Heartbeat()
+        heartbeat.start()
+        try:
+            if options["workers"] <= 0:
+                self.run_inline(options, heartbeat)
+            else:
+                self.run_pool(options, heartbeat)
+        finally:
+            heartbeat.stop()
+
+    def run_inline(self, options, heartbeat):
+        from apps.workout.jobs import run_job
+        from apps.workout.models import ImportJob
+
+        while True:
+            claimed = ImportJob.objects.claim(1)
+            for job_id in claimed:
+                heartbeat.add(job_id)
+                try:
+                    status = run_job(job_id)
+                finally:
+                    heartbeat.discard(job_id)
+                self.stdout.write(f"Job {job_id}: {status}")
+            if not claimed:
+                if options["once"]:
+                    return
+                time.sleep(options["poll"])
+
+    def run_pool(self, options, heartbeat):
+        from apps.workout.jobs import run_job
+        from apps.workout.models import ImportJob
+
+        workers = options["workers"]
+        running = {}  # future -> id do job
+
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        with pool:
+            while True:
+                for job_id in ImportJob.objects.claim(workers - len(running)):
+                    heartbeat.add(job_id)
+                    running[pool.submit(run_job, job_id)] = job_id
+
+                if not running:
+                    if options["once"]:
+                        return
+                    time.sleep(options["poll"])
+                    continue
+
+                done, _ = wait(
+                    running, timeout=options["poll"], return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    job_id = running.pop(future)
+                    heartbeat.discard(job_id)
+                    try:
+                        status = future.result()
+                    except Exception as e:  # O processo do pool morreu
+                        ImportJob.objects.filter(id=job_id).update(
+                            status=ImportJob.STATUS_FAILED,
+                            result={"errors": [f"Erro inesperado: {e}"]},
+                            finished_at=timezone.now(),
+                        )
+                        status = ImportJob.STATUS_FAILED
+                    self.stdout.write(f"Job {job_id}: {status}")
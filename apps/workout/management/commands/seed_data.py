@@ -0,0 +1,58 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Gera usuários sintéticos com treinos, exercícios, sessões e "
+        "históricos, gravados com inserções em lote."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10, help="Usuários.")
+        parser.add_argument(
+            "--workouts", type=int, default=20, help="Treinos por usuário."
+        )
+        parser.add_argument(
+            "--exercises", type=int, default=5, help="Exercícios por treino."
+        )
+        parser.add_argument(
+            "--sessions", type=int, default=1000, help="Sessões por usuário."
+        )
+        parser.add_argument("--sets", type=int, default=4, help="Séries por exercício.")
+        parser.add_argument(
+            "--password", default="password", help="Senha de todos os usuários."
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Semente dos valores aleatórios."
+        )
+        parser.add_argument(
+            "--no-stats",
+            action="store_true",
+            help="Não recalcula as estatísticas de exercícios.",
+        )
+
+    def handle(self, *args, **options):
+        from apps.workout import seeding
+
+        started = time.perf_counter()
+        users = seeding.seed(
+            users=options["users"],
+            password=options["password"],
+            stats=not options["no_stats"],
+            seed=options["seed"],
+            workouts=options["workouts"],
+            exercises=options["exercises"],
+            sessions=options["sessions"],
+            sets=options["sets"],
+        )
+        elapsed = time.perf_counter() - started
+
+        sets = options["sessions"] * options["exercises"] * options["sets"] * len(users)
+        self.stdout.write(
+            f"{len(users)} usuário(s), {options['sessions'] * len(users)} sessão(ões) "
+            f"e {sets} série(s) criados em {elapsed:.2f}s."
+        )
+        for user in users[:5]:
+            self.stdout.write(f"  {user.email}")
@@ -0,0 +1,131 @@
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections
+
+from .run_jobs import _init_worker
+
+
+def _writer(user_id, workout_id, session_id, writes, start_at):
+    """Executado em um processo do pool: alterna autosave de séries e
+    registro de histórico, as duas escritas mais frequentes do app."""
+    from apps.workout.models import (
+        ExerciseSession,
+        Series,
+        User,
+        Workout,
+        WorkoutHistory,
+        WorkoutSession,
+    )
+
+    user = User.objects.get(id=user_id)
+    workout = Workout.objects.get(id=workout_id)
+    session = WorkoutSession.objects.get(id=session_id)
+    exercise_sessions = list(
+        ExerciseSession.objects.filter(workout_session=session).values_list(
+            "id", "exercise_id", "sets"
+        )
+    )
+
+    time.sleep(max(0, start_at - time.time()))  # Todos começam juntos
+    errors = []
+    for i in range(writes):
+        try:
+            if i % 2:
+                values = {}
+                for _, exercise_id, sets in exercise_sessions:
+                    for n in range(1, sets + 1):
+                        values[f"weight_{exercise_id}_{n}"] = str(40 + i)
+                        values[f"repetitions_{exercise_id}_{n}"] = "10"
+                WorkoutHistory.objects.record(user, workout, values, session)
+            else:
+                Series.objects.save_sets(
+                    session,
+                    [
+                        {
+                            "exercise_session": es_id,
+                            "set_number": n,
+                            "weight": 40 + i,
+                            "repetitions": 10,
+                        }
+                        for es_id, _, sets in exercise_sessions
+                        for n in range(1, sets + 1)
+                    ],
+                )
+        except OperationalError as e:
+            errors.append(str(e))
+    return errors
+
+
+class Command(BaseCommand):
+    help = (
+        "Teste de carga de escritas concorrentes: vários processos gravando no "
+        "mesmo banco ao mesmo tempo. Falha se houver erros de banco bloqueado."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--writers", type=int, default=8, help="Número de processos escritores."
+        )
+        parser.add_argument(
+            "--writes", type=int, default=50, help="Escritas por processo."
+        )
+
+    def handle(self, *args, **options):
+        from apps.workout.models import Exercise, User, Workout, WorkoutSession
+
+        writers, writes = options["writers"], options["writes"]
+
+        # Dados próprios do teste, removidos no final
+        tag = uuid.uuid4().hex[:8]
+        user = User.objects.create_user(
+            username=f"stress-{tag}", email=f"stress-{tag}@example.com"
+        )
+        try:
+            workout = Workout.objects.create(
+                name="Carga", description="Teste de carga", user=user
+            )
+            for i in range(3):
+                Exercise.objects.create(
+                    name=f"Exercício {i}",
+                    sets=4,
+                    repetitions=10,
+                    rpe=8,
+                    workout=workout,
+                )
+            sessions = []
+            for _ in range(writers):
+                session = WorkoutSession.objects.create(user=user, workout=workout)
+                session.create_exercise_sessions()
+                sessions.append(session.id)
+            connections.close_all()  # Os processos abrem suas próprias conexões
+
+            started = time.perf_counter()
+            pool = ProcessPoolExecutor(
+                max_workers=writers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            with pool:
+                start_at = time.time() + 2  # Tempo para os processos iniciarem
+                futures = [
+                    pool.submit(
+                        _writer, user.id, workout.id, session_id, writes, start_at
+                    )
+                    for session_id in sessions
+                ]
+                errors = [error for future in futures for error in future.result()]
+            elapsed = time.perf_counter() - started - 2
+        finally:
+            user.delete()
+
+        total = writers * writes
+        self.stdout.write(
+            f"{writers} processo(s), {total} escrita(s) em {elapsed:.2f}s "
+            f"({total / elapsed:.0f}/s), {len(errors)} erro(s)."
+        )
+        if errors:
+            raise CommandError(f"Erros de escrita concorrente: {sorted(set(errors))}")
@@ -0,0 +1,206 @@
+# apps/workout/metrics.py
+import bisect
+import contextvars
+import json
+import logging
+import math
+import threading
+import time
+from collections import defaultdict, deque
+
+# Limites (em segundos) dos buckets do histograma de duração
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# Janela móvel: últimas requisições de cada view usadas nos quantis
+ROLLING_SAMPLES = 1024
+QUANTILES = (0.5, 0.95, 0.99)
+# Requisições mais lentas que isso são registradas como aviso
+SLOW_REQUEST_SECONDS = 1.0
+
+# Medidas da requisição em andamento (uma por thread ou tarefa assíncrona)
+_current = contextvars.ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """Medidas de uma requisição, preenchidas enquanto ela é processada.
+
+    Também é o execute_wrapper que conta as consultas e seu tempo.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - started
+
+    def activate(self):
+        return _current.set(self)
+
+    @staticmethod
+    def deactivate(token):
+        _current.reset(token)
+
+
+def add_template_time(seconds):
+    """Soma o tempo de renderização à requisição em andamento, se houver."""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.template_time += seconds
+
+
+class _ViewStats:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.buckets = [0] * (len(DURATION_BUCKETS) + 1)  # O último é o +Inf
+        self.recent = deque(maxlen=ROLLING_SAMPLES)
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.response_bytes = 0
+
+
+def _labels(**labels):
+    escaped = (
+        (
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _quantile(ordered, q):
+    # Posição mais próxima (nearest-rank)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class Registry:
+    """Métricas das requisições deste processo, no formato do Prometheus.
+
+    Cada processo do servidor tem o seu registro; o Prometheus soma os
+    processos ao coletar cada um.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.views = defaultdict(_ViewStats)  # (view, método) -> medidas
+            self.responses = defaultdict(int)  # (view, método, status) -> total
+
+    def observe(self, view, method, status, duration, metrics, response_bytes):
+        with self.lock:
+            stats = self.views[view, method]
+            stats.count += 1
+            stats.duration += duration
+            stats.buckets[bisect.bisect_left(DURATION_BUCKETS, duration)] += 1
+            stats.recent.append(duration)
+            stats.queries += metrics.queries
+            stats.db_time += metrics.db_time
+            stats.template_time += metrics.template_time
+            stats.response_bytes += response_bytes
+            self.responses[view, method, status] += 1
+
+    def render(self):
+        with self.lock:
+            views = sorted(self.views.items())
+            responses = sorted(self.responses.items())
+            recent = {key: sorted(stats.recent) for key, stats in views}
+
+        lines = [
+            "# HELP workout_http_requests_total Requisições atendidas.",
+            "# TYPE workout_http_requests_total counter",
+        ]
+        for (view, method, status), total in responses:
+            labels = _labels(view=view, method=method, status=status)
+            lines.append(f"workout_http_requests_total{labels} {total}")
+
+        lines += [
+            "# HELP workout_http_request_duration_seconds Duração das requisições.",
+            "# TYPE workout_http_request_duration_seconds histogram",
+        ]
+        for (view, method), stats in views:
+            cumulative = 0
+            for bound, count in zip(DURATION_BUCKETS + ("+Inf",), stats.buckets):
+                cumulative += count
+                labels = _labels(view=view, method=method, le=bound)
+                lines.append(
+                    f"workout_http_request_duration_seconds_bucket{labels} {cumulative}"
+                )
+            labels = _labels(view=view, method=method)
+            lines.append(
+                f"workout_http_request_duration_seconds_sum{labels} {stats.duration}"
+            )
+            lines.append(
+                f"workout_http_request_duration_seconds_count{labels} {stats.count}"
+            )
+
+        lines += [
+            "# HELP workout_http_request_recent_seconds Duração das últimas "
+            f"{ROLLING_SAMPLES} requisições de cada view.",
+            "# TYPE workout_http_request_recent_seconds summary",
+        ]
+        for (view, method), stats in views:
+            ordered = recent[view, method]
+            for q in QUANTILES:
+                labels = _labels(view=view, method=method, quantile=q)
+                lines.append(
+                    f"workout_http_request_recent_seconds{labels} {_quantile(ordered, q)}"
+                )
+            labels = _labels(view=view, method=method)
+            lines.append(
+                f"workout_http_request_recent_seconds_sum{labels} {sum(ordered)}"
+            )
+            lines.append(
+                f"workout_http_request_recent_seconds_count{labels} {len(ordered)}"
+            )
+
+        for name, attribute, description in (
+            ("db_queries_total", "queries", "Consultas ao banco."),
+            ("db_seconds_total", "db_time", "Tempo gasto em consultas ao banco."),
+            (
+                "template_seconds_total",
+                "template_time",
+                "Tempo gasto renderizando templates.",
+            ),
+            ("response_bytes_total", "response_bytes", "Bytes enviados nas respostas."),
+        ):
+            lines += [
+                f"# HELP workout_http_request_{name} {description}",
+                f"# TYPE workout_http_request_{name} counter",
+            ]
+            for (view, method), stats in views:
+                labels = _labels(view=view, method=method)
+                lines.append(
+                    f"workout_http_request_{name}{labels} {getattr(stats, attribute)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+class JsonFormatter(logging.Formatter):
+    """Formata cada registro como uma linha JSON, com os campos de extra["request"]."""
+
+    def format(self, record):
+        data = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **getattr(record, "request", {}),
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
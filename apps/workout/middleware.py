@@ -0,0 +1,72 @@
+# apps/workout/middleware.py
+import logging
+import time
+from contextlib import nullcontext
+
+from django.conf import settings
+from django.db import connection
+
+from .metrics import SLOW_REQUEST_SECONDS, RequestMetrics, registry
+from .querywatch import QueryWatcher
+
+logger = logging.getLogger(__name__)
+
+
+class PerformanceMiddleware:
+    """Mede cada requisição: duração, consultas ao banco e seu tempo, tempo
+    de renderização dos templates e tamanho da resposta.
+
+    As medidas vão para o log (uma linha JSON por requisição) e para o
+    registro exposto em /metrics. Com QUERY_WATCH, as consultas lentas e
+    repetidas também são apontadas (ver querywatch.py). Deve ser o primeiro
+    middleware, para incluir as consultas da sessão e da autenticação.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        watcher = QueryWatcher() if settings.QUERY_WATCH else None
+        token = metrics.activate()
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(metrics), (
+                connection.execute_wrapper(watcher) if watcher else nullcontext()
+            ):
+                response = self.get_response(request)
+        finally:
+            metrics.deactivate(token)
+        duration = time.perf_counter() - started
+
+        match = request.resolver_match
+        view = match.url_name if match and match.url_name else "unresolved"
+        # O tamanho de respostas em streaming não é conhecido de antemão
+        size = 0 if response.streaming else len(response.content)
+        registry.observe(
+            view, request.method, response.status_code, duration, metrics, size
+        )
+        if watcher:
+            watcher.report(view, connection)
+        logger.log(
+            logging.WARNING if duration >= SLOW_REQUEST_SECONDS else logging.INFO,
+            "%s %s %s %.1fms",
+            request.method,
+            request.path,
+            response.status_code,
+            duration * 1000,
+            extra={
+                "request": {
+                    "view": view,
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "duration_ms": round(duration * 1000, 2),
+                    "db_queries": metrics.queries,
+                    "db_ms": round(metrics.db_time * 1000, 2),
+                    "template_ms": round(metrics.template_time * 1000, 2),
+                    "response_bytes": size,
+                }
+            },
+        )
+        return response
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:13
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def remove_duplicate_exercise_sessions(apps, schema_editor):
+    # Mantém a ExerciseSession mais antiga de cada (workout_session, exercise)
+    ExerciseSession = apps.get_model("workout", "ExerciseSession")
+    keep = (
+        ExerciseSession.objects.values("workout_session", "exercise")
+        .annotate(keep_id=Min("id"))
+        .values_list("keep_id", flat=True)
+    )
+    ExerciseSession.objects.exclude(id__in=list(keep)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0002_importjob"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_exercise_sessions, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="exercisesession",
+            constraint=models.UniqueConstraint(
+                fields=("workout_session", "exercise"),
+                name="unique_exercise_per_session",
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:14
+
+from django.db import migrations, models
+
+
+def number_existing_sets(apps, schema_editor):
+    # Numera as séries já gravadas na ordem em que foram inseridas
+    ExerciseHistory = apps.get_model("workout", "ExerciseHistory")
+    rows = ExerciseHistory.objects.order_by(
+        "workout_history_id", "exercise_id", "id"
+    ).only("id", "workout_history_id", "exercise_id")
+
+    changed = []
+    previous, number = None, 0
+    for row in rows.iterator(chunk_size=2000):
+        key = (row.workout_history_id, row.exercise_id)
+        number = number + 1 if key == previous else 1
+        previous = key
+        if number != 1:
+            row.set_number = number
+            changed.append(row)
+        if len(changed) >= 2000:
+            ExerciseHistory.objects.bulk_update(changed, ["set_number"])
+            changed = []
+    ExerciseHistory.objects.bulk_update(changed, ["set_number"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0003_exercisesession_unique"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exercisehistory",
+            name="set_number",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.RunPython(number_existing_sets, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="exercisehistory",
+            index=models.Index(
+                fields=["workout_history", "exercise", "set_number"],
+                name="exhistory_wh_ex_set_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:15
+
+import django.db.models.deletion
+from datetime import timedelta
+
+from django.db import migrations, models
+
+
+def link_histories_to_sessions(apps, schema_editor):
+    # Os históricos antigos não guardavam a sessão; complete_workout criava a
+    # WorkoutSession concluída e o WorkoutHistory no mesmo instante, então
+    # associamos cada histórico à sessão concluída mais próxima no tempo.
+    WorkoutHistory = apps.get_model("workout", "WorkoutHistory")
+    WorkoutSession = apps.get_model("workout", "WorkoutSession")
+    window = timedelta(minutes=1)
+
+    for history in WorkoutHistory.objects.filter(workout_session__isnull=True):
+        candidates = WorkoutSession.objects.filter(
+            user_id=history.user_id,
+            workout_id=history.workout_id,
+            completed=True,
+            date__range=(history.date - window, history.date + window),
+        )
+        closest = min(
+            candidates, key=lambda s: abs(s.date - history.date), default=None
+        )
+        if closest is not None:
+            history.workout_session = closest
+            history.save(update_fields=["workout_session"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0004_exercisehistory_set_number"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="workouthistory",
+            name="workout_session",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="workout_histories",
+                to="workout.workoutsession",
+            ),
+        ),
+        migrations.RunPython(link_histories_to_sessions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="workouthistory",
+            index=models.Index(
+                fields=["user", "date"], name="workouthistory_user_date_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:17
+
+from django.db import migrations, models
+
+
+def number_existing_series(apps, schema_editor):
+    # Numera as séries já gravadas na ordem em que foram inseridas
+    Series = apps.get_model("workout", "Series")
+    rows = Series.objects.order_by("exercise_session_id", "id").only(
+        "id", "exercise_session_id"
+    )
+
+    changed = []
+    previous, number = None, 0
+    for row in rows.iterator(chunk_size=2000):
+        number = number + 1 if row.exercise_session_id == previous else 1
+        previous = row.exercise_session_id
+        if number != 1:
+            row.set_number = number
+            changed.append(row)
+        if len(changed) >= 2000:
+            Series.objects.bulk_update(changed, ["set_number"])
+            changed = []
+    Series.objects.bulk_update(changed, ["set_number"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0005_workouthistory_workout_session"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="series",
+            name="set_number",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.RunPython(number_existing_series, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="series",
+            constraint=models.UniqueConstraint(
+                fields=("exercise_session", "set_number"),
+                name="unique_set_per_exercise_session",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0006_series_set_number"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="series",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0007_series_version"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="workoutsession",
+            index=models.Index(
+                fields=["user", "date"], name="workoutsession_user_date_idx"
+            ),
+        ),
+    ]
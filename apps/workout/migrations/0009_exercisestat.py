@@ -0,0 +1,84 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0008_workoutsession_user_date"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExerciseStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "period",
+                    models.CharField(
+                        choices=[("day", "Dia"), ("week", "Semana")], max_length=4
+                    ),
+                ),
+                ("period_start", models.DateField()),
+                ("sets", models.PositiveIntegerField(default=0)),
+                ("repetitions", models.PositiveIntegerField(default=0)),
+                (
+                    "tonnage",
+                    models.DecimalField(decimal_places=1, default=0, max_digits=12),
+                ),
+                (
+                    "best_weight",
+                    models.DecimalField(decimal_places=1, default=0, max_digits=5),
+                ),
+                ("best_repetitions", models.PositiveIntegerField(default=0)),
+                (
+                    "e1rm_epley",
+                    models.DecimalField(decimal_places=1, default=0, max_digits=8),
+                ),
+                (
+                    "e1rm_brzycki",
+                    models.DecimalField(decimal_places=1, default=0, max_digits=8),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "exercise",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="workout.exercise",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["user", "period", "period_start"],
+                        name="exercisestat_user_period_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "exercise", "period", "period_start"),
+                        name="unique_exercise_stat_period",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0009_exercisestat"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="workout",
+            index=models.Index(
+                fields=["user", "order_id", "id"], name="workout_user_order_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workoutsession",
+            index=models.Index(
+                fields=["user", "completed", "date", "id"],
+                name="workoutsession_history_idx",
+            ),
+        ),
+    ]
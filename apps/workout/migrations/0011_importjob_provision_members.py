@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0010_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="importjob",
+            name="kind",
+            field=models.CharField(
+                choices=[
+                    ("import", "Importação de treinos"),
+                    ("complete_workout", "Registro de histórico"),
+                    ("provision_members", "Cadastro de membros"),
+                ],
+                max_length=20,
+            ),
+        ),
+    ]
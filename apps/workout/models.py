@@ -1,12 +1,67 @@
 # models.py
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
     PermissionsMixin,
 )
+from .caching import bump_cache_generation
+from .db import write_transaction
+
 import re
 import json
+import logging
+from datetime import timedelta
+from decimal import Decimal, InvalidOperation
+
+logger = logging.getLogger(__name__)
+
+
+# Compiladas uma vez, e não a cada cadastro
+USERNAME_REGEX = re.compile(r"^[a-zA-Z0-9!@#$%^&*()?]*$")
+EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9\.\+_-]+@[a-zA-Z0-9\._-]+\.[a-zA-Z]*$")
+
+
+def registration_errors(
+    username, email, password, confirmation, username_taken, email_taken
+):
+    """Valida os dados de cadastro de um usuário, sem consultar o banco.
+
+    username_taken e email_taken dizem se os valores já estão em uso; quem
+    chama decide como consultá-los (um a um no cadastro, em lote na
+    importação de membros).
+    """
+    errors = []
+
+    # Validate username
+    if len(username) < 2:
+        errors.append("Username is required and must be at least 2 characters long.")
+    elif len(username) > 20:
+        errors.append("Username must be at most 20 characters long.")
+    if not USERNAME_REGEX.match(username):
+        errors.append(
+            "Username must contain letters, numbers, and basic characters only."
+        )
+    if username_taken:
+        errors.append("Username is already registered to another user.")
+
+    # Validate email
+    if len(email) < 5:
+        errors.append("Email field must be at least 5 characters.")
+    elif len(email) > 50:
+        errors.append("Email must be at most 50 characters long.")
+    if not EMAIL_REGEX.match(email):
+        errors.append("Email is not a valid email format.")
+    elif email_taken:
+        errors.append("Email address is already registered to another user.")
+
+    # Validate password
+    if len(password) < 8 or password != confirmation:
+        errors.append(
+            "Password fields are required and must match and be at least 8 characters."
+        )
+    return errors
 
 
 class UserManager(BaseUserManager):
@@ -33,40 +88,23 @@ class UserManager(BaseUserManager):
         return self.create_user(username, email, password, **extra_fields)
 
     def register(self, **kwargs):
-        errors = []
-
-        # Validate username
-        if len(kwargs["username"][0]) < 2:
-            errors.append(
-                "Username is required and must be at least 2 characters long."
-            )
+        username = kwargs["username"][0]
+        email = kwargs["email"][0]
 
-        USERNAME_REGEX = re.compile(r"^[a-zA-Z0-9!@#$%^&*()?]*$")
-        if not USERNAME_REGEX.match(kwargs["username"][0]):
-            errors.append(
-                "Username must contain letters, numbers, and basic characters only."
-            )
-
-        if User.objects.filter(username=kwargs["username"][0]).exists():
-            errors.append("Username is already registered to another user.")
-
-        # Validate email
-        if len(kwargs["email"][0]) < 5:
-            errors.append("Email field must be at least 5 characters.")
-        EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9\.\+_-]+@[a-zA-Z0-9\._-]+\.[a-zA-Z]*$")
-        if not EMAIL_REGEX.match(kwargs["email"][0]):
-            errors.append("Email is not a valid email format.")
-        elif User.objects.filter(email=kwargs["email"][0]).exists():
-            errors.append("Email address is already registered to another user.")
-
-        # Validate password
-        if (
-            len(kwargs["password"][0]) < 8
-            or kwargs["password"][0] != kwargs["password_confirmation"][0]
-        ):
-            errors.append(
-                "Password fields are required and must match and be at least 8 characters."
-            )
+        # Uma única consulta para os dois testes de duplicidade
+        taken = list(
+            User.objects.filter(
+                models.Q(username=username) | models.Q(email=email)
+            ).values_list("username", "email")
+        )
+        errors = registration_errors(
+            username,
+            email,
+            kwargs["password"][0],
+            kwargs["password_confirmation"][0],
+            username_taken=any(row[0] == username for row in taken),
+            email_taken=any(row[1] == email for row in taken),
+        )
 
         # Validate TOS acceptance
         if kwargs["tos_accept"][0] != "on":
@@ -74,10 +112,7 @@ class UserManager(BaseUserManager):
 
         # If no errors, create user
         if not errors:
-            user = User(
-                username=kwargs["username"][0],
-                email=kwargs["email"][0],
-            )
+            user = User(username=username, email=email)
             user.set_password(
                 kwargs["password"][0]
             )  # Hash da senha usando a função nativa
@@ -98,11 +133,16 @@ class UserManager(BaseUserManager):
 
         try:
             user = User.objects.get(username=username)
+            # Se o algoritmo ou o custo da senha gravada não são os atuais
+            # (PASSWORD_HASHERS), check_password a regrava com os atuais
             if user.check_password(password):
                 return {"logged_in_user": user}
             else:
                 errors.append("Nome de usuário ou senha estão incorretos.")
         except User.DoesNotExist:
+            # Calcula um hash mesmo assim, para que o tempo de resposta não
+            # revele quais usuários existem
+            User().set_password(password)
             errors.append("Nome de usuário ou senha estão incorretos.")
 
         return {"errors": errors}
@@ -111,7 +151,7 @@ class UserManager(BaseUserManager):
 class User(AbstractBaseUser, PermissionsMixin):
     username = models.CharField(max_length=20, unique=True)
     email = models.EmailField(max_length=50, unique=True)
-    password = models.CharField(max_length=60)
+    password = models.CharField(max_length=128)
     tos_accept = models.BooleanField(default=False)
     level = models.IntegerField(default=1)
     level_name = models.CharField(max_length=15, default="Iniciante")
@@ -166,6 +206,18 @@ class Workout(models.Model):
 
     objects = WorkoutManager()
 
+    class Meta:
+        indexes = [
+            # Paginação por cursor de all_workouts: (order_id, id)
+            models.Index(
+                fields=["user", "order_id", "id"], name="workout_user_order_idx"
+            ),
+            # Sincronização: o que mudou desde o último token (sync.py)
+            models.Index(
+                fields=["user", "updated_at"], name="workout_user_updated_idx"
+            ),
+        ]
+
     def __str__(self):
         return f"{self.name} - {self.user.username}"
 
@@ -217,38 +269,106 @@ class Exercise(models.Model):
     def __str__(self):
         return f"{self.name} - {self.sets}x{self.repetitions} RPE {self.rpe}"
 
+    def delete(self, *args, **kwargs):
+        # Exclusão direta de um exercício. Não há receiver de post_delete para
+        # Exercise: ele obrigaria o Django a carregar e apagar linha a linha os
+        # exercícios (e seus históricos) na exclusão em cascata de um treino,
+        # que já invalida o cache pelo sinal do próprio Workout.
+        user_id = (
+            Workout.objects.filter(id=self.workout_id)
+            .values_list("user_id", flat=True)
+            .first()
+        )
+        exercise_id = self.id
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            if user_id:
+                SyncTombstone.objects.record(
+                    user_id, SyncTombstone.KIND_EXERCISE, exercise_id
+                )
+        if user_id:
+            bump_cache_generation(user_id)
+        return result
+
 
 class WorkoutSession(models.Model):
     workout = models.ForeignKey(Workout, on_delete=models.CASCADE)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     date = models.DateTimeField(auto_now_add=True)
     completed = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "date"], name="workoutsession_user_date_idx"),
+            models.Index(
+                fields=["user", "updated_at"], name="workoutsession_updated_idx"
+            ),
+            # Paginação por cursor de session_history: (date, id)
+            models.Index(
+                fields=["user", "completed", "date", "id"],
+                name="workoutsession_history_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Sessão de {self.workout.name} em {self.date}"
 
+    def series_values(self):
+        """Séries gravadas nesta sessão, no formato dos campos do formulário
+        usado por WorkoutHistory.objects.record: weight_<exercício>_<série> e
+        repetitions_<exercício>_<série>."""
+        values = {}
+        series = Series.objects.filter(exercise_session__workout_session=self)
+        for exercise_id, set_number, weight, repetitions in series.values_list(
+            "exercise_session__exercise_id", "set_number", "weight_used", "repetitions"
+        ):
+            values[f"weight_{exercise_id}_{set_number}"] = str(weight)
+            values[f"repetitions_{exercise_id}_{set_number}"] = repetitions
+        return values
+
     def create_exercise_sessions(self):
-        """Método para criar ExerciseSession ao iniciar uma WorkoutSession."""
-        exercises = self.workout.exercise_set.all()
+        """Método para criar ExerciseSession ao iniciar uma WorkoutSession.
+
+        Todas as ExerciseSession são criadas com um único INSERT. A chamada é
+        idempotente: exercícios que já possuem ExerciseSession nesta sessão
+        são ignorados pela restrição única (workout_session, exercise), mesmo
+        com requisições concorrentes.
+        """
+        exercises = list(
+            Exercise.objects.filter(workout_id=self.workout_id).order_by("id")
+        )
 
         if not exercises:
-            print(
-                f"Não foram encontrados exercícios para o treino: {self.workout.name}"
+            logger.info(
+                "Nenhum exercício encontrado para o treino",
+                extra={"workout_id": self.workout_id, "workout_session_id": self.id},
             )
             return  # Se não houver exercícios, retorne sem criar
 
-        print(f"Exercícios encontrados para o treino {self.workout.name}: {exercises}")
-
-        for exercise in exercises:
-            ExerciseSession.objects.create(
-                workout_session=self,
-                exercise=exercise,
-                weight_used=0,  # Valor padrão
-                actual_repetitions=0,
-                sets=exercise.sets,
-                rpe=exercise.rpe,
+        with transaction.atomic():
+            ExerciseSession.objects.bulk_create(
+                [
+                    ExerciseSession(
+                        workout_session=self,
+                        exercise=exercise,
+                        weight_used=0,  # Valor padrão
+                        actual_repetitions=0,
+                        sets=exercise.sets,
+                        rpe=exercise.rpe,
+                    )
+                    for exercise in exercises
+                ],
+                ignore_conflicts=True,
             )
-            print(f"ExerciseSession criado para o exercício: {exercise.name}")
+        logger.info(
+            "ExerciseSessions criadas",
+            extra={
+                "workout_id": self.workout_id,
+                "workout_session_id": self.id,
+                "exercise_count": len(exercises),
+            },
+        )
 
 
 class ExerciseSession(models.Model):
@@ -260,32 +380,302 @@ class ExerciseSession(models.Model):
     actual_repetitions = models.IntegerField(default=0)
     sets = models.IntegerField(default=1)
     rpe = models.IntegerField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["workout_session", "exercise"],
+                name="unique_exercise_per_session",
+            )
+        ]
 
     def __str__(self):
         return f"{self.exercise.name} ({self.sets} sets, RPE {self.rpe})"
 
 
+class SeriesManager(models.Manager):
+    def save_sets(self, workout_session, entries):
+        """Grava as séries informadas de uma sessão de treino.
+
+        entries é uma lista de dicts com exercise_session, set_number, weight,
+        repetitions e, opcionalmente, version: a versão da série que o cliente
+        conhecia (0 para uma série nova). Séries cuja versão não confere são
+        rejeitadas como conflito e devolvidas com os valores atuais.
+
+        Séries novas são criadas com bulk_create e as existentes que mudaram
+        são atualizadas com bulk_update, tudo em uma transação.
+        """
+        return self._save_sets(
+            ExerciseSession.objects.filter(workout_session_id=workout_session.id),
+            entries,
+        )
+
+    def save_user_sets(self, user, entries):
+        """Grava séries de várias sessões do usuário de uma vez, como as
+        registradas offline pelo aplicativo (ver sync.py).
+
+        Mesmo formato e mesmas regras de save_sets, em uma única transação:
+        se alguma série for inválida, nenhuma é gravada.
+        """
+        ids = set()
+        for entry in entries:
+            try:
+                ids.add(int(entry["exercise_session"]))
+            except (KeyError, TypeError, ValueError):
+                pass  # Reportada como inválida por _save_sets
+        return self._save_sets(
+            ExerciseSession.objects.filter(workout_session__user=user, id__in=ids),
+            entries,
+        )
+
+    def _save_sets(self, exercise_sessions, entries):
+        errors = []
+        # id da ExerciseSession -> número de séries do exercício
+        exercise_sessions = dict(exercise_sessions.values_list("id", "sets"))
+
+        values = {}  # (exercise_session_id, set_number) -> (peso, reps, versão)
+        for entry in entries:
+            try:
+                exercise_session_id = int(entry["exercise_session"])
+                sets = exercise_sessions[exercise_session_id]
+                set_number = int(entry["set_number"])
+                weight = Decimal(str(entry.get("weight") or 0)).quantize(Decimal("0.1"))
+                if not weight.is_finite():  # "NaN" não pode ser comparado
+                    raise ValueError
+                repetitions = int(entry.get("repetitions") or 0)
+                version = entry.get("version")
+                version = None if version is None else int(version)
+            except (KeyError, TypeError, ValueError, InvalidOperation):
+                errors.append("Série inválida: exercício, série, peso ou repetições.")
+                continue
+            if not 1 <= set_number <= sets:
+                errors.append(f"A série {set_number} não existe neste exercício.")
+            elif not (0 <= weight < 10000 and repetitions >= 0):
+                errors.append(
+                    f"Série {set_number}: peso e repetições devem ser positivos."
+                )
+            else:
+                values[(exercise_session_id, set_number)] = (
+                    weight,
+                    repetitions,
+                    version,
+                )
+
+        if errors:
+            return {"errors": errors}
+
+        for attempt in write_transaction():
+            with attempt:
+                now = timezone.now()
+                saved, conflicts = [], []
+                # select_for_update impede que duas requisições gravem a mesma
+                # série a partir da mesma versão
+                existing = {
+                    (series.exercise_session_id, series.set_number): series
+                    for series in self.select_for_update().filter(
+                        exercise_session_id__in={key[0] for key in values}
+                    )
+                }
+                to_create, to_update = [], []
+                for key, (weight, reps, version) in values.items():
+                    series = existing.get(key)
+                    current = series.version if series else 0
+                    if version is not None and version != current:
+                        conflicts.append(
+                            series.as_dict()
+                            if series
+                            else {
+                                "exercise_session": key[0],
+                                "set_number": key[1],
+                                "version": 0,
+                            }
+                        )
+                        continue
+
+                    if series is None:
+                        series = Series(
+                            exercise_session_id=key[0],
+                            set_number=key[1],
+                            weight_used=weight,
+                            repetitions=reps,
+                            version=1,
+                        )
+                        to_create.append(series)
+                    elif (series.weight_used, series.repetitions) != (weight, reps):
+                        series.weight_used = weight
+                        series.repetitions = reps
+                        series.version += 1
+                        series.updated_at = now
+                        to_update.append(series)
+                    saved.append(series)
+
+                if to_create:
+                    self.bulk_create(to_create)
+                if to_update:
+                    # O bulk_update não preenche o auto_now de updated_at
+                    self.bulk_update(
+                        to_update,
+                        ["weight_used", "repetitions", "version", "updated_at"],
+                    )
+
+        return {
+            "created": len(to_create),
+            "updated": len(to_update),
+            "sets": [series.as_dict() for series in saved],
+            "conflicts": conflicts,
+        }
+
+
 class Series(models.Model):
     exercise_session = models.ForeignKey(
         ExerciseSession, related_name="series", on_delete=models.CASCADE
     )
+    set_number = models.PositiveIntegerField(default=1)  # Qual série foi (1, 2, 3...)
     weight_used = models.DecimalField(max_digits=5, decimal_places=1)
     repetitions = models.IntegerField()
+    version = models.PositiveIntegerField(default=1)  # Incrementada a cada gravação
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = SeriesManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["exercise_session", "set_number"],
+                name="unique_set_per_exercise_session",
+            )
+        ]
 
     def __str__(self):
         return (
             f"Series {self.id} - Weight: {self.weight_used}, Reps: {self.repetitions}"
         )
 
+    def as_dict(self):
+        return {
+            "exercise_session": self.exercise_session_id,
+            "set_number": self.set_number,
+            "weight": str(self.weight_used),
+            "repetitions": self.repetitions,
+            "version": self.version,
+        }
+
+
+class WorkoutHistoryManager(models.Manager):
+    def clean_values(self, exercises, values):
+        """Valida os pesos e repetições enviados para cada série.
+
+        Retorna {"values": {(exercício, série): (peso, repetições)}} ou
+        {"errors": [...]}. Campos ausentes ou vazios valem 0.
+        """
+        errors = []
+        cleaned = {}
+        for exercise in exercises:
+            for i in range(1, exercise.sets + 1):
+                try:
+                    weight = values.get(f"weight_{exercise.id}_{i}") or 0
+                    weight = Decimal(str(weight)).quantize(Decimal("0.1"))
+                    if not weight.is_finite():  # "NaN" não pode ser comparado
+                        raise ValueError
+                    repetitions = int(values.get(f"repetitions_{exercise.id}_{i}") or 0)
+                except (TypeError, ValueError, InvalidOperation):
+                    valid = False
+                else:
+                    valid = 0 <= weight < 10000 and repetitions >= 0
+                if valid:
+                    cleaned[(exercise.id, i)] = (weight, repetitions)
+                else:
+                    errors.append(
+                        f"{exercise.name}, série {i}: peso e repetições devem ser "
+                        "números positivos."
+                    )
+        if errors:
+            return {"errors": errors}
+        return {"values": cleaned}
+
+    def record(self, user, workout, values, workout_session=None, date=None):
+        """Registra o histórico de um treino concluído.
+
+        values contém os campos enviados pelo formulário, no formato
+        weight_<exercício>_<série> e repetitions_<exercício>_<série>; um valor
+        inválido levanta ValueError. date é o momento da conclusão (por padrão,
+        agora). Todas as séries são gravadas com um único bulk_create na mesma
+        transação.
+        """
+        exercises = list(workout.exercise_set.all())
+        cleaned = self.clean_values(exercises, values)
+        if "errors" in cleaned:
+            raise ValueError(" ".join(cleaned["errors"]))
+        values = cleaned["values"]
+
+        for attempt in write_transaction():
+            with attempt:
+                workout_history = self.create(
+                    workout=workout,
+                    user=user,
+                    workout_session=workout_session,
+                    completed=True,
+                )
+                if date is not None:
+                    # date tem auto_now_add, que o create sobrescreve
+                    self.filter(id=workout_history.id).update(date=date)
+                    workout_history.date = date
+
+                # Uma linha de histórico para cada série de cada exercício
+                ExerciseHistory.objects.bulk_create(
+                    [
+                        ExerciseHistory(
+                            workout_history=workout_history,
+                            exercise=exercise,
+                            set_number=i,
+                            weight_used=values[(exercise.id, i)][0],
+                            actual_repetitions=values[(exercise.id, i)][1],
+                            sets=exercise.sets,
+                            rpe=exercise.rpe,
+                        )
+                        for exercise in exercises
+                        for i in range(1, exercise.sets + 1)
+                    ]
+                )
+
+                # Atualiza as estatísticas pré-calculadas com as novas séries
+                ExerciseStat.objects.add_sets(
+                    user.id,
+                    workout_history.date,
+                    [
+                        (exercise_id, weight, repetitions)
+                        for (exercise_id, _), (weight, repetitions) in values.items()
+                    ],
+                )
+
+        # O bulk_create não dispara post_save: invalida o cache explicitamente
+        bump_cache_generation(user.id)
+        return workout_history
+
 
 class WorkoutHistory(models.Model):
     workout = models.ForeignKey(
         Workout, on_delete=models.CASCADE
     )  # Referência ao treino realizado
+    workout_session = models.ForeignKey(
+        WorkoutSession,
+        related_name="workout_histories",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+    )  # Sessão exata que gerou este histórico
     user = models.ForeignKey(User, on_delete=models.CASCADE)  # Referência ao usuário
     date = models.DateTimeField(auto_now_add=True)  # Data da sessão
     completed = models.BooleanField(default=False)  # Status da sessão
 
+    objects = WorkoutHistoryManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "date"], name="workouthistory_user_date_idx")
+        ]
+
     def __str__(self):
         return f"Sessão de {self.workout.name} em {self.date}"
 
@@ -302,7 +692,358 @@ class ExerciseHistory(models.Model):
     )  # Peso utilizado
     actual_repetitions = models.IntegerField(default=0)  # Repetições reais
     sets = models.IntegerField(default=1)  # Número de séries
+    set_number = models.PositiveIntegerField(default=1)  # Qual série foi (1, 2, 3...)
     rpe = models.IntegerField()  # RPE (Rate of Perceived Exertion)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["workout_history", "exercise", "set_number"],
+                name="exhistory_wh_ex_set_idx",
+            )
+        ]
+
     def __str__(self):
         return f"{self.exercise.name} em {self.workout_history.date} - {self.sets}x{self.actual_repetitions} RPE {self.rpe}"
+
+
+def epley(weight, repetitions):
+    """1RM estimado pela fórmula de Epley."""
+    if repetitions <= 1:
+        return weight
+    return weight * (1 + Decimal(repetitions) / 30)
+
+
+def brzycki(weight, repetitions):
+    """1RM estimado pela fórmula de Brzycki (válida até 36 repetições)."""
+    if repetitions >= 37:
+        return None
+    return weight * 36 / Decimal(37 - repetitions)
+
+
+class ExerciseStatManager(models.Manager):
+    def add_sets(self, user_id, date, sets):
+        """Soma as séries de um treino às estatísticas diária e semanal.
+
+        sets é uma lista de tuplas (exercise_id, peso, repetições). Apenas os
+        períodos afetados são lidos e gravados, em vez de recalcular tudo.
+        """
+        totals = {}
+        self._accumulate(totals, user_id, date, sets)
+        if not totals:
+            return
+
+        with transaction.atomic():
+            existing = {
+                (stat.exercise_id, stat.period, stat.period_start): stat
+                for stat in self.select_for_update().filter(
+                    user_id=user_id,
+                    exercise_id__in={key[1] for key in totals},
+                    period_start__in={key[3] for key in totals},
+                )
+            }
+            to_create, to_update = [], []
+            for key, stat in totals.items():
+                current = existing.get(key[1:])
+                if current is None:
+                    to_create.append(stat)
+                else:
+                    current.merge(stat)
+                    to_update.append(current)
+
+            if to_create:
+                self.bulk_create(to_create)
+            if to_update:
+                self.bulk_update(to_update, ExerciseStat.AGGREGATE_FIELDS)
+
+    def rebuild(self, user=None):
+        """Recalcula do zero as estatísticas a partir do ExerciseHistory."""
+        histories = ExerciseHistory.objects.all()
+        stats = self.all()
+        if user is not None:
+            histories = histories.filter(workout_history__user=user)
+            stats = stats.filter(user=user)
+
+        rows = histories.order_by("workout_history__user_id").values_list(
+            "workout_history__user_id",
+            "workout_history__date",
+            "exercise_id",
+            "weight_used",
+            "actual_repetitions",
+        )
+
+        created = 0
+        with transaction.atomic():
+            stats.delete()
+            totals = {}
+            for user_id, date, exercise_id, weight, repetitions in rows.iterator(
+                chunk_size=2000
+            ):
+                self._accumulate(
+                    totals, user_id, date, [(exercise_id, weight, repetitions)]
+                )
+                if len(totals) >= 5000:
+                    created += self._flush(totals)
+            created += self._flush(totals, final=True)
+
+        # As estatísticas mudaram sem passar por record: invalida o cache e o
+        # ETag dos gráficos de cada usuário recalculado
+        if user is not None:
+            bump_cache_generation(user.id)
+        else:
+            for user_id in User.objects.values_list("id", flat=True).iterator():
+                bump_cache_generation(user_id)
+        return created
+
+    def _flush(self, totals, final=False):
+        # As linhas vêm ordenadas por usuário: só é seguro gravar os usuários
+        # já concluídos; o último continua acumulando até o fim
+        if final:
+            done = list(totals)
+        else:
+            last_user = max(key[0] for key in totals)
+            done = [key for key in totals if key[0] != last_user]
+        self.bulk_create([totals.pop(key) for key in done], batch_size=1000)
+        return len(done)
+
+    def _accumulate(self, totals, user_id, date, sets):
+        day = timezone.localdate(date)
+        week = day - timedelta(days=day.weekday())  # Semanas começam na segunda
+        for exercise_id, weight, repetitions in sets:
+            if repetitions <= 0:
+                continue  # Série não realizada
+            for period, start in (
+                (ExerciseStat.PERIOD_DAY, day),
+                (ExerciseStat.PERIOD_WEEK, week),
+            ):
+                key = (user_id, exercise_id, period, start)
+                stat = totals.get(key)
+                if stat is None:
+                    stat = totals[key] = ExerciseStat(
+                        user_id=user_id,
+                        exercise_id=exercise_id,
+                        period=period,
+                        period_start=start,
+                    )
+                stat.add_set(weight, repetitions)
+
+
+class ExerciseStat(models.Model):
+    """Estatísticas pré-calculadas de um exercício por dia ou por semana."""
+
+    PERIOD_DAY = "day"
+    PERIOD_WEEK = "week"
+    PERIOD_CHOICES = [(PERIOD_DAY, "Dia"), (PERIOD_WEEK, "Semana")]
+
+    AGGREGATE_FIELDS = [
+        "sets",
+        "repetitions",
+        "tonnage",
+        "best_weight",
+        "best_repetitions",
+        "e1rm_epley",
+        "e1rm_brzycki",
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    exercise = models.ForeignKey(Exercise, on_delete=models.CASCADE)
+    period = models.CharField(max_length=4, choices=PERIOD_CHOICES)
+    period_start = models.DateField()  # Dia, ou segunda-feira da semana
+    sets = models.PositiveIntegerField(default=0)  # Séries realizadas
+    repetitions = models.PositiveIntegerField(default=0)  # Volume: total de reps
+    tonnage = models.DecimalField(
+        max_digits=12, decimal_places=1, default=0
+    )  # Soma de peso x repetições
+    best_weight = models.DecimalField(
+        max_digits=5, decimal_places=1, default=0
+    )  # Melhor série (maior 1RM estimado)
+    best_repetitions = models.PositiveIntegerField(default=0)
+    e1rm_epley = models.DecimalField(max_digits=8, decimal_places=1, default=0)
+    e1rm_brzycki = models.DecimalField(max_digits=8, decimal_places=1, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ExerciseStatManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "exercise", "period", "period_start"],
+                name="unique_exercise_stat_period",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["user", "period", "period_start"],
+                name="exercisestat_user_period_idx",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.exercise_id} - {self.period} {self.period_start}"
+
+    def add_set(self, weight, repetitions):
+        weight = Decimal(weight)
+        self.sets += 1
+        self.repetitions += repetitions
+        self.tonnage = Decimal(self.tonnage) + weight * repetitions
+
+        e1rm = epley(weight, repetitions).quantize(Decimal("0.1"))
+        if e1rm > self.e1rm_epley:
+            self.e1rm_epley = e1rm
+            self.best_weight = weight
+            self.best_repetitions = repetitions
+        e1rm = brzycki(weight, repetitions)
+        if e1rm is not None and e1rm.quantize(Decimal("0.1")) > self.e1rm_brzycki:
+            self.e1rm_brzycki = e1rm.quantize(Decimal("0.1"))
+
+    def merge(self, other):
+        self.sets += other.sets
+        self.repetitions += other.repetitions
+        self.tonnage = Decimal(self.tonnage) + Decimal(other.tonnage)
+        if other.e1rm_epley > self.e1rm_epley:
+            self.e1rm_epley = other.e1rm_epley
+            self.best_weight = other.best_weight
+            self.best_repetitions = other.best_repetitions
+        self.e1rm_brzycki = max(self.e1rm_brzycki, other.e1rm_brzycki)
+
+
+class ImportJobManager(models.Manager):
+    def enqueue(self, user, kind, payload=None, arquivo=None):
+        """Cria um job pendente para ser executado pelo worker (run_jobs)."""
+        job = self.model(user=user, kind=kind, payload=payload or {})
+        if arquivo is not None:
+            job.arquivo.save(arquivo.name, arquivo, save=False)
+        job.save()
+        return job
+
+    def claim(self, limit):
+        """Reserva até limit jobs pendentes para este worker.
+
+        A troca de status é feita com um UPDATE condicional, de modo que dois
+        workers nunca reservam o mesmo job.
+        """
+        claimed = []
+        pending = self.filter(status=ImportJob.STATUS_PENDING).order_by("id")
+        for job_id in pending.values_list("id", flat=True)[:limit]:
+            now = timezone.now()
+            updated = self.filter(id=job_id, status=ImportJob.STATUS_PENDING).update(
+                status=ImportJob.STATUS_RUNNING, started_at=now, heartbeat_at=now
+            )
+            if updated:
+                claimed.append(job_id)
+        return claimed
+
+    def heartbeat(self, job_ids):
+        """Sinaliza que o worker continua executando estes jobs."""
+        return self.filter(id__in=job_ids, status=ImportJob.STATUS_RUNNING).update(
+            heartbeat_at=timezone.now()
+        )
+
+    def fail_stale(self, timeout):
+        """Marca como falhos os jobs em execução sem heartbeat há mais de timeout.
+
+        Um job fica "em execução" para sempre se o worker que o reservou foi
+        encerrado no meio dele, já que claim só entrega jobs pendentes. Jobs
+        de workers ativos, mesmo os demorados, continuam recebendo heartbeat.
+        Eles não voltam para a fila porque podem ter sido executados em parte.
+        """
+        now = timezone.now()
+        return self.filter(
+            status=ImportJob.STATUS_RUNNING, heartbeat_at__lt=now - timeout
+        ).update(
+            status=ImportJob.STATUS_FAILED,
+            result={"errors": ["O job foi interrompido. Envie-o novamente."]},
+            finished_at=now,
+        )
+
+
+class ImportJob(models.Model):
+    KIND_IMPORT = "import"
+    KIND_COMPLETE_WORKOUT = "complete_workout"
+    KIND_PROVISION_MEMBERS = "provision_members"
+    KIND_CHOICES = [
+        (KIND_IMPORT, "Importação de treinos"),
+        (KIND_COMPLETE_WORKOUT, "Registro de histórico"),
+        (KIND_PROVISION_MEMBERS, "Cadastro de membros"),
+    ]
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pendente"),
+        (STATUS_RUNNING, "Em execução"),
+        (STATUS_DONE, "Concluído"),
+        (STATUS_FAILED, "Falhou"),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    arquivo = models.FileField(upload_to="imports/", blank=True)  # Planilha enviada
+    payload = models.JSONField(default=dict, blank=True)  # Parâmetros do job
+    result = models.JSONField(default=dict, blank=True)  # Relatório ou erros
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Renovado pelo worker enquanto o job executa (ver run_jobs)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+
+    objects = ImportJobManager()
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "id"], name="importjob_status_idx")]
+
+    def __str__(self):
+        return f"Job {self.id} ({self.kind}) - {self.status}"
+
+
+class SyncTombstoneManager(models.Manager):
+    def record(self, user_id, kind, object_id):
+        """Registra uma exclusão e descarta as mais antigas que a retenção."""
+        now = timezone.now()
+        self.filter(
+            user_id=user_id, deleted_at__lt=now - SyncTombstone.RETENTION
+        ).delete()
+        return self.create(
+            user_id=user_id, kind=kind, object_id=object_id, deleted_at=now
+        )
+
+
+class SyncTombstone(models.Model):
+    """Exclusão de um objeto, enviada aos aplicativos na sincronização.
+
+    Só as exclusões diretas são registradas: ao receber a de um treino ou de
+    uma sessão, o aplicativo remove também o que dependia dela.
+    """
+
+    KIND_WORKOUT = "workouts"
+    KIND_EXERCISE = "exercises"
+    KIND_SESSION = "sessions"
+    KIND_CHOICES = [
+        (KIND_WORKOUT, "Treino"),
+        (KIND_EXERCISE, "Exercício"),
+        (KIND_SESSION, "Sessão"),
+    ]
+    # Tokens mais antigos que isso recebem uma sincronização completa
+    RETENTION = timedelta(days=90)
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.PositiveIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    objects = SyncTombstoneManager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "deleted_at"], name="tombstone_user_deleted_idx"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} excluído em {self.deleted_at}"
@@ -0,0 +1,111 @@
+# apps/workout/pagination.py
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+class KeysetPage:
+    """Uma página de resultados e o cursor para a próxima, se houver.
+
+    A consulta só é feita no primeiro acesso, de modo que uma página cujo
+    fragmento já está em cache não chega a consultar o banco.
+    """
+
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset
+        self.ordering = ordering
+        self.per_page = per_page
+        self._items = None
+        self._next_cursor = None
+
+    def _fetch(self):
+        if self._items is not None:
+            return
+        items = list(self.queryset[: self.per_page + 1])
+        if len(items) > self.per_page:
+            items = items[: self.per_page]
+            self._next_cursor = encode_cursor(
+                [getattr(items[-1], field.lstrip("-")) for field in self.ordering]
+            )
+        self._items = items
+
+    @property
+    def object_list(self):
+        self._fetch()
+        return self._items
+
+    @property
+    def next_cursor(self):
+        self._fetch()
+        return self._next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+def encode_cursor(values):
+    # isoformat mantém os microssegundos, necessários para a comparação exata
+    raw = json.dumps(
+        [
+            value.isoformat() if hasattr(value, "isoformat") else value
+            for value in values
+        ]
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, model, ordering):
+    """Lê os valores do cursor, ou None se ele for inválido."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(ordering):
+            return None
+        return [
+            model._meta.get_field(field.lstrip("-")).to_python(value)
+            for field, value in zip(ordering, values)
+        ]
+    except (binascii.Error, ValueError, TypeError, ValidationError):
+        return None
+
+
+def _after(ordering, values):
+    """Filtro das linhas que vêm depois de values na ordenação dada.
+
+    Para ("a", "b"): a > x OR (a = x AND b > y). Com os mesmos campos em um
+    índice composto, qualquer página custa o mesmo que a primeira.
+    """
+    condition = Q()
+    for i, field in enumerate(ordering):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        equal = {
+            previous.lstrip("-"): value
+            for previous, value in zip(ordering[:i], values[:i])
+        }
+        condition |= Q(**equal, **{f"{name}__{lookup}": values[i]})
+    return condition
+
+
+def paginate(queryset, ordering, cursor=None, per_page=12):
+    """Paginação por cursor (keyset), sem COUNT(*) nem OFFSET.
+
+    ordering deve terminar em um campo único (normalmente "id") para que a
+    ordem seja total. Um cursor inválido volta para a primeira página.
+    """
+    queryset = queryset.order_by(*ordering)
+    values = decode_cursor(cursor, queryset.model, ordering) if cursor else None
+    if values is not None:
+        queryset = queryset.filter(_after(ordering, values))
+
+    return KeysetPage(queryset, ordering, per_page)
@@ -0,0 +1,165 @@
+# apps/workout/provisioning.py
+import csv
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError
+
+from .db import write_transaction
+from .importers import MAX_ERRORS, _to_text, read_rows
+from .models import User, registration_errors
+
+logger = logging.getLogger(__name__)
+
+# Colunas esperadas na planilha de membros
+MEMBER_COLUMNS = ("username", "email", "password")
+
+# Linhas por INSERT no bulk_create e valores por consulta IN (o SQLite limita
+# o número de parâmetros por consulta)
+BATCH_SIZE = 1000
+LOOKUP_SIZE = 900
+
+READ_ERROR = "Erro ao importar membros: não foi possível ler o arquivo."
+
+# Abaixo disso o custo de iniciar o pool supera o ganho
+MIN_PARALLEL_PASSWORDS = 32
+
+
+def _chunks(values, size):
+    values = list(values)
+    for i in range(0, len(values), size):
+        yield values[i : i + size]
+
+
+def _existing(field, values):
+    """Quais dos valores já estão em uso no campo, consultados em lotes."""
+    existing = set()
+    for chunk in _chunks(values, LOOKUP_SIZE):
+        existing.update(
+            User.objects.filter(**{f"{field}__in": chunk}).values_list(field, flat=True)
+        )
+    return existing
+
+
+def hash_passwords(passwords, workers=None):
+    """Criptografa as senhas em paralelo, em um pool de processos.
+
+    A criptografia é intencionalmente lenta e usa só CPU, então escala com o
+    número de núcleos. Retorna os hashes na mesma ordem das senhas.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(passwords) < MIN_PARALLEL_PASSWORDS:
+        return [make_password(password) for password in passwords]
+
+    from .management.commands.run_jobs import _init_worker
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    ) as pool:
+        chunksize = max(1, len(passwords) // (workers * 4))
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+
+def provision_rows(columns, rows, workers=None):
+    """Cadastra os membros das linhas lidas por read_rows.
+
+    Todas as linhas são validadas em uma única passada: as duplicidades
+    dentro da planilha são encontradas com conjuntos e as duplicidades com o
+    banco com poucas consultas IN, em vez de duas consultas por membro. Se
+    houver qualquer erro nada é gravado. As senhas são criptografadas no
+    pool de processos e os usuários inseridos com bulk_create.
+    """
+    started = time.perf_counter()
+
+    missing = [column for column in MEMBER_COLUMNS if column not in columns]
+    if missing:
+        return {
+            "errors": [
+                "Erro ao importar membros: coluna(s) não encontrada(s): "
+                + ", ".join(f"'{column}'" for column in missing)
+                + "."
+            ]
+        }
+
+    members = []
+    for line, row in rows:
+        username = _to_text(row.get("username"))
+        email = User.objects.normalize_email(_to_text(row.get("email")))
+        members.append((line, username, email, _to_text(row.get("password"))))
+
+    taken_usernames = _existing("username", {m[1] for m in members})
+    taken_emails = _existing("email", {m[2] for m in members})
+
+    errors = []
+    error_count = 0
+    seen_usernames, seen_emails = set(), set()
+    for line, username, email, password in members:
+        row_errors = registration_errors(
+            username,
+            email,
+            password,
+            password,
+            username_taken=username in taken_usernames or username in seen_usernames,
+            email_taken=email in taken_emails or email in seen_emails,
+        )
+        seen_usernames.add(username)
+        seen_emails.add(email)
+        error_count += len(row_errors)
+        if len(errors) < MAX_ERRORS:
+            errors.extend(f"Linha {line}: {error}" for error in row_errors)
+    if error_count:
+        if error_count > len(errors):
+            errors.append(f"... e mais {error_count - len(errors)} erro(s).")
+        return {"errors": errors}
+
+    hashed = hash_passwords([m[3] for m in members], workers)
+    users = [
+        User(username=username, email=email, password=password)
+        for (_, username, email, _), password in zip(members, hashed)
+    ]
+    try:
+        for attempt in write_transaction():
+            with attempt:
+                User.objects.bulk_create(users, batch_size=BATCH_SIZE)
+    except IntegrityError:
+        # Alguém se cadastrou com os mesmos dados depois da validação
+        return {
+            "errors": [
+                "Erro ao importar membros: alguns usuários foram cadastrados "
+                "durante a importação. Envie a planilha novamente."
+            ]
+        }
+
+    report = {
+        "rows": len(members),
+        "created": len(users),
+        "elapsed": round(time.perf_counter() - started, 3),
+    }
+    logger.info(
+        "Importação de membros concluída: %s membro(s) em %ss",
+        report["created"],
+        report["elapsed"],
+    )
+    return {"report": report}
+
+
+def provision_members(arquivo, workers=None):
+    """Cadastra membros a partir de uma planilha (.csv ou .xlsx)."""
+    try:
+        columns, rows = read_rows(arquivo)
+    except ImportError as e:
+        return {"errors": [str(e)]}
+    except Exception:
+        logger.exception("Falha ao ler a planilha de membros")
+        return {"errors": [READ_ERROR]}
+    try:
+        return provision_rows(columns, rows, workers)
+    except (UnicodeDecodeError, csv.Error):
+        logger.exception("Falha ao ler a planilha de membros")
+        return {"errors": [READ_ERROR]}
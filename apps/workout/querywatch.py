@@ -0,0 +1,174 @@
+# apps/workout/querywatch.py
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.template.base import Node
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+# Arquivos da própria instrumentação, ignorados ao procurar quem fez a consulta
+_INSTRUMENTATION = tuple(
+    os.path.join(APP_DIR, name)
+    for name in ("querywatch.py", "metrics.py", "middleware.py", "template_backends.py")
+)
+# Consultas distintas mantidas no relatório (as mais antigas saem primeiro)
+REPORT_SIZE = 200
+
+
+def query_location():
+    """Onde a consulta foi disparada: o trecho do app e, se for o caso, a
+    linha do template que estava sendo renderizado."""
+    code = template = None
+    frame = sys._getframe(1)
+    while frame is not None and code is None:
+        filename = frame.f_code.co_filename
+        if template is None and frame.f_code.co_name == "render_annotated":
+            node = frame.f_locals.get("self")
+            if isinstance(node, Node) and node.token is not None:
+                name = node.origin.template_name or node.origin.name
+                template = f"{name}:{node.token.lineno}"
+        if filename.startswith(APP_DIR) and not filename.startswith(_INSTRUMENTATION):
+            path = os.path.relpath(filename, settings.BASE_DIR)
+            code = f"{path}:{frame.f_lineno} em {frame.f_code.co_name}"
+        frame = frame.f_back
+    return code, template
+
+
+def explain(connection, sql, params):
+    """Plano de execução de uma consulta SELECT, ou None."""
+    if not sql.lstrip().upper().startswith("SELECT"):
+        return None
+    prefix = "EXPLAIN QUERY PLAN" if connection.vendor == "sqlite" else "EXPLAIN"
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"{prefix} {sql}", params)
+            rows = cursor.fetchall()
+    except DatabaseError:
+        return None
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+class QueryWatcher:
+    """execute_wrapper que aponta as consultas problemáticas de uma requisição.
+
+    Marca as consultas mais lentas que SLOW_QUERY_MS e as que se repetem
+    com o mesmo SQL pelo menos REPEATED_QUERY_THRESHOLD vezes (N+1). Como o
+    Django passa os valores como parâmetros, o mesmo SQL é a mesma forma de
+    consulta. O local é procurado apenas para as consultas marcadas.
+    """
+
+    def __init__(self):
+        self.slow = settings.SLOW_QUERY_MS / 1000
+        self.repeated = settings.REPEATED_QUERY_THRESHOLD
+        self.counts = Counter()
+        self.findings = {}  # (tipo, sql) -> dados da consulta
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.counts[sql] += 1
+            if duration >= self.slow:
+                self._flag("lenta", sql, params, many, duration)
+            if self.counts[sql] == self.repeated:
+                self._flag("repetida", sql, params, many, duration)
+
+    def _flag(self, kind, sql, params, many, duration):
+        finding = self.findings.get((kind, sql))
+        if finding is not None:
+            finding["duration"] = max(finding["duration"], duration)
+            return
+        code, template = query_location()
+        self.findings[kind, sql] = {
+            "kind": kind,
+            "sql": sql,
+            "params": None if many else params,
+            "duration": duration,
+            "location": code,
+            "template": template,
+        }
+
+    def report(self, view, connection):
+        """Registra as consultas marcadas, com o plano de cada uma.
+
+        Deve ser chamado depois que o wrapper foi removido, para que os
+        EXPLAIN não entrem na contagem.
+        """
+        for finding in self.findings.values():
+            finding["view"] = view
+            finding["count"] = self.counts[finding["sql"]]
+            if finding["params"] is not None:
+                finding["plan"] = explain(connection, finding["sql"], finding["params"])
+            else:
+                finding["plan"] = None
+            logger.warning(
+                "Consulta %s em %s (%sx, %.1fms): %s",
+                finding["kind"],
+                view,
+                finding["count"],
+                finding["duration"] * 1000,
+                finding["location"] or finding["template"] or "-",
+                extra={
+                    "request": {
+                        "view": view,
+                        "kind": finding["kind"],
+                        "count": finding["count"],
+                        "duration_ms": round(finding["duration"] * 1000, 2),
+                        "location": finding["location"],
+                        "template": finding["template"],
+                        "sql": finding["sql"],
+                        "plan": finding["plan"],
+                    }
+                },
+            )
+            query_report.add(finding)
+
+
+class QueryReport:
+    """Consultas lentas e repetidas vistas por este processo."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.entries = OrderedDict()
+
+    def add(self, finding):
+        key = (finding["kind"], finding["sql"], finding["location"])
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                entry = {**finding, "requests": 0, "max_ms": 0.0}
+            entry.update(
+                view=finding["view"],
+                template=finding["template"],
+                plan=finding["plan"] or entry["plan"],
+                count=max(entry["count"], finding["count"]),
+                last_seen=timezone.now(),
+            )
+            entry["requests"] += 1
+            entry["max_ms"] = max(entry["max_ms"], finding["duration"] * 1000)
+            self.entries[key] = entry
+            while len(self.entries) > REPORT_SIZE:
+                self.entries.popitem(last=False)
+
+    def top(self):
+        """Entradas ordenadas pelo número de requisições afetadas."""
+        with self.lock:
+            entries = [dict(entry) for entry in self.entries.values()]
+        return sorted(entries, key=lambda e: (e["requests"], e["max_ms"]), reverse=True)
+
+
+query_report = QueryReport()
@@ -0,0 +1,169 @@
+# apps/workout/seeding.py
+import random
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from .models import (
+    Exercise,
+    ExerciseHistory,
+    ExerciseSession,
+    ExerciseStat,
+    Series,
+    User,
+    Workout,
+    WorkoutHistory,
+    WorkoutSession,
+)
+
+# Linhas por INSERT nos bulk_create/bulk_update
+BATCH_SIZE = 2000
+
+GROUPS = ["Peito", "Costas", "Pernas", "Ombros", "Braços", "Core"]
+
+
+def seed_user_data(
+    user, workouts=20, exercises=5, sessions=1000, sets=4, rng=None, open_session=True
+):
+    """Gera treinos, exercícios, sessões concluídas e históricos de um usuário.
+
+    Tudo é gravado com bulk_create. As sessões são distribuídas uma por dia,
+    da mais antiga até hoje, com pesos que variam entre os treinos. Com
+    open_session, cria também uma sessão em andamento com séries salvas.
+    Retorna (treinos, sessões concluídas).
+    """
+    rng = rng or random.Random(0)
+    now = timezone.now()
+
+    workout_list = Workout.objects.bulk_create(
+        (
+            Workout(
+                name=GROUPS[i % len(GROUPS)],
+                description=f"Treino {i + 1}",
+                user=user,
+                order_id=i + 1,
+            )
+            for i in range(workouts)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    exercise_list = Exercise.objects.bulk_create(
+        (
+            Exercise(
+                name=f"Exercício {j + 1}",
+                sets=sets,
+                repetitions=rng.choice([5, 8, 10, 12]),
+                rpe=rng.randint(6, 9),
+                workout=w,
+            )
+            for w in workout_list
+            for j in range(exercises)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    by_workout = {}
+    for exercise in exercise_list:
+        by_workout.setdefault(exercise.workout_id, []).append(exercise)
+
+    session_list = WorkoutSession.objects.bulk_create(
+        (
+            WorkoutSession(
+                user=user, workout=workout_list[i % workouts], completed=True
+            )
+            for i in range(sessions)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    # date tem auto_now_add, que o bulk_create sobrescreve; o bulk_update não
+    for i, session in enumerate(session_list):
+        session.date = now - timedelta(days=sessions - 1 - i)
+    WorkoutSession.objects.bulk_update(session_list, ["date"], batch_size=BATCH_SIZE)
+
+    history_list = WorkoutHistory.objects.bulk_create(
+        (
+            WorkoutHistory(
+                user=user, workout=s.workout, workout_session=s, completed=True
+            )
+            for s in session_list
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    for history in history_list:
+        history.date = history.workout_session.date
+    WorkoutHistory.objects.bulk_update(history_list, ["date"], batch_size=BATCH_SIZE)
+
+    base_weight = {exercise.id: rng.randint(10, 100) for exercise in exercise_list}
+    ExerciseHistory.objects.bulk_create(
+        (
+            ExerciseHistory(
+                workout_history=h,
+                exercise=exercise,
+                set_number=n,
+                weight_used=base_weight[exercise.id] + rng.randint(0, 20),
+                actual_repetitions=max(0, exercise.repetitions + rng.randint(-3, 1)),
+                sets=exercise.sets,
+                rpe=exercise.rpe,
+            )
+            for h in history_list
+            for exercise in by_workout[h.workout_id]
+            for n in range(1, exercise.sets + 1)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+
+    if open_session and workout_list:
+        session = WorkoutSession.objects.create(user=user, workout=workout_list[0])
+        exercise_sessions = ExerciseSession.objects.bulk_create(
+            ExerciseSession(
+                workout_session=session,
+                exercise=exercise,
+                sets=exercise.sets,
+                rpe=exercise.rpe,
+            )
+            for exercise in by_workout[workout_list[0].id]
+        )
+        repetitions = {exercise.id: exercise.repetitions for exercise in exercise_list}
+        Series.objects.bulk_create(
+            Series(
+                exercise_session=es,
+                set_number=n,
+                weight_used=base_weight[es.exercise_id],
+                repetitions=repetitions[es.exercise_id],
+            )
+            for es in exercise_sessions
+            for n in range(1, es.sets + 1)
+        )
+
+    return workout_list, session_list
+
+
+def seed(users=1, password="password", stats=True, seed=0, **options):
+    """Cria users usuários sintéticos, cada um com seed_user_data(**options).
+
+    A senha é criptografada uma única vez e reaproveitada por todos os
+    usuários. Com stats, recalcula as estatísticas de exercícios no final.
+    Retorna a lista de usuários criados.
+    """
+    rng = random.Random(seed)
+    # Sufixo aleatório para não colidir com usuários de execuções anteriores
+    tag = uuid.uuid4().hex[:6]
+    hashed = make_password(password)
+    user_list = User.objects.bulk_create(
+        (
+            User(
+                username=f"carga{tag}-{i}",
+                email=f"carga{tag}-{i}@example.com",
+                password=hashed,
+            )
+            for i in range(users)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    for user in user_list:
+        seed_user_data(user, rng=rng, **options)
+    if stats:
+        for user in user_list:
+            ExerciseStat.objects.rebuild(user)
+    return user_list
@@ -0,0 +1,99 @@
+# apps/workout/signals.py
+from django.db.backends.signals import connection_created
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import bump_cache_generation
+from .context_processors import invalidate_current_session
+from .db import configure_sqlite
+from .models import (
+    Exercise,
+    ExerciseHistory,
+    SyncTombstone,
+    Workout,
+    WorkoutHistory,
+    WorkoutSession,
+)
+
+
+@receiver(connection_created)
+def connection_opened(sender, connection, **kwargs):
+    if connection.vendor == "sqlite":
+        configure_sqlite(connection)
+
+
+def _cascaded(sender, instance, origin):
+    """Se a exclusão veio em cascata de outro objeto (post_delete)."""
+    if origin is None or origin is instance:
+        return False
+    return not (isinstance(origin, QuerySet) and origin.model is sender)
+
+
+@receiver(post_save, sender=WorkoutSession)
+@receiver(post_delete, sender=WorkoutSession)
+def workout_session_changed(sender, instance, origin=None, **kwargs):
+    # Na cascata de um treino a invalidação é feita uma vez, por workout_deleted
+    if _cascaded(sender, instance, origin):
+        return
+    # Sessão criada, concluída ou removida: a sessão atual pode ter mudado
+    invalidate_current_session(instance.user_id)
+    bump_cache_generation(instance.user_id)
+
+
+@receiver(post_save, sender=Workout)
+def workout_changed(sender, instance, **kwargs):
+    bump_cache_generation(instance.user_id)
+
+
+@receiver(post_delete, sender=Workout)
+def workout_deleted(sender, instance, **kwargs):
+    # As sessões do treino foram removidas junto com ele
+    invalidate_current_session(instance.user_id)
+    bump_cache_generation(instance.user_id)
+
+
+# Só post_save: um receiver de post_delete impediria a exclusão em lote dos
+# exercícios e históricos na cascata de um treino (uma consulta por linha).
+# A exclusão de um treino ou sessão já invalida o cache pelos sinais acima, e
+# a exclusão direta de um exercício é tratada em Exercise.delete.
+@receiver(post_save, sender=Exercise)
+def exercise_changed(sender, instance, **kwargs):
+    user_id = _owner_id(instance, "workout", Workout)
+    if user_id:
+        bump_cache_generation(user_id)
+
+
+@receiver(post_save, sender=ExerciseHistory)
+def exercise_history_changed(sender, instance, **kwargs):
+    user_id = _owner_id(instance, "workout_history", WorkoutHistory)
+    if user_id:
+        bump_cache_generation(user_id)
+
+
+TOMBSTONE_KINDS = {
+    Workout: SyncTombstone.KIND_WORKOUT,
+    WorkoutSession: SyncTombstone.KIND_SESSION,
+}
+
+
+@receiver(post_delete, sender=Workout)
+@receiver(post_delete, sender=WorkoutSession)
+def record_tombstone(sender, instance, origin=None, **kwargs):
+    # Só a exclusão direta: as em cascata estão implícitas na da origem. Os
+    # exercícios são registrados em Exercise.delete.
+    if not _cascaded(sender, instance, origin):
+        SyncTombstone.objects.record(
+            instance.user_id, TOMBSTONE_KINDS[sender], instance.id
+        )
+
+
+def _owner_id(instance, field, model):
+    # Usa o objeto relacionado já carregado quando possível
+    if instance._meta.get_field(field).is_cached(instance):
+        return getattr(instance, field).user_id
+    return (
+        model.objects.filter(id=getattr(instance, f"{field}_id"))
+        .values_list("user_id", flat=True)
+        .first()
+    )
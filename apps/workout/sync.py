@@ -0,0 +1,107 @@
+# apps/workout/sync.py
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.utils import timezone
+
+from .models import (
+    Exercise,
+    ExerciseSession,
+    Series,
+    SyncTombstone,
+    Workout,
+    WorkoutSession,
+)
+
+# Versão do formato das respostas e dos tokens (a mesma da URL, /api/v1/)
+SYNC_VERSION = 1
+# O token volta um pouco no tempo: uma gravação com updated_at anterior ao
+# token mas confirmada só depois dele é enviada de novo na próxima vez, em
+# vez de se perder. O aplicativo aplica as linhas pelo id, então repetir
+# não tem efeito.
+SYNC_OVERLAP = timedelta(seconds=5)
+# Séries aceitas por envio
+MAX_UPLOAD_SETS = 500
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Colunas enviadas de cada entidade. As linhas vão como listas, na ordem de
+# "fields", para não repetir os nomes dos campos em cada objeto.
+FIELDS = {
+    "workouts": ("id", "name", "description", "order_id", "completed"),
+    "exercises": ("id", "workout_id", "name", "sets", "repetitions", "rpe"),
+    "sessions": ("id", "workout_id", "date", "completed"),
+    "exercise_sessions": ("id", "workout_session_id", "exercise_id", "sets", "rpe"),
+    "series": (
+        "id",
+        "exercise_session_id",
+        "set_number",
+        "weight_used",
+        "repetitions",
+        "version",
+    ),
+}
+
+
+class InvalidToken(ValueError):
+    pass
+
+
+def make_token(moment):
+    return f"{SYNC_VERSION}:{(moment - _EPOCH) // _MICROSECOND}"
+
+
+def parse_token(token):
+    """Momento representado pelo token; InvalidToken se ele não é válido."""
+    version, _, micros = token.partition(":")
+    try:
+        if int(version) != SYNC_VERSION:
+            raise InvalidToken
+        return _EPOCH + int(micros) * _MICROSECOND
+    except (ValueError, OverflowError):
+        raise InvalidToken
+
+
+def _querysets(user):
+    return {
+        "workouts": Workout.objects.filter(user=user),
+        "exercises": Exercise.objects.filter(workout__user=user),
+        "sessions": WorkoutSession.objects.filter(user=user),
+        "exercise_sessions": ExerciseSession.objects.filter(workout_session__user=user),
+        "series": Series.objects.filter(exercise_session__workout_session__user=user),
+    }
+
+
+def changes(user, token=None):
+    """O que mudou para o usuário desde o token, em uma única resposta.
+
+    Sem token, ou com um token mais antigo que a retenção das exclusões,
+    envia tudo com "reset": o aplicativo substitui os dados locais. Caso
+    contrário envia só as linhas com updated_at posterior ao token e, em
+    "deleted", os ids excluídos de cada entidade. O "token" da resposta deve
+    ser enviado na próxima sincronização.
+    """
+    started = timezone.now()
+    since = parse_token(token) if token else None
+    reset = since is None or since < started - SyncTombstone.RETENTION
+
+    data = {
+        "version": SYNC_VERSION,
+        "token": make_token(started - SYNC_OVERLAP),
+        "reset": reset,
+    }
+    for name, queryset in _querysets(user).items():
+        if not reset:
+            queryset = queryset.filter(updated_at__gt=since)
+        data[name] = {
+            "fields": FIELDS[name],
+            "rows": list(queryset.order_by("id").values_list(*FIELDS[name])),
+        }
+
+    deleted = {kind: [] for kind, _ in SyncTombstone.KIND_CHOICES}
+    if not reset:
+        tombstones = SyncTombstone.objects.filter(user=user, deleted_at__gt=since)
+        for kind, object_id in tombstones.values_list("kind", "object_id"):
+            deleted[kind].append(object_id)
+    data["deleted"] = deleted
+    return data
@@ -0,0 +1,29 @@
+# apps/workout/template_backends.py
+import time
+
+from django.template.backends.django import DjangoTemplates, Template
+
+from .metrics import add_template_time
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            add_template_time(time.perf_counter() - started)
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """Backend de templates do Django que mede o tempo de renderização.
+
+    Só o template renderizado pela view é medido; includes e extends
+    rodam dentro dele e já entram no tempo.
+    """
+
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name).template, self)
@@ -0,0 +1,432 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import IntegrityError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from .models import (
+    Workout,
+    Exercise,
+    WorkoutSession,
+    ExerciseSession,
+    WorkoutHistory,
+    ExerciseHistory,
+    ExerciseStat,
+)
+
+User = get_user_model()
+
+
+class UserRegisterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+
+    def register(self, **overrides):
+        data = {
+            "username": "novo",
+            "email": "novo@example.com",
+            "password": "password123",
+            "password_confirmation": "password123",
+            "tos_accept": "on",
+            **overrides,
+        }
+        return User.objects.register(**{key: [value] for key, value in data.items()})
+
+    def test_register_checks_duplicates_in_one_query(self):
+        with self.assertNumQueries(1):
+            result = self.register(username="testuser", email="test@example.com")
+        self.assertEqual(
+            result["errors"],
+            [
+                "Username is already registered to another user.",
+                "Email address is already registered to another user.",
+            ],
+        )
+
+    def test_register_creates_user(self):
+        result = self.register()
+        self.assertTrue(result["logged_in_user"].check_password("password123"))
+        self.assertTrue(result["logged_in_user"].tos_accept)
+
+
+class UserLoginTests(TestCase):
+    def login(self, username="testuser", password="password"):
+        return User.objects.login(username=[username], password=[password])
+
+    @override_settings(BCRYPT_ROUNDS=4)
+    def test_login_rehashes_when_work_factor_changes(self):
+        user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.assertIn("$04$", user.password)
+        with override_settings(BCRYPT_ROUNDS=5):
+            self.assertIn("logged_in_user", self.login())
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith("bcrypt_sha256$"))
+        self.assertIn("$05$", user.password)
+
+    @override_settings(
+        PASSWORD_HASHERS=["apps.workout.hashers.PBKDF2PasswordHasher"],
+        PBKDF2_ITERATIONS=1000,
+    )
+    def test_login_moves_password_to_preferred_hasher(self):
+        user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        with override_settings(
+            PASSWORD_HASHERS=[
+                "apps.workout.hashers.BCryptSHA256PasswordHasher",
+                "apps.workout.hashers.PBKDF2PasswordHasher",
+            ],
+            BCRYPT_ROUNDS=4,
+        ):
+            self.assertEqual(
+                self.login(password="errada")["errors"],
+                ["Nome de usuário ou senha estão incorretos."],
+            )
+            user.refresh_from_db()
+            self.assertTrue(user.password.startswith("pbkdf2_sha256$1000$"))
+
+            self.assertIn("logged_in_user", self.login())
+            user.refresh_from_db()
+            self.assertTrue(user.password.startswith("bcrypt_sha256$"))
+            self.assertIn("logged_in_user", self.login())
+
+    def test_default_hash_fits_password_column(self):
+        user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="p" * 200
+        )
+        self.assertLessEqual(
+            len(user.password), User._meta.get_field("password").max_length
+        )
+
+    @override_settings(BCRYPT_ROUNDS=4)
+    def test_unknown_user_still_hashes_password(self):
+        with patch("apps.workout.models.User.set_password") as set_password:
+            result = self.login(username="ninguem")
+        self.assertEqual(
+            result["errors"], ["Nome de usuário ou senha estão incorretos."]
+        )
+        set_password.assert_called_once_with("password")
+
+
+class WorkoutManagerTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+
+    def test_create_workout_success(self):
+        # Testando a criação bem-sucedida de um workout
+        workout_data = {
+            "name": "Treino A",
+            "description": "Treino para braços",
+            "user": self.user,
+            "order_id": 1,
+        }
+        result = Workout.objects.create_workout(**workout_data)
+        self.assertIn("workout", result)
+        workout = result["workout"]
+        self.assertEqual(workout.name, "Treino A")
+        self.assertEqual(workout.description, "Treino para braços")
+        self.assertEqual(workout.user, self.user)
+
+    def test_create_workout_failure(self):
+        # Testando a falha de criação por nome curto
+        workout_data = {
+            "name": "A",  # Nome com menos de 2 caracteres
+            "description": "Treino para braços",
+            "user": self.user,
+            "order_id": 1,
+        }
+        result = Workout.objects.create_workout(**workout_data)
+        self.assertIn("errors", result)
+        self.assertEqual(
+            result["errors"][0],
+            "O nome é obrigatório e deve ter pelo menos 2 caracteres.",
+        )
+
+        # Testando a falha de criação por descrição curta
+        workout_data["name"] = "Treino A"
+        workout_data["description"] = "A"  # Descrição com menos de 2 caracteres
+        result = Workout.objects.create_workout(**workout_data)
+        self.assertIn("errors", result)
+        self.assertEqual(
+            result["errors"][0],
+            "A descrição é obrigatória e deve ter pelo menos 2 caracteres.",
+        )
+
+
+class ExerciseManagerTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.workout = Workout.objects.create(
+            name="Treino A",
+            description="Treino de pernas",
+            user=self.user,
+            order_id=1,
+        )
+
+    def test_create_exercise_success(self):
+        # Testando a criação bem-sucedida de um exercício
+        exercise_data = {
+            "name": "Agachamento",
+            "sets": 4,
+            "repetitions": 12,
+            "rpe": 8,
+            "workout": self.workout,
+        }
+        result = Exercise.objects.create_exercise(**exercise_data)
+        self.assertIn("exercise", result)
+        exercise = result["exercise"]
+        self.assertEqual(exercise.name, "Agachamento")
+        self.assertEqual(exercise.sets, 4)
+        self.assertEqual(exercise.repetitions, 12)
+        self.assertEqual(exercise.rpe, 8)
+
+    def test_create_exercise_failure(self):
+        # Testando a falha de criação por nome curto
+        exercise_data = {
+            "name": "A",  # Nome com menos de 2 caracteres
+            "sets": 4,
+            "repetitions": 12,
+            "rpe": 8,
+            "workout": self.workout,
+        }
+        result = Exercise.objects.create_exercise(**exercise_data)
+        self.assertIn("errors", result)
+        self.assertEqual(
+            result["errors"][0],
+            "O nome do exercício é obrigatório e deve ter pelo menos 2 caracteres.",
+        )
+
+        # Testando a falha de criação por valores inválidos
+        exercise_data["name"] = "Agachamento"
+        exercise_data["sets"] = -1  # Valor inválido para sets
+        result = Exercise.objects.create_exercise(**exercise_data)
+        self.assertIn("errors", result)
+        self.assertEqual(
+            result["errors"][0],
+            "Séries, repetições devem ser positivos e RPE entre 1 e 10.",
+        )
+
+
+class WorkoutSessionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.workout = Workout.objects.create(
+            name="Treino A",
+            description="Treino de pernas",
+            user=self.user,
+            order_id=1,
+        )
+
+    def test_create_workout_session(self):
+        # Testando a criação de uma sessão de treino
+        workout_session = WorkoutSession.objects.create(
+            user=self.user, workout=self.workout
+        )
+        self.assertEqual(workout_session.user, self.user)
+        self.assertEqual(workout_session.workout, self.workout)
+        self.assertFalse(workout_session.completed)
+
+    def test_create_exercise_sessions(self):
+        # Criar exercícios para o treino
+        Exercise.objects.create(
+            name="Agachamento", sets=4, repetitions=12, rpe=8, workout=self.workout
+        )
+        Exercise.objects.create(
+            name="Leg Press", sets=3, repetitions=10, rpe=7, workout=self.workout
+        )
+
+        # Criar a sessão de treino
+        workout_session = WorkoutSession.objects.create(
+            user=self.user, workout=self.workout
+        )
+        workout_session.create_exercise_sessions()
+
+        # Verificar se os exercícios da sessão foram criados
+        exercises_sessions = ExerciseSession.objects.filter(
+            workout_session=workout_session
+        )
+        self.assertEqual(exercises_sessions.count(), 2)
+        self.assertEqual(exercises_sessions[0].exercise.name, "Agachamento")
+        self.assertEqual(exercises_sessions[1].exercise.name, "Leg Press")
+
+
+class CreateExerciseSessionsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.workout = Workout.objects.create(
+            name="Treino A", description="Treino de pernas", user=self.user
+        )
+        for i in range(15):
+            Exercise.objects.create(
+                name=f"Exercício {i}",
+                sets=4,
+                repetitions=12,
+                rpe=8,
+                workout=self.workout,
+            )
+        self.workout_session = WorkoutSession.objects.create(
+            user=self.user, workout=self.workout
+        )
+
+    def test_create_exercise_sessions_bulk(self):
+        # SELECT dos exercícios + SAVEPOINT, INSERT e RELEASE
+        with self.assertNumQueries(4):
+            self.workout_session.create_exercise_sessions()
+        self.assertEqual(self.workout_session.exercise_sessions.count(), 15)
+
+    def test_create_exercise_sessions_idempotent(self):
+        self.workout_session.create_exercise_sessions()
+        self.workout_session.create_exercise_sessions()
+        self.assertEqual(
+            self.workout_session.exercise_sessions.count(), 15
+        )  # Nenhuma ExerciseSession duplicada
+
+    def test_unique_exercise_per_session(self):
+        exercise = self.workout.exercise_set.first()
+        ExerciseSession.objects.create(
+            workout_session=self.workout_session, exercise=exercise, rpe=8
+        )
+        with self.assertRaises(IntegrityError):
+            ExerciseSession.objects.create(
+                workout_session=self.workout_session, exercise=exercise, rpe=8
+            )
+
+
+class WorkoutHistoryRecordTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.workout = Workout.objects.create(
+            name="Treino A", description="Treino de pernas", user=self.user
+        )
+        self.exercises = [
+            Exercise.objects.create(
+                name=f"Exercício {i}",
+                sets=4,
+                repetitions=12,
+                rpe=8,
+                workout=self.workout,
+            )
+            for i in range(6)
+        ]
+        self.values = {
+            f"{field}_{exercise.id}_{i}": i * 10
+            for exercise in self.exercises
+            for i in range(1, 5)
+            for field in ("weight", "repetitions")
+        }
+
+    def test_record_stores_set_number(self):
+        workout_history = WorkoutHistory.objects.record(
+            self.user, self.workout, self.values
+        )
+        rows = workout_history.exercise_histories.filter(exercise=self.exercises[0])
+        self.assertEqual(
+            list(rows.order_by("set_number").values_list("set_number", "weight_used")),
+            [(1, 10), (2, 20), (3, 30), (4, 40)],
+        )
+
+    def test_record_query_count(self):
+        # Antes: 1 INSERT do histórico + 1 SELECT + 1 INSERT por série (6x4 = 24)
+        with CaptureQueriesContext(connection) as per_row:
+            workout_history = WorkoutHistory.objects.create(
+                workout=self.workout, user=self.user, completed=True
+            )
+            for exercise in self.workout.exercise_set.all():
+                for i in range(1, exercise.sets + 1):
+                    ExerciseHistory.objects.create(
+                        workout_history=workout_history,
+                        exercise=exercise,
+                        set_number=i,
+                        sets=exercise.sets,
+                        rpe=exercise.rpe,
+                    )
+        self.assertEqual(len(per_row), 26)
+
+        # Agora: constante, independente do tamanho (inclui as estatísticas)
+        with self.assertNumQueries(9):
+            WorkoutHistory.objects.record(self.user, self.workout, self.values)
+
+
+class ExerciseStatTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.workout = Workout.objects.create(
+            name="Treino A", description="Treino de pernas", user=self.user
+        )
+        self.exercise = Exercise.objects.create(
+            name="Agachamento", sets=3, repetitions=10, rpe=8, workout=self.workout
+        )
+        self.values = {
+            f"weight_{self.exercise.id}_1": "100",
+            f"repetitions_{self.exercise.id}_1": "5",
+            f"weight_{self.exercise.id}_2": "80",
+            f"repetitions_{self.exercise.id}_2": "10",
+            f"weight_{self.exercise.id}_3": "60",
+            f"repetitions_{self.exercise.id}_3": "0",  # Série não realizada
+        }
+
+    def stats(self):
+        return {
+            stat.period: stat
+            for stat in ExerciseStat.objects.filter(
+                user=self.user, exercise=self.exercise
+            )
+        }
+
+    def test_record_updates_stats(self):
+        WorkoutHistory.objects.record(self.user, self.workout, self.values)
+        stats = self.stats()
+        self.assertEqual(
+            set(stats), {ExerciseStat.PERIOD_DAY, ExerciseStat.PERIOD_WEEK}
+        )
+        day = stats[ExerciseStat.PERIOD_DAY]
+        self.assertEqual(day.sets, 2)
+        self.assertEqual(day.repetitions, 15)
+        self.assertEqual(day.tonnage, Decimal("1300"))
+        # Epley: 100 x (1 + 5/30) = 116.7; 80 x (1 + 10/30) = 106.7
+        self.assertEqual(day.e1rm_epley, Decimal("116.7"))
+        self.assertEqual((day.best_weight, day.best_repetitions), (100, 5))
+        # Brzycki: 100 x 36 / 32 = 112.5
+        self.assertEqual(day.e1rm_brzycki, Decimal("112.5"))
+        self.assertEqual(stats[ExerciseStat.PERIOD_WEEK].period_start.weekday(), 0)
+
+    def test_record_merges_into_existing_period(self):
+        WorkoutHistory.objects.record(self.user, self.workout, self.values)
+        WorkoutHistory.objects.record(self.user, self.workout, self.values)
+        day = self.stats()[ExerciseStat.PERIOD_DAY]
+        self.assertEqual(day.sets, 4)
+        self.assertEqual(day.tonnage, Decimal("2600"))
+        self.assertEqual(day.e1rm_epley, Decimal("116.7"))
+
+    def test_rebuild_matches_incremental(self):
+        WorkoutHistory.objects.record(self.user, self.workout, self.values)
+        WorkoutHistory.objects.record(self.user, self.workout, self.values)
+        incremental = {
+            period: (s.sets, s.repetitions, s.tonnage, s.e1rm_epley, s.e1rm_brzycki)
+            for period, s in self.stats().items()
+        }
+        ExerciseStat.objects.all().delete()
+
+        self.assertEqual(ExerciseStat.objects.rebuild(self.user), 2)
+        rebuilt = {
+            period: (s.sets, s.repetitions, s.tonnage, s.e1rm_epley, s.e1rm_brzycki)
+            for period, s in self.stats().items()
+        }
+        self.assertEqual(rebuilt, incremental)
@@ -1,7 +1,58 @@
 from django.test import TestCase
-from django.urls import reverse
+from django.urls import resolve, reverse
 from django.contrib.auth import get_user_model
-from .models import Workout, Exercise, WorkoutSession, ExerciseSession
+from .models import (
+    Workout,
+    Exercise,
+    WorkoutSession,
+    ExerciseSession,
+    ExerciseHistory,
+    WorkoutHistory,
+    ImportJob,
+    Series,
+    ExerciseStat,
+    SyncTombstone,
+)
+from .importers import import_rows, import_workouts, read_rows, REQUIRED_COLUMNS
+from .jobs import run_job
+from .management.commands.run_jobs import Heartbeat
+from .caching import bump_cache_generation, cache_generation
+from .context_processors import current_session_status
+from .metrics import JsonFormatter, registry as request_metrics
+from .middleware import PerformanceMiddleware
+from .provisioning import provision_members
+from .querywatch import query_report
+from . import analytics, seeding, sync
+from .management.commands.benchmark_analytics import (
+    naive_analytics,
+    vectorized_analytics,
+)
+from . import urls
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.contrib.staticfiles import finders
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.template import engines
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.conf import settings
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils import timezone
+from django.test.utils import CaptureQueriesContext
+from openpyxl import Workbook
+from tempfile import TemporaryDirectory
+from unittest import skipUnless
+from unittest.mock import patch
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+import io
+import json
+import os
+import subprocess
+import threading
+import sys
+import numpy as np
 
 User = get_user_model()
 
@@ -121,3 +172,1729 @@ class AllWorkoutsViewTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "workout/all_workouts.html")
         self.assertContains(response, self.workout.name)
+
+
+class ImportWorkoutsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+
+    def make_csv(self, last_rpe=9):
+        content = (
+            " order_id ;Grupo;Exercicio;séries;repetições;RPE\n"
+            "1;Pernas;Agachamento;4;12;8\n"
+            "1;Pernas;Leg Press;3;10;7\n"
+            "\n"
+            f"2;Costas;Remada;4;8;{last_rpe}\n"
+        )
+        return SimpleUploadedFile("treinos.csv", content.encode("utf-8"))
+
+    def make_xlsx(self):
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(["order_id", "Grupo", "Exercicio", "séries", "repetições", "RPE"])
+        sheet.append([1, "Pernas", "Agachamento", 4, 12, 8])
+        sheet.append([2, "Costas", "Remada", 4, 8, 9])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        return SimpleUploadedFile("treinos.xlsx", buffer.getvalue())
+
+    def test_import_workouts_csv(self):
+        result = import_workouts(self.user, self.make_csv())
+        self.assertEqual(result["report"]["rows"], 3)  # Linhas em branco são ignoradas
+        self.assertEqual(result["report"]["workouts"], 2)
+        self.assertEqual(result["report"]["exercises"], 3)
+        pernas = Workout.objects.get(user=self.user, order_id=1)
+        self.assertEqual(pernas.name, "Pernas")
+        self.assertEqual(pernas.exercise_set.count(), 2)
+
+    def test_import_workouts_xlsx(self):
+        result = import_workouts(self.user, self.make_xlsx())
+        self.assertEqual(result["report"]["exercises"], 2)
+        self.assertEqual(
+            Exercise.objects.get(workout__order_id=2, workout__user=self.user).name,
+            "Remada",
+        )
+
+    def test_import_workouts_batches_exercises(self):
+        rows = (
+            (
+                line,
+                {
+                    "order_id": 1,
+                    "Grupo": "Pernas",
+                    "Exercicio": f"Ex {line}",
+                    "séries": 3,
+                    "repetições": 10,
+                    "RPE": 8,
+                },
+            )
+            for line in range(2, 12)
+        )
+        with patch("apps.workout.importers.BATCH_SIZE", 4):
+            # savepoint, treino, 3 lotes de exercícios, release
+            with self.assertNumQueries(6):
+                result = import_rows(self.user, list(REQUIRED_COLUMNS), rows)
+        self.assertEqual(result["report"]["exercises"], 10)
+
+    def test_import_workouts_validates_before_writing(self):
+        result = import_workouts(self.user, self.make_csv(last_rpe=11))
+        self.assertIn("errors", result)
+        self.assertIn("Linha 5", result["errors"][0])
+        self.assertFalse(
+            Workout.objects.filter(user=self.user).exists()
+        )  # Nada deve ser gravado
+
+    def test_import_workouts_rejects_fractional_numbers(self):
+        def row(repetitions):
+            return {
+                "order_id": "1",
+                "Grupo": "Pernas",
+                "Exercicio": "Agachamento",
+                "séries": "4,0",
+                "repetições": repetitions,
+                "RPE": "8",
+            }
+
+        for repetitions in ("4.5", "4,5", "nan"):
+            result = import_rows(
+                self.user, list(REQUIRED_COLUMNS), iter([(2, row(repetitions))])
+            )
+            self.assertIn("Linha 2", result["errors"][0])  # Não é truncado para 4
+        self.assertFalse(Workout.objects.filter(user=self.user).exists())
+
+        result = import_rows(self.user, list(REQUIRED_COLUMNS), iter([(2, row("12"))]))
+        self.assertEqual(result["report"]["exercises"], 1)
+        self.assertEqual(Exercise.objects.get(workout__user=self.user).sets, 4)
+
+    def test_import_workouts_missing_column(self):
+        arquivo = SimpleUploadedFile("treinos.csv", b"order_id,Grupo\n1,Pernas\n")
+        result = import_workouts(self.user, arquivo)
+        self.assertIn("'Exercicio'", result["errors"][0])
+
+    def test_importar_treinos_view(self):
+        self.client.force_login(self.user)
+        with TemporaryDirectory() as media_root, self.settings(MEDIA_ROOT=media_root):
+            response = self.client.post(
+                reverse("importar_treinos"), {"arquivo_excel": self.make_csv()}
+            )
+            job = ImportJob.objects.get(user=self.user)
+            self.assertRedirects(
+                response,
+                f"{reverse('all_workouts')}?job={job.id}",
+                fetch_redirect_response=False,
+            )  # A requisição retorna antes de importar
+            self.assertFalse(Exercise.objects.filter(workout__user=self.user).exists())
+
+            self.assertEqual(ImportJob.objects.claim(5), [job.id])
+            self.assertEqual(run_job(job.id), ImportJob.STATUS_DONE)
+        self.assertEqual(Exercise.objects.filter(workout__user=self.user).count(), 3)
+
+        response = self.client.get(reverse("job_status", args=[job.id]))
+        self.assertEqual(response.json()["status"], "done")
+        self.assertEqual(response.json()["result"]["report"]["exercises"], 3)
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.client.force_login(self.user)
+
+    def export(self, formato, **params):
+        response = self.client.get(reverse("export_history", args=[formato]), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content)
+
+    def test_workouts_export_round_trips_into_import(self):
+        content = (
+            "order_id;Grupo;Exercicio;séries;repetições;RPE\n"
+            "1;Pernas;Agachamento;4;12;8\n"
+            "1;Pernas;Leg Press;3;10;7\n"
+            "2;Costas;Remada;4;8;9\n"
+        )
+        import_workouts(
+            self.user, SimpleUploadedFile("treinos.csv", content.encode("utf-8"))
+        )
+        # Treino criado pela interface, sem order_id
+        bracos = Workout.objects.create(
+            name="Braços", description="Treino", user=self.user
+        )
+        Exercise.objects.create(
+            name="Rosca", sets=3, repetitions=12, rpe=8, workout=bracos
+        )
+        for formato in ("csv", "xlsx"):
+            with self.subTest(formato=formato):
+                response, content = self.export(formato, conteudo="treinos")
+                self.assertIn(
+                    f'filename="treinos.{formato}"', response["Content-Disposition"]
+                )
+                other = User.objects.create_user(
+                    username=f"outro{formato}",
+                    email=f"outro{formato}@example.com",
+                    password="password",
+                )
+                arquivo = SimpleUploadedFile(f"treinos.{formato}", content)
+                result = import_workouts(other, arquivo)
+                self.assertEqual(result["report"]["workouts"], 3)
+
+                def plan(user):
+                    return sorted(
+                        Exercise.objects.filter(workout__user=user).values_list(
+                            "workout__name", "name", "sets", "repetitions", "rpe"
+                        )
+                    )
+
+                self.assertEqual(plan(other), plan(self.user))
+                self.assertEqual(
+                    Workout.objects.get(user=other, name="Braços").order_id, 3
+                )
+
+    def test_history_export_summarizes_each_exercise_in_constant_queries(self):
+        seeding.seed_user_data(
+            self.user, workouts=2, exercises=2, sessions=30, sets=3, open_session=False
+        )
+        with patch("apps.workout.exporters.EXPORT_CHUNK_SIZE", 2):
+            # Sessão e usuário, os treinos e uma única consulta lida em lotes
+            with self.assertNumQueries(4):
+                response, content = self.export("csv")
+        self.assertTrue(content.startswith(b"\xef\xbb\xbf"))
+
+        columns, rows = read_rows(SimpleUploadedFile("historico.csv", content))
+        rows = [row for _, row in rows]
+        self.assertEqual(columns[: len(REQUIRED_COLUMNS)], list(REQUIRED_COLUMNS))
+        self.assertEqual(columns[-1], "Última data")
+        # Uma linha por exercício, não por série registrada
+        self.assertEqual(len(rows), 2 * 2)
+        sets_done = ExerciseHistory.objects.filter(workout_history__user=self.user)
+        self.assertEqual(
+            sum(int(row["Séries feitas"]) for row in rows), sets_done.count()
+        )
+
+    def test_history_export_round_trips_into_import(self):
+        seeding.seed_user_data(
+            self.user, workouts=2, exercises=2, sessions=10, sets=3, open_session=False
+        )
+
+        def plan(user):
+            return sorted(
+                Exercise.objects.filter(workout__user=user).values_list(
+                    "workout__name", "name", "sets", "repetitions", "rpe"
+                )
+            )
+
+        for formato in ("csv", "xlsx"):
+            with self.subTest(formato=formato):
+                response, content = self.export(formato)
+                other = User.objects.create_user(
+                    username=f"outro{formato}",
+                    email=f"outro{formato}@example.com",
+                    password="password",
+                )
+                result = import_workouts(
+                    other, SimpleUploadedFile(f"historico.{formato}", content)
+                )
+                self.assertNotIn("errors", result)
+                self.assertEqual(plan(other), plan(self.user))
+
+    def test_unknown_format_is_not_found(self):
+        self.assertEqual(
+            self.client.get(reverse("export_history", args=["pdf"])).status_code, 404
+        )
+        self.assertEqual(
+            self.client.get(
+                reverse("export_history", args=["csv"]), {"conteudo": "senhas"}
+            ).status_code,
+            404,
+        )
+
+
+class ImportJobTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.client.force_login(self.user)
+        self.workout = Workout.objects.create(
+            name="Treino A", description="Treino de pernas", user=self.user
+        )
+
+    def test_claim_is_exclusive(self):
+        job = ImportJob.objects.enqueue(self.user, ImportJob.KIND_COMPLETE_WORKOUT)
+        self.assertEqual(ImportJob.objects.claim(1), [job.id])
+        self.assertEqual(
+            ImportJob.objects.claim(1), []
+        )  # Um job reservado não é entregue a outro worker
+
+    def test_run_jobs_fails_stale_running_jobs(self):
+        stale = ImportJob.objects.enqueue(self.user, ImportJob.KIND_COMPLETE_WORKOUT)
+        alive = ImportJob.objects.enqueue(self.user, ImportJob.KIND_COMPLETE_WORKOUT)
+        ImportJob.objects.claim(2)
+        two_hours_ago = timezone.now() - timedelta(hours=2)
+        ImportJob.objects.update(started_at=two_hours_ago, heartbeat_at=two_hours_ago)
+        # Um job demorado cujo worker continua ativo renova o heartbeat
+        ImportJob.objects.heartbeat([alive.id])
+
+        # O worker que reservou o outro job foi encerrado; um novo worker inicia
+        with patch.object(ImportJob.objects, "claim", return_value=[]):
+            call_command("run_jobs", workers=0, once=True, stdout=io.StringIO())
+        stale.refresh_from_db()
+        alive.refresh_from_db()
+        self.assertEqual(stale.status, ImportJob.STATUS_FAILED)
+        self.assertIsNotNone(stale.finished_at)
+        self.assertIn("interrompido", stale.result["errors"][0])
+        self.assertEqual(alive.status, ImportJob.STATUS_RUNNING)
+
+    def test_heartbeat_renews_jobs_of_this_worker(self):
+        heartbeat = Heartbeat(interval=0.01)
+        heartbeat.add(7)
+        renewed = threading.Event()
+        with patch.object(
+            ImportJob.objects, "heartbeat", side_effect=lambda ids: renewed.set()
+        ) as renew:
+            heartbeat.start()
+            self.assertTrue(renewed.wait(5))
+            heartbeat.stop()
+        renew.assert_called_with([7])
+
+    def test_import_job_returns_json(self):
+        with TemporaryDirectory() as media_root, self.settings(MEDIA_ROOT=media_root):
+            response = self.client.post(
+                reverse("importar_treinos"),
+                {"arquivo_excel": SimpleUploadedFile("t.csv", b"order_id\n1\n")},
+                headers={"x-requested-with": "XMLHttpRequest"},
+            )
+            self.assertEqual(response.status_code, 202)
+            job_id = response.json()["job_id"]
+            run_job(job_id)
+        response = self.client.get(response.json()["status_url"])
+        self.assertEqual(response.json()["status"], "failed")
+        self.assertIn("'Grupo'", response.json()["result"]["errors"][0])
+
+    def test_complete_workout_records_history_in_background(self):
+        exercise = Exercise.objects.create(
+            name="Agachamento", sets=2, repetitions=12, rpe=8, workout=self.workout
+        )
+        self.client.post(
+            reverse("complete_workout", args=[self.workout.id]),
+            {f"weight_{exercise.id}_1": 50, f"repetitions_{exercise.id}_1": 10},
+        )
+        self.assertFalse(ExerciseHistory.objects.exists())
+
+        job = ImportJob.objects.get(kind=ImportJob.KIND_COMPLETE_WORKOUT)
+        run_job(job.id)
+        histories = ExerciseHistory.objects.filter(exercise=exercise)
+        self.assertEqual(histories.count(), 2)  # Uma linha por série
+        self.assertEqual(histories.first().weight_used, 50)
+        self.assertEqual(
+            histories.first().workout_history.workout_session,
+            WorkoutSession.objects.get(workout=self.workout, completed=True),
+        )  # O histórico fica ligado à sessão concluída
+
+    def test_complete_workout_rejects_invalid_values(self):
+        exercise = Exercise.objects.create(
+            name="Agachamento", sets=2, repetitions=12, rpe=8, workout=self.workout
+        )
+        for weight, repetitions in (("abc", 10), ("NaN", 10), (-5, 10), (50, "4.5")):
+            response = self.client.post(
+                reverse("complete_workout", args=[self.workout.id]),
+                {
+                    f"weight_{exercise.id}_1": weight,
+                    f"repetitions_{exercise.id}_1": repetitions,
+                },
+            )
+            self.assertRedirects(
+                response, f"/workout/{self.workout.id}", fetch_redirect_response=False
+            )
+        # Nada foi enfileirado nem marcado como concluído
+        self.assertFalse(ImportJob.objects.exists())
+        self.assertFalse(WorkoutSession.objects.filter(completed=True).exists())
+
+    def test_complete_workout_history_uses_completion_date(self):
+        exercise = Exercise.objects.create(
+            name="Agachamento", sets=1, repetitions=12, rpe=8, workout=self.workout
+        )
+        self.client.post(
+            reverse("complete_workout", args=[self.workout.id]),
+            {f"weight_{exercise.id}_1": 50, f"repetitions_{exercise.id}_1": 10},
+        )
+        # O worker roda o job só no dia seguinte
+        job = ImportJob.objects.get(kind=ImportJob.KIND_COMPLETE_WORKOUT)
+        completed_at = datetime.fromisoformat(job.payload["completed_at"])
+        with patch(
+            "django.utils.timezone.now",
+            return_value=completed_at + timedelta(days=1),
+        ):
+            run_job(job.id)
+        self.assertEqual(WorkoutHistory.objects.get().date, completed_at)
+        day = ExerciseStat.objects.get(
+            exercise=exercise, period=ExerciseStat.PERIOD_DAY
+        )
+        self.assertEqual(day.period_start, timezone.localdate(completed_at))
+
+    def test_complete_workout_uses_series_of_session_in_progress(self):
+        exercise = Exercise.objects.create(
+            name="Agachamento", sets=2, repetitions=12, rpe=8, workout=self.workout
+        )
+        session = WorkoutSession.objects.create(user=self.user, workout=self.workout)
+        session.create_exercise_sessions()
+        exercise_session = session.exercise_sessions.get()
+        Series.objects.save_sets(
+            session,
+            [
+                {
+                    "exercise_session": exercise_session.id,
+                    "set_number": 1,
+                    "weight": "100",
+                    "repetitions": 5,
+                },
+                {
+                    "exercise_session": exercise_session.id,
+                    "set_number": 2,
+                    "weight": "80",
+                    "repetitions": 8,
+                },
+            ],
+        )
+
+        # O formulário "Concluir Treino" envia só a sessão
+        self.client.post(
+            reverse("complete_workout", args=[self.workout.id]),
+            {"workout_session": session.id},
+        )
+        session.refresh_from_db()
+        self.assertTrue(session.completed)  # A sessão em andamento é concluída
+        self.assertEqual(WorkoutSession.objects.count(), 1)
+
+        run_job(ImportJob.objects.get(kind=ImportJob.KIND_COMPLETE_WORKOUT).id)
+        history = WorkoutHistory.objects.get()
+        self.assertEqual(history.workout_session, session)
+        self.assertEqual(
+            list(
+                history.exercise_histories.order_by("set_number").values_list(
+                    "weight_used", "actual_repetitions"
+                )
+            ),
+            [(Decimal("100.0"), 5), (Decimal("80.0"), 8)],
+        )
+        day = ExerciseStat.objects.get(
+            exercise=exercise, period=ExerciseStat.PERIOD_DAY
+        )
+        self.assertEqual((day.sets, day.tonnage), (2, Decimal("1140")))
+
+    def test_job_status_does_not_invalidate_cache(self):
+        job = ImportJob.objects.enqueue(self.user, ImportJob.KIND_COMPLETE_WORKOUT)
+        ImportJob.objects.filter(id=job.id).update(status=ImportJob.STATUS_DONE)
+        generation = cache_generation(self.user.id)
+        for _ in range(3):
+            response = self.client.get(reverse("job_status", args=[job.id]))
+            self.assertEqual(response.json()["status"], "done")
+        self.assertEqual(cache_generation(self.user.id), generation)
+
+    def test_job_status_of_another_user(self):
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="password"
+        )
+        job = ImportJob.objects.enqueue(other, ImportJob.KIND_COMPLETE_WORKOUT)
+        response = self.client.get(reverse("job_status", args=[job.id]))
+        self.assertEqual(response.status_code, 404)
+
+
+class ViewHistorySessionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.client.force_login(self.user)
+        self.workout = Workout.objects.create(
+            name="Treino A", description="Treino de pernas", user=self.user
+        )
+        self.exercise = Exercise.objects.create(
+            name="Agachamento", sets=3, repetitions=12, rpe=8, workout=self.workout
+        )
+
+    def complete_session(self, weight):
+        session = WorkoutSession.objects.create(
+            user=self.user, workout=self.workout, completed=True
+        )
+        values = {f"weight_{self.exercise.id}_{i}": weight for i in range(1, 4)}
+        WorkoutHistory.objects.record(self.user, self.workout, values, session)
+        return session
+
+    def test_only_rows_of_the_session(self):
+        self.complete_session(weight=40)
+        session = self.complete_session(weight=60)
+        response = self.client.get(reverse("view_history_session", args=[session.id]))
+        weights = [h.weight_used for h in response.context["exercise_histories"]]
+        self.assertEqual(weights, [60, 60, 60])  # Sem linhas de outras sessões
+
+    def test_query_count_independent_of_lifetime_history(self):
+        session = self.complete_session(weight=60)
+        url = reverse("view_history_session", args=[session.id])
+        with CaptureQueriesContext(connection) as before:
+            self.client.get(url)
+        for _ in range(10):
+            self.complete_session(weight=40)
+        with self.assertNumQueries(len(before)):
+            self.client.get(url)
+
+
+class QueryBudgetMixin:
+    """Asserções de orçamento de consultas para views.
+
+    assertQueryBudget falha quando a requisição executa mais consultas do que
+    o orçamento declarado, listando as consultas executadas.
+    """
+
+    def assertQueryBudget(self, budget, method, url, data=None, **extra):
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, data or {}, **extra)
+        if len(queries) > budget:
+            executed = "\n".join(
+                f"{i}. {query['sql']}" for i, query in enumerate(queries, start=1)
+            )
+            self.fail(
+                f"{method.upper()} {url} executou {len(queries)} consultas "
+                f"(orçamento: {budget}):\n{executed}"
+            )
+        return response
+
+
+def seed_query_budget_dataset(user, sessions=1000, workouts=20, exercises=5, sets=4):
+    """Gera um conjunto de dados realista para os testes de orçamento."""
+    return seeding.seed_user_data(
+        user,
+        workouts=workouts,
+        exercises=exercises,
+        sessions=sessions,
+        sets=sets,
+        open_session=False,
+    )
+
+
+class QueryBudgetTests(QueryBudgetMixin, TestCase):
+    # Orçamento de consultas por view de urls.py. Inclui a sessão, o usuário
+    # autenticado e o context processor current_session_status.
+    BUDGETS = {
+        "root": ("get", 2),
+        "login": ("get", 2),
+        "register": ("get", 3),
+        "logout": ("get", 4),
+        "dashboard": ("get", 4),
+        "new_workout": ("get", 3),
+        "all_workouts": ("get", 5),
+        "view_workout": ("get", 5),
+        "add_exercise": ("post", 4),
+        # Inclui SAVEPOINT/RELEASE da escrita, a sessão em andamento com as
+        # suas séries e os exercícios da validação
+        "complete_workout": ("post", 11),
+        "edit_workout": ("get", 4),
+        "delete_workout": ("post", 18),  # Uma exclusão em lote por tabela da cascata
+        "view_session": ("get", 6),
+        "save_session_series": ("post", 8),
+        "save_series": ("patch", 8),
+        "current_session": ("get", 3),
+        "start_workout_session": ("post", 10),  # Idem
+        "session_history": ("get", 4),
+        "view_history_session": ("get", 5),
+        "importar_treinos": ("get", 3),
+        "export_history": ("get", 2),  # As linhas são lidas no streaming
+        "provision_members": ("post", 2),
+        "job_status": ("get", 3),
+        "chart_volume": ("get", 4),
+        "chart_exercise_progress": ("get", 5),
+        "chart_frequency": ("get", 4),
+        "sync_changes": ("get", 8),  # Uma consulta por entidade e as exclusões
+        "sync_upload": ("post", 2),
+        "settings": ("get", 3),
+        "metrics": ("get", 2),
+        "query_report": ("get", 2),
+        "tos": ("get", 3),
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        cls.workouts, cls.sessions = seed_query_budget_dataset(cls.user)
+
+        cls.workout = cls.workouts[0]
+        cls.session = WorkoutSession.objects.create(user=cls.user, workout=cls.workout)
+        cls.session.create_exercise_sessions()
+        for exercise_session in cls.session.exercise_sessions.all():
+            for i in range(1, exercise_session.sets + 1):
+                exercise_session.series.create(
+                    set_number=i, weight_used=50, repetitions=10
+                )
+        cls.job = ImportJob.objects.enqueue(cls.user, ImportJob.KIND_IMPORT)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def url_args(self, name):
+        if name == "delete_workout":
+            # Com exercícios e histórico: a exclusão em cascata deve ser feita
+            # em lote, e não uma linha por vez
+            disposable = Workout.objects.create(
+                name="Descartável", description="Treino", user=self.user
+            )
+            Exercise.objects.bulk_create(
+                Exercise(
+                    name=f"Exercício {i}", sets=4, repetitions=10, workout=disposable
+                )
+                for i in range(5)
+            )
+            for _ in range(20):
+                session = WorkoutSession.objects.create(
+                    user=self.user, workout=disposable, completed=True
+                )
+                WorkoutHistory.objects.record(self.user, disposable, {}, session)
+            return [disposable.id]
+        return {
+            "view_workout": [self.workout.id],
+            "add_exercise": [self.workout.id],
+            "complete_workout": [self.workout.id],
+            "edit_workout": [self.workout.id],
+            "delete_workout": [],
+            "view_session": [self.session.id],
+            "save_session_series": [self.session.id],
+            "save_series": [self.session.exercise_sessions.first().id, 1],
+            "start_workout_session": [self.workout.id],
+            "view_history_session": [self.sessions[0].id],
+            "job_status": [self.job.id],
+            "export_history": ["csv"],
+        }.get(name, [])
+
+    def url_data(self, name):
+        if name == "save_series":
+            return {
+                "data": {"weight": 62.5, "repetitions": 8},
+                "content_type": "application/json",
+            }
+        if name == "save_session_series":
+            exercise_session = self.session.exercise_sessions.first()
+            sets = [
+                {
+                    "exercise_session": exercise_session.id,
+                    "set_number": i,
+                    "weight": 60,
+                    "repetitions": 8,
+                }
+                for i in range(1, exercise_session.sets + 1)
+            ]
+            return {"data": {"sets": sets}, "content_type": "application/json"}
+        return {"data": {"name": "Supino", "repetitions": 10, "rpe": 8, "sets": 3}}
+
+    def test_every_view_has_a_budget(self):
+        names = {pattern.name for pattern in urls.urlpatterns}
+        self.assertEqual(
+            names - set(self.BUDGETS), set()
+        )  # Toda nova view precisa declarar seu orçamento
+
+    def test_views_within_query_budget(self):
+        for name, (method, budget) in self.BUDGETS.items():
+            with self.subTest(view=name):
+                self.client.force_login(self.user)
+                url = reverse(name, args=self.url_args(name))
+                self.assertQueryBudget(budget, method, url, **self.url_data(name))
+
+
+class SessionSeriesTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.client.force_login(self.user)
+        self.workout = Workout.objects.create(
+            name="Treino A", description="Treino de pernas", user=self.user
+        )
+        for name in ("Agachamento", "Leg Press"):
+            Exercise.objects.create(
+                name=name, sets=4, repetitions=12, rpe=8, workout=self.workout
+            )
+        self.session = WorkoutSession.objects.create(
+            user=self.user, workout=self.workout
+        )
+        self.session.create_exercise_sessions()
+        self.agachamento, self.leg_press = self.session.exercise_sessions.order_by("id")
+
+    def test_view_session_post_keeps_every_set(self):
+        data = {
+            f"{field}_{self.agachamento.id}_{i}": i * 10
+            for i in range(1, 5)
+            for field in ("weight", "repetitions")
+        }
+        response = self.client.post(
+            reverse("view_session", args=[self.session.id]), data
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            list(
+                self.agachamento.series.order_by("set_number").values_list(
+                    "set_number", "weight_used", "repetitions"
+                )
+            ),
+            [(1, 10, 10), (2, 20, 20), (3, 30, 30), (4, 40, 40)],
+        )  # Cada série guarda o próprio valor
+
+    def test_save_sets_bulk(self):
+        entries = [
+            {
+                "exercise_session": es.id,
+                "set_number": i,
+                "weight": 50,
+                "repetitions": 10,
+            }
+            for es in (self.agachamento, self.leg_press)
+            for i in range(1, 5)
+        ]
+        # ExerciseSessions, SAVEPOINT, séries existentes, INSERT, RELEASE
+        with self.assertNumQueries(5):
+            result = Series.objects.save_sets(self.session, entries)
+        self.assertEqual((result["created"], result["updated"]), (8, 0))
+
+        entries[0]["weight"] = 55
+        # ExerciseSessions, SAVEPOINT, séries existentes, UPDATE, RELEASE
+        with self.assertNumQueries(5):
+            result = Series.objects.save_sets(self.session, entries)
+        self.assertEqual(
+            (result["created"], result["updated"]), (0, 1)
+        )  # Apenas a série alterada é gravada
+
+    def test_save_session_series_json(self):
+        url = reverse("save_session_series", args=[self.session.id])
+        sets = [
+            {
+                "exercise_session": self.leg_press.id,
+                "set_number": 2,
+                "weight": "62.5",
+                "repetitions": 8,
+            }
+        ]
+        response = self.client.post(
+            url, {"sets": sets}, content_type="application/json"
+        )
+        self.assertEqual(response.json()["created"], 1)
+        self.assertEqual(
+            self.leg_press.series.get(set_number=2).weight_used, Decimal("62.5")
+        )
+
+        sets[0]["set_number"] = 5  # O exercício tem apenas 4 séries
+        response = self.client.post(
+            url, {"sets": sets}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def patch_series(self, exercise_session, set_number, **data):
+        url = reverse("save_series", args=[exercise_session.id, set_number])
+        return self.client.patch(url, data, content_type="application/json")
+
+    def test_save_series_patch(self):
+        response = self.patch_series(
+            self.agachamento, 1, weight=80, repetitions=5, version=0
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["sets"][0]["version"], 1)
+
+        response = self.patch_series(
+            self.agachamento, 1, weight=85, repetitions=5, version=1
+        )
+        self.assertEqual(response.json()["sets"][0]["version"], 2)
+        self.assertEqual(
+            self.agachamento.series.get(set_number=1).weight_used, Decimal("85")
+        )
+
+    def test_save_series_rejects_non_finite_weight(self):
+        for weight in ("NaN", "sNaN", "Infinity", "-inf"):
+            with self.subTest(weight=weight):
+                response = self.patch_series(
+                    self.agachamento, 1, weight=weight, repetitions=5
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(
+                    response.json()["errors"],
+                    ["Série inválida: exercício, série, peso ou repetições."],
+                )
+        self.assertFalse(self.agachamento.series.exists())
+
+    def test_save_series_rejects_stale_version(self):
+        self.patch_series(self.agachamento, 1, weight=80, repetitions=5, version=0)
+        self.patch_series(self.agachamento, 1, weight=85, repetitions=5, version=1)
+
+        # Outro dispositivo ainda conhecia a versão 1
+        response = self.patch_series(
+            self.agachamento, 1, weight=70, repetitions=5, version=1
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["conflicts"][0]["weight"], "85.0")
+        self.assertEqual(
+            self.agachamento.series.get(set_number=1).weight_used, Decimal("85")
+        )
+
+    def test_save_session_series_batch_with_conflict(self):
+        self.patch_series(self.agachamento, 1, weight=80, repetitions=5, version=0)
+        sets = [
+            {
+                "exercise_session": self.agachamento.id,
+                "set_number": i,
+                "weight": 90,
+                "repetitions": 5,
+                "version": 0,
+            }
+            for i in (1, 2, 3)
+        ]
+        response = self.client.patch(
+            reverse("save_session_series", args=[self.session.id]),
+            {"sets": sets},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(
+            [s["set_number"] for s in response.json()["sets"]], [2, 3]
+        )  # As séries sem conflito são gravadas
+        self.assertEqual(len(response.json()["conflicts"]), 1)
+
+    def test_save_series_of_another_user(self):
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="password"
+        )
+        self.client.force_login(other)
+        response = self.patch_series(self.agachamento, 1, weight=80, repetitions=5)
+        self.assertEqual(response.status_code, 404)
+
+
+class SyncTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.client.force_login(self.user)
+        self.workout = Workout.objects.create(
+            name="Treino A", description="Treino de pernas", user=self.user
+        )
+        for name in ("Agachamento", "Leg Press"):
+            Exercise.objects.create(
+                name=name, sets=2, repetitions=12, rpe=8, workout=self.workout
+            )
+        self.sessions = []
+        for _ in range(2):
+            session = WorkoutSession.objects.create(
+                user=self.user, workout=self.workout
+            )
+            session.create_exercise_sessions()
+            self.sessions.append(session)
+
+    def sync(self, token=None):
+        params = {"since": token} if token else {}
+        response = self.client.get(reverse("sync_changes"), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def rows(self, data, name, field="id"):
+        column = data[name]["fields"].index(field)
+        return [row[column] for row in data[name]["rows"]]
+
+    def upload(self, entries):
+        return self.client.post(
+            reverse("sync_upload"), {"sets": entries}, content_type="application/json"
+        )
+
+    def entries(self, *sessions, weight=50):
+        return [
+            {
+                "exercise_session": es.id,
+                "set_number": i,
+                "weight": weight,
+                "repetitions": 10,
+            }
+            for session in sessions
+            for es in session.exercise_sessions.all()
+            for i in (1, 2)
+        ]
+
+    def test_first_sync_sends_everything(self):
+        data = self.sync()
+        self.assertTrue(data["reset"])
+        self.assertEqual(len(data["workouts"]["rows"]), 1)
+        self.assertEqual(len(data["exercises"]["rows"]), 2)
+        self.assertEqual(len(data["sessions"]["rows"]), 2)
+        self.assertEqual(len(data["exercise_sessions"]["rows"]), 4)
+        self.assertEqual(
+            data["deleted"], {"workouts": [], "exercises": [], "sessions": []}
+        )
+
+    def test_delta_sync_sends_only_changes_and_deletions(self):
+        token = sync.make_token(timezone.now())
+        other = Workout.objects.create(name="Treino B", description="B", user=self.user)
+        session = WorkoutSession.objects.create(user=self.user, workout=other)
+        self.assertEqual(self.upload(self.entries(self.sessions[0])).status_code, 200)
+
+        data = self.sync(token)
+        self.assertFalse(data["reset"])
+        self.assertEqual(self.rows(data, "workouts"), [other.id])
+        self.assertEqual(self.rows(data, "exercises"), [])
+        self.assertEqual(self.rows(data, "sessions"), [session.id])
+        self.assertEqual(len(data["series"]["rows"]), 4)
+        self.assertEqual(self.rows(data, "series", "weight_used"), ["50.0"] * 4)
+
+        # Séries alteradas pelo bulk_update também têm o updated_at novo
+        token = sync.make_token(timezone.now())
+        self.upload(self.entries(self.sessions[0], weight=60))
+        self.assertEqual(len(self.sync(token)["series"]["rows"]), 4)
+
+        token = sync.make_token(timezone.now())
+        other_id = other.id
+        other.delete()
+        self.assertEqual(self.sync(token)["deleted"]["workouts"], [other_id])
+        # A sessão removida em cascata fica implícita na exclusão do treino
+        self.assertEqual(SyncTombstone.objects.count(), 1)
+
+    def test_token_from_response_repeats_recent_changes(self):
+        data = self.sync()
+        # O token volta SYNC_OVERLAP no tempo: o que acabou de mudar vem de novo
+        again = self.sync(data["token"])
+        self.assertEqual(len(again["sessions"]["rows"]), 2)
+        with patch("apps.workout.sync.SYNC_OVERLAP", timedelta(0)):
+            data = self.sync()
+        self.assertEqual(self.sync(data["token"])["sessions"]["rows"], [])
+
+    def test_invalid_or_expired_token(self):
+        response = self.client.get(reverse("sync_changes"), {"since": "2:123"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(reverse("sync_changes"), {"since": "abc"})
+        self.assertEqual(response.status_code, 400)
+
+        expired = sync.make_token(
+            timezone.now() - SyncTombstone.RETENTION - timedelta(days=1)
+        )
+        self.assertTrue(self.sync(expired)["reset"])
+
+    def test_upload_saves_sets_of_many_sessions_in_one_request(self):
+        response = self.upload(self.entries(*self.sessions))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["created"], 8)
+        self.assertEqual(
+            Series.objects.filter(
+                exercise_session__workout_session__in=self.sessions
+            ).count(),
+            8,
+        )
+
+    def test_upload_is_all_or_nothing(self):
+        stranger = User.objects.create_user(
+            username="outro", email="outro@example.com", password="password"
+        )
+        foreign = WorkoutSession.objects.create(user=stranger, workout=self.workout)
+        foreign.create_exercise_sessions()
+
+        entries = self.entries(self.sessions[0]) + self.entries(foreign)
+        response = self.upload(entries)
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Series.objects.exists())
+
+        with patch("apps.workout.sync.MAX_UPLOAD_SETS", 3):
+            response = self.upload(self.entries(self.sessions[0]))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["errors"], ["Envie no máximo 3 séries por vez."]
+        )
+
+
+class CurrentSessionStatusTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.workout = Workout.objects.create(
+            name="Treino A", description="Treino de pernas", user=self.user
+        )
+        self.request = RequestFactory().get("/")
+        self.request.user = self.user
+
+    def test_cache_hit_costs_no_queries(self):
+        session = WorkoutSession.objects.create(user=self.user, workout=self.workout)
+        with self.assertNumQueries(1):
+            current_session_status(self.request)
+        with self.assertNumQueries(0):
+            context = current_session_status(self.request)
+        self.assertEqual(context["current_session_id"], session.id)
+
+    def test_cache_without_session(self):
+        self.assertFalse(current_session_status(self.request)["has_session"])
+        with self.assertNumQueries(0):
+            self.assertFalse(current_session_status(self.request)["has_session"])
+
+    def test_invalidated_when_session_created_or_completed(self):
+        self.assertFalse(current_session_status(self.request)["has_session"])
+        session = WorkoutSession.objects.create(user=self.user, workout=self.workout)
+        self.assertEqual(
+            current_session_status(self.request)["current_session_id"], session.id
+        )  # A nova sessão invalida o cache
+
+        session.completed = True
+        session.save()
+        with self.assertNumQueries(1):
+            current_session_status(self.request)
+
+
+class AnalyticsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.workout = Workout.objects.create(
+            name="Treino A", description="Treino de pernas", user=self.user
+        )
+        self.squat, self.bench = [
+            Exercise.objects.create(
+                name=name, sets=2, repetitions=10, rpe=8, workout=self.workout
+            )
+            for name in ("Agachamento", "Supino")
+        ]
+        start = datetime(2024, 1, 1, 12, tzinfo=dt_timezone.utc)
+        # (dia, exercício, peso, repetições)
+        for day, exercise, weight, repetitions in [
+            (0, self.squat, 100, 5),
+            (0, self.bench, 60, 10),
+            (3, self.squat, 90, 5),  # Não é recorde
+            (3, self.bench, 70, 8),  # Recorde: 88.7 > 80
+            (10, self.squat, 110, 3),  # Recorde: 121 > 116.7
+            (10, self.squat, 50, 0),  # Série não realizada
+        ]:
+            history = WorkoutHistory.objects.create(
+                workout=self.workout, user=self.user, completed=True
+            )
+            WorkoutHistory.objects.filter(id=history.id).update(
+                date=start + timedelta(days=day)
+            )
+            ExerciseHistory.objects.create(
+                workout_history=history,
+                exercise=exercise,
+                weight_used=weight,
+                actual_repetitions=repetitions,
+                rpe=8,
+            )
+
+    def test_load_history_returns_columns(self):
+        data = analytics.load_history(self.user)
+        self.assertEqual(len(data["weight"]), 5)
+        self.assertEqual(data["weight"].dtype, np.float64)
+        self.assertEqual(str(data["date"][0]), "2024-01-01")
+        self.assertEqual(list(data["repetitions"]), [5, 10, 5, 8, 3])
+
+    def test_rolling_volume(self):
+        days, tonnage, rolling = analytics.rolling_volume(
+            analytics.load_history(self.user), window=7
+        )
+        self.assertEqual(len(days), 11)  # Eixo contínuo de dias
+        self.assertEqual(tonnage[0], 1100)
+        self.assertEqual(tonnage[3], 1010)
+        self.assertEqual(rolling[6], 2110)
+        self.assertEqual(rolling[7], 1010)  # O dia 0 saiu da janela
+        self.assertEqual(rolling[10], 330)
+
+    def test_personal_records(self):
+        records = analytics.personal_records(analytics.load_history(self.user))
+        self.assertEqual(list(records), [True, True, False, True, True])
+
+    def test_acwr(self):
+        days, ratio = analytics.acwr(analytics.load_history(self.user))
+        self.assertEqual(len(ratio), len(days))
+        # Com menos de 7 dias de dados, aguda / crônica = 28 / 7
+        self.assertAlmostEqual(ratio[0], 4.0)
+
+    def test_empty_history(self):
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="password"
+        )
+        data = analytics.load_history(other)
+        self.assertEqual(len(analytics.rolling_volume(data)[1]), 0)
+        self.assertEqual(len(analytics.personal_records(data)), 0)
+
+    def test_lttb_keeps_edges_and_peaks(self):
+        x = np.arange(1000)
+        y = np.zeros(1000)
+        y[500] = 100  # Pico isolado
+        keep = analytics.lttb(x, y, 20)
+        self.assertEqual(len(keep), 20)
+        self.assertEqual((keep[0], keep[-1]), (0, 999))
+        self.assertIn(500, keep)
+        self.assertTrue(np.all(np.diff(keep) > 0))
+        self.assertEqual(len(analytics.lttb(x[:10], y[:10], 20)), 10)
+
+    def test_matches_naive_implementation(self):
+        tonnage, records, rolling = naive_analytics(self.user)
+        expected = vectorized_analytics(self.user)
+        self.assertAlmostEqual(tonnage, expected[0])
+        self.assertEqual(records, expected[1])
+        self.assertAlmostEqual(rolling, expected[2])
+
+
+class ChartDataTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.client.force_login(self.user)
+        self.workout = Workout.objects.create(
+            name="Treino A", description="Treino de pernas", user=self.user
+        )
+        self.exercise = Exercise.objects.create(
+            name="Agachamento", sets=2, repetitions=10, rpe=8, workout=self.workout
+        )
+        self.values = {
+            f"weight_{self.exercise.id}_1": "100",
+            f"repetitions_{self.exercise.id}_1": "5",
+            f"weight_{self.exercise.id}_2": "80",
+            f"repetitions_{self.exercise.id}_2": "10",
+        }
+        WorkoutHistory.objects.record(self.user, self.workout, self.values)
+
+    def test_volume(self):
+        response = self.client.get(reverse("chart_volume"))
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["labels"], [timezone.localdate().isoformat()])
+        self.assertEqual(data["tonnage"], [1300.0])
+        self.assertEqual(data["repetitions"], [15.0])
+
+    def test_exercise_progress(self):
+        data = self.client.get(reverse("chart_exercise_progress")).json()
+        self.assertEqual(data["exercise"], self.exercise.id)
+        self.assertEqual(
+            data["exercises"], [{"id": self.exercise.id, "name": "Agachamento"}]
+        )
+        self.assertEqual(data["e1rm"], [116.7])
+        self.assertEqual(data["best_weight"], [100.0])
+
+    def test_frequency(self):
+        WorkoutHistory.objects.record(self.user, self.workout, self.values)
+        data = self.client.get(reverse("chart_frequency")).json()
+        self.assertEqual(data["sessions"], [2.0])
+
+    def test_etag_returns_304_until_new_history(self):
+        url = reverse("chart_volume")
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(3):  # Sessão, usuário e a consulta do ETag
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        WorkoutHistory.objects.record(self.user, self.workout, self.values)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_changes_when_stats_change_without_new_history(self):
+        WorkoutHistory.objects.record(self.user, self.workout, self.values)
+        url = reverse("chart_exercise_progress")
+
+        def changed(change):
+            etag = self.client.get(url)["ETag"]
+            change()
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            return response.status_code == 200
+
+        def rename():
+            self.exercise.name = "Agachamento livre"
+            self.exercise.save()
+
+        self.assertTrue(changed(rename))
+        self.assertTrue(changed(lambda: ExerciseStat.objects.rebuild(self.user)))
+        self.assertTrue(changed(self.exercise.delete))
+
+    def test_downsampling(self):
+        start = timezone.now() - timedelta(days=500)
+        histories = WorkoutHistory.objects.bulk_create(
+            WorkoutHistory(workout=self.workout, user=self.user, completed=True)
+            for _ in range(500)
+        )
+        for i, history in enumerate(histories):
+            WorkoutHistory.objects.filter(id=history.id).update(
+                date=start + timedelta(days=i)
+            )
+            ExerciseHistory.objects.create(
+                workout_history=history,
+                exercise=self.exercise,
+                weight_used=50 + i % 30,
+                actual_repetitions=10,
+                rpe=8,
+            )
+        ExerciseStat.objects.rebuild(self.user)
+
+        data = self.client.get(reverse("chart_volume"), {"points": 50}).json()
+        self.assertEqual(len(data["labels"]), 50)
+        self.assertEqual(data["labels"][-1], timezone.localdate().isoformat())
+
+    def test_requires_login(self):
+        self.client.logout()
+        response = self.client.get(reverse("chart_volume"))
+        self.assertEqual(response.status_code, 401)
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.client.force_login(self.user)
+
+    def walk(self, url):
+        """Percorre todas as páginas pela variante JSON e conta as consultas."""
+        ids, queries = [], []
+        while url:
+            with CaptureQueriesContext(connection) as captured:
+                page = self.client.get(url, HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+            queries.append(len(captured))
+            data = page.json()
+            ids.extend(item["id"] for item in data["results"])
+            url = data["next"]
+        return ids, queries
+
+    def test_all_workouts_pages_by_order_id_and_id(self):
+        # order_id repetido para exercitar o desempate pelo id
+        Workout.objects.bulk_create(
+            Workout(
+                name=f"Treino {i}", description="Treino", user=self.user, order_id=i % 5
+            )
+            for i in range(30)
+        )
+        expected = list(
+            Workout.objects.filter(user=self.user)
+            .order_by("order_id", "id")
+            .values_list("id", flat=True)
+        )
+
+        ids, queries = self.walk(reverse("all_workouts"))
+        self.assertEqual(ids, expected)
+        self.assertEqual(len(queries), 3)
+        self.assertEqual(len(set(queries)), 1)  # Página funda custa o mesmo
+
+    def test_session_history_pages_by_date_and_id(self):
+        workout = Workout.objects.create(
+            name="Treino A", description="Treino", user=self.user
+        )
+        sessions = WorkoutSession.objects.bulk_create(
+            WorkoutSession(workout=workout, user=self.user, completed=True)
+            for _ in range(45)
+        )
+        same_date = timezone.now()
+        WorkoutSession.objects.filter(id__in=[s.id for s in sessions[:10]]).update(
+            date=same_date
+        )
+        expected = list(
+            WorkoutSession.objects.filter(user=self.user)
+            .order_by("-date", "-id")
+            .values_list("id", flat=True)
+        )
+
+        ids, queries = self.walk(reverse("session_history"))
+        self.assertEqual(ids, expected)
+        self.assertEqual(len(set(queries)), 1)
+
+    def test_html_page_links_to_next_cursor(self):
+        Workout.objects.bulk_create(
+            Workout(name=f"Treino {i}", description="Treino", user=self.user)
+            for i in range(13)
+        )
+        response = self.client.get(reverse("all_workouts"))
+        self.assertEqual(len(response.context["workouts"]), 12)
+        self.assertContains(response, 'id="load-more"')
+
+        cursor = response.context["workouts"].next_cursor
+        self.assertContains(response, f'href="?cursor={cursor}"')
+        response = self.client.get(reverse("all_workouts"), {"cursor": cursor})
+        self.assertEqual(len(response.context["workouts"]), 1)
+        self.assertFalse(response.context["workouts"].has_next)
+
+    def test_invalid_cursor_returns_first_page(self):
+        Workout.objects.create(name="Treino A", description="Treino", user=self.user)
+        for cursor in ("nao-e-um-cursor", "W10", "WyJ4IiwgMV0"):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(
+                    reverse("all_workouts"),
+                    {"cursor": cursor},
+                    HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+                )
+                self.assertEqual(len(response.json()["results"]), 1)
+
+
+class FragmentCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.client.force_login(self.user)
+        self.workout = Workout.objects.create(
+            name="Treino A", description="Treino de pernas", user=self.user
+        )
+
+    def get_twice(self, url):
+        """Retorna o número de consultas da primeira e da segunda visita."""
+        with CaptureQueriesContext(connection) as first:
+            self.client.get(url)
+        with CaptureQueriesContext(connection) as second:
+            response = self.client.get(url)
+        return len(first), len(second), response
+
+    def test_cached_fragments_skip_queries(self):
+        for url in (
+            reverse("dashboard"),
+            reverse("all_workouts"),
+            reverse("view_workout", args=[self.workout.id]),
+        ):
+            with self.subTest(url=url):
+                first, second, response = self.get_twice(url)
+                self.assertLess(second, first)
+                self.assertContains(response, "Treino A")
+
+    def test_workout_signals_invalidate(self):
+        self.client.get(reverse("all_workouts"))
+        Workout.objects.create(name="Treino B", description="Treino", user=self.user)
+        self.assertContains(self.client.get(reverse("all_workouts")), "Treino B")
+
+        self.workout.name = "Treino Renomeado"
+        self.workout.save()
+        self.assertContains(self.client.get(reverse("dashboard")), "Treino Renomeado")
+
+    def test_exercise_signals_invalidate(self):
+        url = reverse("view_workout", args=[self.workout.id])
+        self.client.get(url)
+        exercise = Exercise.objects.create(
+            name="Agachamento", sets=3, repetitions=10, rpe=8, workout=self.workout
+        )
+        self.assertContains(self.client.get(url), "Agachamento")
+
+        Exercise.objects.get(id=exercise.id).delete()  # Sem o pai em memória
+        self.assertNotContains(self.client.get(url), "Agachamento")
+        self.assertTrue(
+            SyncTombstone.objects.filter(
+                kind=SyncTombstone.KIND_EXERCISE, object_id=exercise.id
+            ).exists()
+        )
+
+    def test_bulk_import_invalidates(self):
+        self.client.get(reverse("all_workouts"))
+        row = {"order_id": 7, "Grupo": "Costas", "Exercicio": "Remada"}
+        row.update({"séries": 3, "repetições": 10, "RPE": 8})
+        import_rows(self.user, list(REQUIRED_COLUMNS), iter([(2, row)]))
+        self.assertContains(self.client.get(reverse("all_workouts")), "Costas")
+
+    def test_history_detail_refreshes_when_history_is_recorded(self):
+        exercise = Exercise.objects.create(
+            name="Agachamento", sets=1, repetitions=10, rpe=8, workout=self.workout
+        )
+        session = WorkoutSession.objects.create(
+            user=self.user, workout=self.workout, completed=True
+        )
+        url = reverse("view_history_session", args=[session.id])
+        self.assertNotContains(self.client.get(url), "Agachamento")
+
+        # Gravado em outro processo: a geração deste cache não muda
+        with patch("apps.workout.models.bump_cache_generation"):
+            WorkoutHistory.objects.record(
+                self.user,
+                self.workout,
+                {f"weight_{exercise.id}_1": "80", f"repetitions_{exercise.id}_1": "8"},
+                workout_session=session,
+            )
+        self.assertContains(self.client.get(url), "Agachamento")
+
+    def test_generations_are_per_user(self):
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="password"
+        )
+        generation = cache_generation(self.user.id)
+        other_generation = cache_generation(other.id)
+        bump_cache_generation(self.user.id)
+        self.assertNotEqual(cache_generation(self.user.id), generation)
+        self.assertEqual(cache_generation(other.id), other_generation)
+
+        cache.clear()  # Chave descartada: a nova geração nunca repete uma antiga
+        bump_cache_generation(self.user.id)
+        self.assertGreater(cache_generation(self.user.id), generation)
+
+
+@skipUnless(
+    settings.DATABASES["default"]["ENGINE"].endswith("sqlite3"), "Apenas SQLite"
+)
+class SQLiteConcurrencyTests(SimpleTestCase):
+    def test_concurrent_writers_do_not_hit_locked_database(self):
+        # Roda em processos separados, contra um arquivo SQLite de verdade
+        # (o banco de teste em memória não é compartilhado entre processos)
+        with TemporaryDirectory() as directory:
+            env = dict(os.environ, SQLITE_PATH=os.path.join(directory, "db.sqlite3"))
+            env.pop("POSTGRES_DB", None)
+
+            def manage(*args):
+                return subprocess.run(
+                    [sys.executable, "manage.py", *args],
+                    cwd=settings.BASE_DIR,
+                    env=env,
+                    capture_output=True,
+                    text=True,
+                )
+
+            self.assertEqual(manage("migrate", "-v0").returncode, 0)
+            result = manage("stress_writes", "--writers", "6", "--writes", "20")
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertIn("0 erro(s)", result.stdout)
+
+
+class ProductionSettingsTests(SimpleTestCase):
+    def check(self, **environ):
+        env = dict(os.environ, DJANGO_ENV="production", DJANGO_SECRET_KEY="x")
+        for name in ("DJANGO_CACHE_URL", "DJANGO_CACHE_DIR"):
+            env.pop(name, None)
+        return subprocess.run(
+            [sys.executable, "manage.py", "check"],
+            cwd=settings.BASE_DIR,
+            env=dict(env, **environ),
+            capture_output=True,
+            text=True,
+        )
+
+    def test_production_requires_shared_cache(self):
+        # O cache em memória local de cada processo não vê as invalidações
+        # feitas pelos outros (servidor e run_jobs)
+        result = self.check()
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("DJANGO_CACHE_URL ou DJANGO_CACHE_DIR", result.stderr)
+
+        with TemporaryDirectory() as directory:
+            result = self.check(DJANGO_CACHE_DIR=directory)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+class SeedingTests(TestCase):
+    def test_seed_creates_users_with_history_spread_over_days(self):
+        users = seeding.seed(users=2, workouts=3, exercises=2, sessions=10, sets=3)
+
+        self.assertEqual(len(users), 2)
+        for user in users:
+            self.assertTrue(user.check_password("password"))
+            self.assertEqual(Workout.objects.filter(user=user).count(), 3)
+            histories = WorkoutHistory.objects.filter(user=user)
+            self.assertEqual(histories.count(), 10)
+            self.assertEqual(
+                len(set(histories.values_list("date__date", flat=True))), 10
+            )
+            self.assertEqual(
+                ExerciseHistory.objects.filter(workout_history__user=user).count(),
+                10 * 2 * 3,
+            )
+            # Uma sessão em andamento, com as séries salvas
+            session = WorkoutSession.objects.get(user=user, completed=False)
+            self.assertEqual(
+                Series.objects.filter(
+                    exercise_session__workout_session=session
+                ).count(),
+                2 * 3,
+            )
+            self.assertTrue(ExerciseStat.objects.filter(user=user).exists())
+
+    def test_benchmark_urls_reports_every_url(self):
+        with TemporaryDirectory() as directory:
+            output = os.path.join(directory, "benchmark.json")
+            call_command(
+                "benchmark_urls",
+                repeat=2,
+                warmup=0,
+                sessions=5,
+                output=output,
+                stdout=io.StringIO(),
+            )
+            with open(output) as f:
+                report = json.load(f)
+
+            names = {pattern.name for pattern in urls.urlpatterns}
+            self.assertEqual(set(report["results"]), names)
+            for name, result in report["results"].items():
+                self.assertLess(result["status"], 500, name)
+                self.assertLessEqual(result["p50_ms"], result["p95_ms"])
+            self.assertFalse(User.objects.filter(email__startswith="carga").exists())
+
+            # Uma consulta a mais que a execução anterior é uma regressão
+            report["results"]["dashboard"]["queries"] -= 1
+            baseline = os.path.join(directory, "baseline.json")
+            with open(baseline, "w") as f:
+                json.dump(report, f)
+            with self.assertRaisesMessage(CommandError, "dashboard"):
+                call_command(
+                    "benchmark_urls",
+                    repeat=1,
+                    warmup=0,
+                    sessions=5,
+                    compare=baseline,
+                    tolerance=1000,
+                    stdout=io.StringIO(),
+                )
+
+
+class BenchmarkLoginsTests(TestCase):
+    def test_reports_logins_per_second_for_each_config(self):
+        with TemporaryDirectory() as directory:
+            output = os.path.join(directory, "logins.json")
+            call_command(
+                "benchmark_logins",
+                config=["bcrypt:4", "pbkdf2:1000"],
+                repeat=2,
+                cores=4,
+                peak=10,
+                output=output,
+                stdout=io.StringIO(),
+            )
+            with open(output) as f:
+                report = json.load(f)
+
+        self.assertEqual(
+            [(r["hasher"], r["cost"]) for r in report["results"]],
+            [("bcrypt", 4), ("pbkdf2", 1000)],
+        )
+        for result in report["results"]:
+            self.assertAlmostEqual(
+                result["logins_per_second"],
+                result["logins_per_second_per_core"] * 4,
+                delta=0.05,
+            )
+            self.assertGreaterEqual(result["cores_needed"], 1)
+        self.assertFalse(User.objects.exists())
+
+    def test_rejects_unknown_hasher(self):
+        with self.assertRaisesMessage(CommandError, "md5"):
+            call_command("benchmark_logins", config=["md5:1"], stdout=io.StringIO())
+
+
+class RequestMetricsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        request_metrics.reset()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        self.client.force_login(self.user)
+
+    def test_request_is_logged_with_its_measurements(self):
+        with self.assertLogs("apps.workout.middleware", "INFO") as logs:
+            response = self.client.get(reverse("dashboard"))
+
+        (record,) = logs.records
+        fields = record.request
+        self.assertEqual(fields["view"], "dashboard")
+        self.assertEqual(fields["status"], 200)
+        self.assertGreater(fields["db_queries"], 0)
+        self.assertGreater(fields["template_ms"], 0)
+        self.assertEqual(fields["response_bytes"], len(response.content))
+        self.assertEqual(
+            json.loads(JsonFormatter().format(record))["view"], "dashboard"
+        )
+
+    def test_metrics_are_staff_only(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 403)
+
+    def test_metrics_in_prometheus_format(self):
+        for _ in range(3):
+            self.client.get(reverse("dashboard"))
+        self.user.is_staff = True
+        self.user.save()
+
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode()
+        self.assertIn(
+            'workout_http_requests_total{view="dashboard",method="GET",status="200"} 3',
+            body,
+        )
+        self.assertIn(
+            'workout_http_request_duration_seconds_bucket{view="dashboard",'
+            'method="GET",le="+Inf"} 3',
+            body,
+        )
+        self.assertIn(
+            'workout_http_request_recent_seconds{view="dashboard",method="GET",'
+            'quantile="0.95"}',
+            body,
+        )
+        self.assertIn('workout_http_request_db_queries_total{view="dashboard"', body)
+
+
+class QueryWatchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        query_report.reset()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="password"
+        )
+        workout = Workout.objects.create(
+            name="Treino A", description="Treino", user=self.user
+        )
+        for _ in range(6):
+            WorkoutSession.objects.create(user=self.user, workout=workout)
+
+    def test_repeated_query_in_template_is_reported_with_plan(self):
+        # Sem select_related: uma consulta ao treino por linha (N+1)
+        template = engines["django"].from_string(
+            "{% for session in sessions %}\n{{ session.workout.name }}{% endfor %}"
+        )
+
+        def view(request):
+            sessions = WorkoutSession.objects.filter(user=self.user)
+            return HttpResponse(template.render({"sessions": sessions}))
+
+        request = RequestFactory().get(reverse("session_history"))
+        request.resolver_match = resolve(request.path)
+        with self.assertLogs("apps.workout.querywatch", "WARNING") as logs:
+            PerformanceMiddleware(view)(request)
+
+        (entry,) = query_report.top()
+        self.assertEqual(entry["kind"], "repetida")
+        self.assertEqual(entry["view"], "session_history")
+        self.assertEqual(entry["count"], 6)
+        self.assertIn("workout_workout", entry["sql"])
+        self.assertTrue(entry["location"].startswith("apps/workout/tests.py:"))
+        self.assertTrue(entry["template"].endswith(":2"))
+        self.assertIn("USING INTEGER PRIMARY KEY", entry["plan"])
+        self.assertEqual(logs.records[0].request["count"], 6)
+
+    @override_settings(SLOW_QUERY_MS=0)
+    def test_slow_queries_are_reported_with_view_location(self):
+        self.client.force_login(self.user)
+        with self.assertLogs("apps.workout.querywatch", "WARNING"):
+            self.client.get(reverse("session_history"))
+
+        locations = {entry["location"] for entry in query_report.top()}
+        self.assertTrue(
+            any(
+                location and location.startswith("apps/workout/views.py:")
+                for location in locations
+            )
+        )
+        self.assertTrue(all(entry["kind"] == "lenta" for entry in query_report.top()))
+
+    @override_settings(SLOW_QUERY_MS=0)
+    def test_report_page_is_staff_only(self):
+        self.client.force_login(self.user)
+        with self.assertLogs("apps.workout.querywatch", "WARNING"):
+            self.client.get(reverse("session_history"))
+            forbidden = self.client.get(reverse("query_report"))
+            self.user.is_staff = True
+            self.user.save()
+            response = self.client.get(reverse("query_report"))
+
+        self.assertEqual(forbidden.status_code, 403)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "workout_workoutsession")
+
+
+class StaticFilesTests(SimpleTestCase):
+    def test_static_files_have_a_single_source(self):
+        for path in ("workout/css/custom.css", "workout/images/bg.jpg"):
+            self.assertEqual(len(finders.find(path, find_all=True)), 1, path)
+
+    def test_collectstatic_hashes_and_compresses_files(self):
+        with TemporaryDirectory() as directory, override_settings(
+            STATIC_ROOT=directory,
+            STORAGES={
+                "staticfiles": {
+                    "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"
+                }
+            },
+        ):
+            call_command("collectstatic", interactive=False, verbosity=0)
+            with open(os.path.join(directory, "staticfiles.json")) as f:
+                paths = json.load(f)["paths"]
+
+            css = os.path.join(directory, paths["workout/css/style.red.css"])
+            for suffix in (".gz", ".br"):
+                self.assertTrue(os.path.exists(css + suffix), suffix)
+            with open(css) as f:
+                content = f.read()
+            # As variantes WebP são referenciadas pelo nome com hash
+            for width in (640, 1280, 1920):
+                hashed = os.path.basename(paths[f"workout/images/bg-{width}.webp"])
+                self.assertIn(hashed, content)
+
+
+class ProvisionMembersTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(
+            username="equipe",
+            email="equipe@example.com",
+            password="password",
+            is_staff=True,
+        )
+
+    def members_csv(self, rows, name="membros.csv"):
+        lines = ["username,email,password"] + [",".join(row) for row in rows]
+        return SimpleUploadedFile(name, "\n".join(lines).encode())
+
+    def test_provision_creates_members_with_bulk_insert(self):
+        rows = [
+            (f"membro{i}", f"membro{i}@example.com", "senha1234") for i in range(10)
+        ]
+        # Duas consultas de duplicidade e um INSERT, com o SAVEPOINT/RELEASE
+        with self.assertNumQueries(5):
+            result = provision_members(self.members_csv(rows), workers=1)
+
+        self.assertEqual(result["report"]["created"], 10)
+        member = User.objects.get(username="membro7")
+        self.assertEqual(member.email, "membro7@example.com")
+        self.assertTrue(member.check_password("senha1234"))
+
+    def test_provision_reports_duplicates_and_creates_nothing(self):
+        rows = [
+            ("equipe", "outro@example.com", "senha1234"),  # Já cadastrado
+            ("membro1", "membro1@example.com", "senha1234"),
+            ("membro2", "membro1@example.com", "senha1234"),  # Repetido na planilha
+            ("membro3", "membro3@example", "curta"),
+        ]
+        result = provision_members(self.members_csv(rows), workers=1)
+
+        self.assertEqual(
+            result["errors"],
+            [
+                "Linha 2: Username is already registered to another user.",
+                "Linha 4: Email address is already registered to another user.",
+                "Linha 5: Email is not a valid email format.",
+                "Linha 5: Password fields are required and must match and be at "
+                "least 8 characters.",
+            ],
+        )
+        self.assertFalse(User.objects.filter(username__startswith="membro").exists())
+
+    def test_provision_requires_member_columns(self):
+        arquivo = SimpleUploadedFile("membros.csv", b"username,email\nmembro,m@e.com")
+        result = provision_members(arquivo, workers=1)
+        self.assertIn("'password'", result["errors"][0])
+
+    def test_staff_endpoint_enqueues_job(self):
+        self.client.force_login(self.staff)
+        rows = [("membro1", "membro1@example.com", "senha1234")]
+        response = self.client.post(
+            reverse("provision_members"), {"arquivo": self.members_csv(rows)}
+        )
+
+        self.assertEqual(response.status_code, 202)
+        job = ImportJob.objects.get(id=response.json()["job_id"])
+        self.assertEqual(job.kind, ImportJob.KIND_PROVISION_MEMBERS)
+        self.assertEqual(run_job(job.id), ImportJob.STATUS_DONE)
+        self.assertTrue(User.objects.filter(username="membro1").exists())
+
+    def test_endpoint_is_staff_only(self):
+        member = User.objects.create_user(
+            username="membro", email="membro@example.com", password="password"
+        )
+        self.client.force_login(member)
+        response = self.client.post(reverse("provision_members"))
+        self.assertEqual(response.status_code, 403)
@@ -30,6 +30,16 @@ urlpatterns = [
     path(
         "workout/session/<int:id>/", views.view_session, name="view_session"
     ),  # View session details
+    path(
+        "workout/session/<int:id>/series",
+        views.save_session_series,
+        name="save_session_series",
+    ),  # Autosave changed sets (JSON)
+    path(
+        "workout/exercise-session/<int:id>/series/<int:set_number>",
+        views.save_series,
+        name="save_series",
+    ),  # Save a single set (JSON PATCH)
     path("workout/session/current", views.current_session, name="current_session"),
     path(
         "workout/<int:workout_id>/start-session/",
@@ -46,8 +56,29 @@ urlpatterns = [
     path(
         "workouts/import", views.importar_treinos, name="importar_treinos"
     ),  # Import workouts from Excel file
+    path(
+        "history/export/<str:formato>", views.export_history, name="export_history"
+    ),  # Export history (or workouts) as .csv/.xlsx
+    path(
+        "members/import", views.provision_members, name="provision_members"
+    ),  # Bulk member provisioning (staff only)
+    path("jobs/<int:id>", views.job_status, name="job_status"),  # Poll job status
+    # Dashboard Charts (JSON)
+    path("charts/volume", views.chart_volume, name="chart_volume"),
+    path(
+        "charts/exercise-progress",
+        views.chart_exercise_progress,
+        name="chart_exercise_progress",
+    ),
+    path("charts/frequency", views.chart_frequency, name="chart_frequency"),
+    # Sync API for the mobile app (JSON, versioned)
+    path("api/v1/sync", views.sync_changes, name="sync_changes"),
+    path("api/v1/sync/series", views.sync_upload, name="sync_upload"),
     # User Settings
     path("settings", views.settings, name="settings"),  # User settings
+    # Request Metrics (Prometheus, staff only)
+    path("metrics", views.metrics, name="metrics"),
+    path("metrics/queries", views.query_report, name="query_report"),
     # Legal and Terms
     path("legal/tos", views.tos, name="tos"),  # Terms of Service
 ]
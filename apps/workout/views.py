@@ -1,14 +1,39 @@
 # apps\workout\views.py
 
+from django.conf import settings as django_settings
 from django.contrib import messages
 from django.contrib.auth import authenticate, login as auth_login
 from django.contrib.auth import logout as auth_logout
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.db.models import Count, Max, Sum
+from django.db.models.functions import TruncWeek
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseForbidden,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.urls import reverse
 from django.utils import timezone
 from django.shortcuts import render, redirect, get_object_or_404
+from django.views.decorators.cache import cache_control
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import condition, require_POST
+from .analytics import lttb
+from .caching import bump_cache_generation, cache_generation
+from .exporters import export
+from .db import write_transaction
+from .metrics import registry as request_metrics
+from .querywatch import query_report as slow_queries
 from .models import *
+from .pagination import paginate
+from . import sync
 
-import pandas as pd
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 # Funções de Login, Registro, Logout, Dashboard e Configurações de Usuário
@@ -183,22 +208,45 @@ def exercise(request, id):
         return redirect(f"/workout/{id}")
 
 
+WORKOUTS_PER_PAGE = 12
+SESSIONS_PER_PAGE = 20
+
+
+def _next_page_url(request, page):
+    if not page.has_next:
+        return None
+    return f"{request.path}?cursor={page.next_cursor}"
+
+
 def all_workouts(request):
     user = get_logged_in_user(request)
     if not user:
         return redirect("/")
 
-    workout_list = Workout.objects.filter(user=user).order_by("order_id")
-    page = request.GET.get("page", 1)
-    paginator = Paginator(workout_list, 12)
+    workouts = paginate(
+        Workout.objects.filter(user=user),
+        ("order_id", "id"),
+        cursor=request.GET.get("cursor"),
+        per_page=WORKOUTS_PER_PAGE,
+    )
 
-    try:
-        workouts = paginator.page(page)
-    except PageNotAnInteger:
-        workouts = paginator.page(1)
-    except EmptyPage:
-        workouts = paginator.page(paginator.num_pages)
+    # Variante JSON para a rolagem infinita
+    if request.headers.get("x-requested-with") == "XMLHttpRequest":
+        return JsonResponse(
+            {
+                "results": [
+                    {
+                        "id": workout.id,
+                        "name": workout.name,
+                        "created_at": workout.created_at.isoformat(),
+                    }
+                    for workout in workouts
+                ],
+                "next": _next_page_url(request, workouts),
+            }
+        )
 
+    # A página só é consultada se o fragmento da tabela não estiver em cache
     context = {"user": user, "workouts": workouts}
     return render(request, "workout/all_workouts.html", context)
 
@@ -209,51 +257,26 @@ def start_workout_session(request, workout_id):
         return redirect("/")
 
     workout = get_object_or_404(Workout, id=workout_id, user=user)
-    workout_session = WorkoutSession.objects.create(workout=workout, user=user)
 
     try:
-        # Adiciona log para verificar se a função está sendo chamada
-        print(
-            f"Iniciando a criação de ExerciseSessions para a sessão de treino: {workout_session.id}"
-        )
-
-        # Verifica se a criação das ExerciseSession está no lugar certo
-        workout_session.create_exercise_sessions()  # Cria as sessões de exercícios
+        for attempt in write_transaction():
+            with attempt:
+                workout_session = WorkoutSession.objects.create(
+                    workout=workout, user=user
+                )
+                workout_session.create_exercise_sessions()  # Cria as sessões de exercícios
         messages.success(request, "Sessão de treino iniciada com sucesso.")
-    except Exception as e:
-        print(f"Erro ao criar as sessões de exercício: {e}")
+    except Exception:
+        logger.exception(
+            "Erro ao criar as sessões de exercício",
+            extra={"workout_id": workout.id},
+        )
         messages.error(request, "Erro ao iniciar a sessão de treino. Tente novamente.")
         return redirect("dashboard")
 
     return redirect("view_session", id=workout_session.id)
 
 
-def create_exercise_sessions(self):
-    """Método para criar ExerciseSession ao iniciar uma WorkoutSession."""
-    exercises = self.workout.exercise_set.all()  # Obtenha todos os exercícios do treino
-
-    if not exercises:
-        print(f"Não foram encontrados exercícios para o treino: {self.workout.name}")
-        return  # Se não houver exercícios, retorne sem criar
-
-    print(f"Exercícios encontrados para o treino {self.workout.name}: {exercises}")
-
-    for exercise in exercises:
-        try:
-            # Cria uma ExerciseSession para cada exercício no treino
-            ExerciseSession.objects.create(
-                workout_session=self,
-                exercise=exercise,
-                weight_used=0,  # Valor padrão inicial
-                actual_repetitions=0,
-                sets=exercise.sets,
-                rpe=exercise.rpe,
-            )
-            print(f"ExerciseSession criado para o exercício: {exercise.name}")
-        except Exception as e:
-            print(f"Erro ao criar ExerciseSession para {exercise.name}: {e}")
-
-
 def complete_workout(request, id):
     user = get_logged_in_user(request)
     if not user:
@@ -264,49 +287,66 @@ def complete_workout(request, id):
     exercises = Exercise.objects.filter(workout=workout_instance)
 
     if request.method == "POST":
-        # Criar uma nova sessão de treino (WorkoutSession)
-        workout_session = WorkoutSession.objects.create(
-            user=user,
-            workout=workout_instance,
-            date=timezone.now(),
-            completed=True,  # Marcar a sessão como concluída
-        )
-
-        # Marcar o treino (Workout) como concluído
-        workout_instance.completed = True
-        workout_instance.save()
-
-        # Criar uma instância de WorkoutHistory
-        workout_history = WorkoutHistory.objects.create(
-            workout=workout_instance,
-            user=user,
-            completed=True,
-            date=timezone.now(),
+        # A sessão em andamento deste treino: a enviada pelo formulário da
+        # sessão ou, sem ela, a mais recente
+        sessions = WorkoutSession.objects.filter(
+            user=user, workout=workout_instance, completed=False
+        ).order_by("-date", "-id")
+        session_id = request.POST.get("workout_session", "")
+        if session_id.isdigit():
+            sessions = sessions.filter(id=session_id)
+        workout_session = sessions.first()
+
+        # O histórico vem das séries gravadas na sessão (autosave); campos
+        # enviados junto com o formulário prevalecem sobre elas
+        values = workout_session.series_values() if workout_session else {}
+        values.update(
+            (key, value)
+            for key, value in request.POST.items()
+            if key.startswith(("weight_", "repetitions_"))
         )
-
-        # Criar um histórico de exercícios para cada exercício do treino
-        for exercise in exercises:
-            for i in range(1, exercise.sets + 1):  # Loop sobre as séries
-                weight_key = f"weight_{exercise.id}_{i}"
-                reps_key = f"repetitions_{exercise.id}_{i}"
-
-                weight_used = request.POST.get(weight_key, 0)  # Pega o valor do peso
-                actual_repetitions = request.POST.get(
-                    reps_key, 0
-                )  # Pega o valor das repetições
-
-                # Criar um histórico de exercícios para cada série
-                ExerciseHistory.objects.create(
-                    workout_history=workout_history,  # Relacionar ao histórico de treino
-                    exercise=exercise,
-                    weight_used=weight_used,
-                    actual_repetitions=actual_repetitions,
-                    sets=exercise.sets,
-                    rpe=exercise.rpe,
+        # Valida antes de enfileirar: o worker só grava valores já aceitos
+        validated = WorkoutHistory.objects.clean_values(exercises, values)
+        if "errors" in validated:
+            for error in validated["errors"]:
+                messages.error(request, error)
+            return redirect(f"/workout/{id}")
+
+        completed_at = timezone.now()
+        for attempt in write_transaction():
+            with attempt:
+                if workout_session:
+                    # Conclui a sessão em andamento
+                    workout_session.completed = True
+                    workout_session.save(update_fields=["completed", "updated_at"])
+                else:
+                    # Sem sessão iniciada, registra uma já concluída
+                    workout_session = WorkoutSession.objects.create(
+                        user=user,
+                        workout=workout_instance,
+                        date=completed_at,
+                        completed=True,
+                    )
+
+                # Marcar o treino (Workout) como concluído
+                workout_instance.completed = True
+                workout_instance.save()
+
+                # O histórico de exercícios é gravado em segundo plano pelo worker
+                ImportJob.objects.enqueue(
+                    user,
+                    ImportJob.KIND_COMPLETE_WORKOUT,
+                    payload={
+                        "workout_id": workout_instance.id,
+                        "workout_session_id": workout_session.id,
+                        "completed_at": completed_at.isoformat(),
+                        "values": values,
+                    },
                 )
 
         messages.success(
-            request, "Treino concluído com sucesso e registrado no histórico."
+            request,
+            "Treino concluído com sucesso. O histórico será registrado em instantes.",
         )
         return redirect("session_history")
 
@@ -320,51 +360,68 @@ def view_session(request, id):
         return redirect("/")
 
     # Buscar a sessão de treino (WorkoutSession) pelo ID e pelo usuário
-    session = get_object_or_404(WorkoutSession, id=id, user=user)
+    session = get_object_or_404(
+        WorkoutSession.objects.select_related("workout"), id=id, user=user
+    )
 
-    # Buscar as ExerciseSession associadas a essa sessão de treino
-    exercises = ExerciseSession.objects.filter(workout_session=session)
+    # Buscar as ExerciseSession associadas a essa sessão de treino, já com o
+    # exercício e as séries carregados (evita uma consulta por linha)
+    exercises = (
+        ExerciseSession.objects.filter(workout_session=session)
+        .select_related("exercise")
+        .prefetch_related("series")
+        .order_by("id")
+    )
 
     # Se nenhuma ExerciseSession foi encontrada, criá-las
-    if not exercises.exists():
+    if not exercises:
         session.create_exercise_sessions()
         # Após criar, busque novamente as ExerciseSession
-        exercises = ExerciseSession.objects.filter(workout_session=session)
+        exercises = exercises.all()
+
+    # Verificação do envio do formulário para salvar as séries
+    if request.method == "POST":
+        entries = []
+        for exercise_session in exercises:
+            for i in range(1, exercise_session.sets + 1):
+                weight = request.POST.get(f"weight_{exercise_session.id}_{i}")
+                repetitions = request.POST.get(f"repetitions_{exercise_session.id}_{i}")
+                if weight or repetitions:  # Apenas as séries preenchidas
+                    entries.append(
+                        {
+                            "exercise_session": exercise_session.id,
+                            "set_number": i,
+                            "weight": weight,
+                            "repetitions": repetitions,
+                        }
+                    )
+
+        validated = Series.objects.save_sets(session, entries)
+        if "errors" in validated:
+            for error in validated["errors"]:
+                messages.error(request, error)
+        else:
+            messages.success(request, "Sessão de treino atualizada com sucesso.")
+        return redirect("view_session", id=session.id)
 
     exercises_with_series = []
     for exercise in exercises:
-        # Certifique-se de que estamos recuperando as informações de séries corretamente
+        series = {s.set_number: s for s in exercise.series.all()}  # Já no prefetch
+        # Exibir a primeira série ainda não registrada (ou a última)
+        current = next(
+            (i for i in range(1, exercise.sets + 1) if i not in series), exercise.sets
+        )
         exercises_with_series.append(
             {
                 "exercise": exercise,
-                "series": exercise.series.all(),  # Certifique-se de que as séries estão sendo recuperadas corretamente
-                "series_range": range(1, exercise.sets + 1),  # Gera a faixa de séries
+                "series": exercise.series.all(),
+                "sets": [
+                    {"number": i, "series": series.get(i), "current": i == current}
+                    for i in range(1, exercise.sets + 1)
+                ],
             }
         )
 
-    # Verificação do envio do formulário para salvar as séries
-    if request.method == "POST":
-        for exercise_session in exercises:
-            for i in range(1, exercise_session.sets + 1):
-                weight = request.POST.get(
-                    f"weight_{exercise_session.exercise.id}_{i}", 0
-                )
-                repetitions = request.POST.get(
-                    f"repetitions_{exercise_session.exercise.id}_{i}", 0
-                )
-
-                # Atualizar o peso e as repetições usados
-                weight = float(weight) if weight else 0
-                repetitions = int(repetitions) if repetitions else 0
-
-                # Atualiza a session com os valores inseridos
-                exercise_session.weight_used = weight
-                exercise_session.actual_repetitions = repetitions
-                exercise_session.save()
-
-        messages.success(request, "Sessão de treino atualizada com sucesso.")
-        return redirect("view_session", id=session.id)
-
     context = {
         "user": user,
         "session": session,
@@ -373,15 +430,97 @@ def view_session(request, id):
     return render(request, "workout/view_session.html", context)
 
 
+def _series_response(validated):
+    if "errors" in validated:
+        return JsonResponse(validated, status=400)
+    # Séries com versão desatualizada não são gravadas; o cliente recebe os
+    # valores atuais em "conflicts" para reconciliar
+    return JsonResponse(validated, status=409 if validated["conflicts"] else 200)
+
+
+def save_session_series(request, id):
+    """Autosave: grava em lote apenas as séries alteradas, enviadas em JSON.
+
+    Corpo esperado: {"sets": [{"exercise_session": 1, "set_number": 1,
+    "weight": 50, "repetitions": 10, "version": 0}, ...]}
+    """
+    user = get_logged_in_user(request)
+    if not user:
+        return JsonResponse({"error": "Não autenticado."}, status=401)
+    if request.method not in ("POST", "PATCH"):
+        return JsonResponse({"error": "Método não permitido."}, status=405)
+
+    session = get_object_or_404(WorkoutSession, id=id, user=user)
+    try:
+        entries = json.loads(request.body)["sets"]
+        if not isinstance(entries, list):
+            raise TypeError
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({"errors": ["JSON inválido."]}, status=400)
+
+    return _series_response(Series.objects.save_sets(session, entries))
+
+
+def save_series(request, id, set_number):
+    """Grava uma única série de uma ExerciseSession (PATCH em JSON).
+
+    Corpo esperado: {"weight": 50, "repetitions": 10, "version": 0}
+    """
+    user = get_logged_in_user(request)
+    if not user:
+        return JsonResponse({"error": "Não autenticado."}, status=401)
+    if request.method != "PATCH":
+        return JsonResponse({"error": "Método não permitido."}, status=405)
+
+    exercise_session = get_object_or_404(
+        ExerciseSession.objects.select_related("workout_session"),
+        id=id,
+        workout_session__user=user,
+    )
+    try:
+        entry = json.loads(request.body)
+        if not isinstance(entry, dict):
+            raise TypeError
+    except (ValueError, TypeError):
+        return JsonResponse({"errors": ["JSON inválido."]}, status=400)
+
+    entry.update(exercise_session=exercise_session.id, set_number=set_number)
+    return _series_response(
+        Series.objects.save_sets(exercise_session.workout_session, [entry])
+    )
+
+
 def session_history(request):
     user = get_logged_in_user(request)
     if not user:
         return redirect("/")
 
-    sessions = WorkoutSession.objects.filter(user=user, completed=True).order_by(
-        "-date"
+    sessions = paginate(
+        WorkoutSession.objects.filter(user=user, completed=True).select_related(
+            "workout"
+        ),
+        ("-date", "-id"),
+        cursor=request.GET.get("cursor"),
+        per_page=SESSIONS_PER_PAGE,
     )
 
+    # Variante JSON para a rolagem infinita
+    if request.headers.get("x-requested-with") == "XMLHttpRequest":
+        return JsonResponse(
+            {
+                "results": [
+                    {
+                        "id": session.id,
+                        "date": timezone.localtime(session.date).isoformat(),
+                        "workout": session.workout.name,
+                        "url": reverse("view_history_session", args=[session.id]),
+                    }
+                    for session in sessions
+                ],
+                "next": _next_page_url(request, sessions),
+            }
+        )
+
     context = {"user": user, "sessions": sessions}
     return render(request, "workout/session_history.html", context)
 
@@ -392,17 +531,26 @@ def view_history_session(request, id):
         return redirect("/")
 
     # Buscar a sessão de treino (WorkoutSession) pelo ID e pelo usuário
-    session = get_object_or_404(WorkoutSession, id=id, user=user)
+    session = get_object_or_404(
+        WorkoutSession.objects.select_related("workout"), id=id, user=user
+    )
 
-    # Buscar os ExerciseHistory associados a essa sessão de treino
-    exercise_histories = ExerciseHistory.objects.filter(
-        workout_history__workout=session.workout
+    # Buscar apenas os ExerciseHistory gravados para esta sessão
+    exercise_histories = (
+        ExerciseHistory.objects.filter(workout_history__workout_session=session)
+        .select_related("exercise")
+        .order_by("id")
     )
 
+    # O histórico é gravado pelo job de conclusão, possivelmente em outro
+    # processo: o id dele entra na chave do fragmento em cache
+    history_id = session.workout_histories.values_list("id", flat=True).first()
+
     context = {
         "user": user,
         "session": session,
         "exercise_histories": exercise_histories,
+        "history_id": history_id,
     }
     return render(request, "workout/session_history_detail.html", context)
 
@@ -435,7 +583,11 @@ def current_session(request):
         return redirect("view_session", id=new_session.id)
     else:
         # Se todos os treinos foram concluídos, redefinir para começar novamente
-        Workout.objects.filter(user=user).update(completed=False)
+        # update() não preenche o auto_now nem dispara post_save
+        Workout.objects.filter(user=user).update(
+            completed=False, updated_at=timezone.now()
+        )
+        bump_cache_generation(user.id)
         messages.info(
             request,
             "Todos os treinos foram concluídos. Reiniciando a sequência de treinos.",
@@ -460,46 +612,266 @@ def importar_treinos(request):
         return redirect("/")
 
     if request.method == "POST":
-        arquivo_excel = request.FILES["arquivo_excel"]
-        df = pd.read_excel(arquivo_excel)
+        # A planilha é processada em segundo plano pelo worker (run_jobs)
+        job = ImportJob.objects.enqueue(
+            user, ImportJob.KIND_IMPORT, arquivo=request.FILES["arquivo_excel"]
+        )
+        status_url = reverse("job_status", args=[job.id])
+        if request.headers.get("x-requested-with") == "XMLHttpRequest":
+            return JsonResponse(
+                {"job_id": job.id, "status_url": status_url}, status=202
+            )
 
-        # Remover espaços em branco dos nomes das colunas
-        df.columns = df.columns.str.strip()
+        messages.info(request, f"Importação recebida (job {job.id}). Processando...")
+        return redirect(f"{reverse('all_workouts')}?job={job.id}")
 
-        # Verificar se a coluna order_id está presente
-        if "order_id" not in df.columns:
-            messages.error(
-                request,
-                "Erro ao importar treinos: coluna 'order_id' não encontrada.",
-            )
-            return redirect("all_workouts")
-
-        # Iterar sobre cada ordem de treino única
-        for ordem in df["order_id"].unique():
-            exercicios = df[df["order_id"] == ordem]
-
-            # Criar um novo treino, agora com o nome do grupo no campo de nome
-            treino = Workout.objects.create(
-                name=f'{exercicios["Grupo"].iloc[0]}',  # Nome será o Grupo
-                description=f"Treino {ordem}",  # Descrição será Treino 1, 2, 3...
-                user=user,
-                order_id=ordem,  # Usar o order_id do Excel
-            )
+    return render(request, "workout/all_workouts.html")
 
-            # Iterar sobre cada exercício desse treino
-            for _, linha in exercicios.iterrows():
-                Exercise.objects.create(
-                    name=linha["Exercicio"],
-                    sets=linha["séries"],
-                    repetitions=linha["repetições"],
-                    rpe=linha["RPE"],
-                    workout=treino,
-                )
 
-        messages.success(request, "Treinos importados com sucesso!")
-        return redirect("all_workouts")
+# Exportação do histórico (ou dos treinos) em .csv/.xlsx, no formato da importação
+def export_history(request, formato):
+    user = get_logged_in_user(request)
+    if not user:
+        return redirect("/")
 
-    return render(request, "workout/all_workouts.html")
+    exported = export(user, request.GET.get("conteudo", "historico"), formato)
+    if exported is None:
+        raise Http404("Formato de exportação inválido.")
+    stream, content_type, filename = exported
+
+    # As linhas são lidas do banco e enviadas aos poucos, à medida que o
+    # cliente consome a resposta
+    response = StreamingHttpResponse(stream, content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+# API de sincronização do aplicativo (JSON, versionada em /api/v1/)
+@gzip_page
+def sync_changes(request):
+    """Alterações desde o último token: GET /api/v1/sync?since=<token>.
+
+    Ver sync.changes para o formato da resposta.
+    """
+    user = get_logged_in_user(request)
+    if not user:
+        return JsonResponse({"error": "Não autenticado."}, status=401)
+
+    try:
+        data = sync.changes(user, request.GET.get("since"))
+    except sync.InvalidToken:
+        return JsonResponse(
+            {"errors": ["Token de sincronização inválido."]}, status=400
+        )
+    return JsonResponse(data)
+
+
+@require_POST
+def sync_upload(request):
+    """Séries registradas offline, de qualquer sessão do usuário, gravadas
+    em uma única transação.
+
+    Corpo esperado: o mesmo de save_session_series, com até
+    sync.MAX_UPLOAD_SETS séries.
+    """
+    user = get_logged_in_user(request)
+    if not user:
+        return JsonResponse({"error": "Não autenticado."}, status=401)
+
+    try:
+        entries = json.loads(request.body)["sets"]
+        if not isinstance(entries, list):
+            raise TypeError
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({"errors": ["JSON inválido."]}, status=400)
+    if len(entries) > sync.MAX_UPLOAD_SETS:
+        return JsonResponse(
+            {"errors": [f"Envie no máximo {sync.MAX_UPLOAD_SETS} séries por vez."]},
+            status=400,
+        )
+
+    return _series_response(Series.objects.save_user_sets(user, entries))
+
+
+# Cadastro de membros em lote (equipe), processado pelo worker (run_jobs)
+@require_POST
+def provision_members(request):
+    if not request.user.is_staff:
+        return HttpResponseForbidden("Acesso restrito à equipe.")
+    if "arquivo" not in request.FILES:
+        return JsonResponse({"errors": ["Envie a planilha de membros."]}, status=400)
+
+    job = ImportJob.objects.enqueue(
+        request.user, ImportJob.KIND_PROVISION_MEMBERS, arquivo=request.FILES["arquivo"]
+    )
+    return JsonResponse(
+        {"job_id": job.id, "status_url": reverse("job_status", args=[job.id])},
+        status=202,
+    )
+
+
+def job_status(request, id):
+    user = get_logged_in_user(request)
+    if not user:
+        return JsonResponse({"error": "Não autenticado."}, status=401)
+
+    job = get_object_or_404(ImportJob, id=id, user=user)
+    data = {"id": job.id, "kind": job.kind, "status": job.status}
+    if job.status in (ImportJob.STATUS_DONE, ImportJob.STATUS_FAILED):
+        data["result"] = job.result
+    return JsonResponse(data)
+
+
+# Dados dos gráficos do painel (JSON)
+CHART_POINTS = 200  # Pontos por série quando ?points não é informado
+MAX_CHART_POINTS = 1000
+
+
+def chart_etag(request, *args, **kwargs):
+    """ETag dos gráficos, derivado do último histórico gravado pelo usuário e
+    da geração do cache dele.
+
+    A geração muda quando as estatísticas e os nomes dos exercícios mudam sem
+    um novo histórico (rebuild_stats, exercício renomeado ou excluído). Custa
+    uma consulta indexada; se o navegador já tem a versão atual, a resposta é
+    um 304 sem montar os dados.
+    """
+    if not request.user.is_authenticated:
+        return None
+    latest = WorkoutHistory.objects.filter(user=request.user).aggregate(
+        last=Max("id"), total=Count("id")
+    )
+    key = (
+        f"{request.get_full_path()}:{request.user.id}:{latest['last']}:"
+        f"{latest['total']}:{cache_generation(request.user.id)}"
+    )
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def _chart_points(request):
+    try:
+        points = int(request.GET.get("points", CHART_POINTS))
+    except ValueError:
+        points = CHART_POINTS
+    return max(3, min(points, MAX_CHART_POINTS))
+
+
+def _downsample(request, days, **series):
+    """Reduz as séries a ?points pontos com LTTB, guiado pela primeira série."""
+    first = next(iter(series.values()))
+    keep = lttb([day.toordinal() for day in days], first, _chart_points(request))
+    return {
+        "labels": [days[i].isoformat() for i in keep],
+        **{name: [float(values[i]) for i in keep] for name, values in series.items()},
+    }
+
+
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=chart_etag)
+def chart_volume(request):
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Não autenticado."}, status=401)
+
+    # Tonelagem diária, somando as estatísticas pré-calculadas dos exercícios
+    rows = (
+        ExerciseStat.objects.filter(user=request.user, period=ExerciseStat.PERIOD_DAY)
+        .values("period_start")
+        .annotate(tonnage=Sum("tonnage"), repetitions=Sum("repetitions"))
+        .order_by("period_start")
+    )
+    days = [row["period_start"] for row in rows]
+    return JsonResponse(
+        _downsample(
+            request,
+            days,
+            tonnage=[row["tonnage"] for row in rows],
+            repetitions=[row["repetitions"] for row in rows],
+        )
+    )
+
+
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=chart_etag)
+def chart_exercise_progress(request):
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Não autenticado."}, status=401)
+
+    # Exercícios com histórico, do treinado mais recentemente ao mais antigo
+    exercises = list(
+        ExerciseStat.objects.filter(user=request.user, period=ExerciseStat.PERIOD_DAY)
+        .values("exercise_id", "exercise__name")
+        .annotate(last=Max("period_start"))
+        .order_by("-last", "exercise_id")
+    )
+    ids = [exercise["exercise_id"] for exercise in exercises]
+    try:
+        exercise_id = int(request.GET.get("exercise") or ids[0])
+    except (IndexError, ValueError):
+        exercise_id = None
+
+    rows = list(
+        ExerciseStat.objects.filter(
+            user=request.user,
+            exercise_id=exercise_id,
+            period=ExerciseStat.PERIOD_DAY,
+        )
+        .order_by("period_start")
+        .values_list("period_start", "e1rm_epley", "best_weight")
+    )
+    data = _downsample(
+        request,
+        [row[0] for row in rows],
+        e1rm=[row[1] for row in rows],
+        best_weight=[row[2] for row in rows],
+    )
+    data["exercise"] = exercise_id
+    data["exercises"] = [
+        {"id": exercise["exercise_id"], "name": exercise["exercise__name"]}
+        for exercise in exercises
+    ]
+    return JsonResponse(data)
+
+
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=chart_etag)
+def chart_frequency(request):
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Não autenticado."}, status=401)
+
+    # Treinos concluídos por semana (semanas começam na segunda-feira)
+    rows = (
+        WorkoutHistory.objects.filter(user=request.user)
+        .annotate(week=TruncWeek("date"))
+        .values("week")
+        .annotate(sessions=Count("id"))
+        .order_by("week")
+    )
+    weeks = [timezone.localdate(row["week"]) for row in rows]
+    return JsonResponse(
+        _downsample(request, weeks, sessions=[row["sessions"] for row in rows])
+    )
+
+
+# Métricas das requisições deste processo, no formato do Prometheus
+def metrics(request):
+    if not request.user.is_staff:
+        return HttpResponseForbidden("Acesso restrito à equipe.")
+    return HttpResponse(
+        request_metrics.render(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+# Consultas lentas e repetidas (N+1) apontadas pelo detector
+def query_report(request):
+    if not request.user.is_staff:
+        return HttpResponseForbidden("Acesso restrito à equipe.")
+    context = {
+        "entries": slow_queries.top(),
+        "slow_query_ms": django_settings.SLOW_QUERY_MS,
+        "repeated_query_threshold": django_settings.REPEATED_QUERY_THRESHOLD,
+    }
+    return render(request, "workout/query_report.html", context)
 
 
 # Página de Termos de Uso
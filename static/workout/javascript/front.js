@@ -1,62 +0,0 @@
-$(function () {
-
-    // ------------------------------------------------------- //
-    // Transition Placeholders
-    // ------------------------------------------------------ //
-    $('input.input-material').on('focus', function () {
-        $(this).siblings('.label-material').addClass('active');
-    });
-
-    $('input.input-material').on('blur', function () {
-        $(this).siblings('.label-material').removeClass('active');
-
-        if ($(this).val() !== '') {
-            $(this).siblings('.label-material').addClass('active');
-        } else {
-            $(this).siblings('.label-material').removeClass('active');
-        }
-    });
-
-    // ------------------------------------------------------- //
-    // Adding fade effect to dropdowns
-    // ------------------------------------------------------ //
-    $('.dropdown').on('show.bs.dropdown', function () {
-        $(this).find('.dropdown-menu').first().stop(true, true).fadeIn(100).addClass('active');
-    });
-    $('.dropdown').on('hide.bs.dropdown', function () {
-        $(this).find('.dropdown-menu').first().stop(true, true).fadeOut(100).removeClass('active');
-    });
-
-
-    // ------------------------------------------------------- //
-    // Search Popup
-    // ------------------------------------------------------ //
-    $('.search-open').on('click', function (e) {
-        e.preventDefault();
-        $('.search-panel').fadeIn(100);
-    })
-    $('.search-panel .close-btn').on('click', function () {
-        $('.search-panel').fadeOut(100);
-    });
-
-
-    // ------------------------------------------------------- //
-    // Sidebar Functionality
-    // ------------------------------------------------------ //
-    $('.sidebar-toggle').on('click', function () {
-        $(this).toggleClass('active');
-
-        $('#sidebar').toggleClass('shrinked');
-        $('.page-content').toggleClass('active');
-
-        if ($('.sidebar-toggle').hasClass('active')) {
-            $('.navbar-brand .brand-sm').addClass('visible');
-            $('.navbar-brand .brand-big').removeClass('visible');
-            $(this).find('i').attr('class', 'fa fa-long-arrow-right');
-        } else {
-            $('.navbar-brand .brand-sm').removeClass('visible');
-            $('.navbar-brand .brand-big').addClass('visible');
-            $(this).find('i').attr('class', 'fa fa-long-arrow-left');
-        }
-    });
-});
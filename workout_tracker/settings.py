@@ -1,13 +1,35 @@
 import os
 
+from django.core.exceptions import ImproperlyConfigured
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-SECRET_KEY = "5gg&=_#^wgi(e5j!yasyva&x+s-x9^jtboecfv0%8tyf@pg)!+"
-DEBUG = True
+
+def env_bool(name, default=False):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Perfil de execução: "development" (padrão) ou "production". O perfil de
+# produção desliga o DEBUG e as ferramentas de depuração, mantém as conexões
+# com o banco abertas entre requisições e guarda as sessões no cache.
+DJANGO_ENV = os.environ.get("DJANGO_ENV", "development")
+PRODUCTION = DJANGO_ENV == "production"
+
+DEBUG = env_bool("DJANGO_DEBUG", not PRODUCTION)
+
+SECRET_KEY = os.environ.get(
+    "DJANGO_SECRET_KEY", "5gg&=_#^wgi(e5j!yasyva&x+s-x9^jtboecfv0%8tyf@pg)!+"
+)
+if PRODUCTION and "DJANGO_SECRET_KEY" not in os.environ:
+    raise ImproperlyConfigured("Defina DJANGO_SECRET_KEY no perfil de produção.")
+
 INTERNAL_IPS = [
     "127.0.0.1",
 ]
-ALLOWED_HOSTS = ["127.0.0.1", "localhost"]
+ALLOWED_HOSTS = os.environ.get("DJANGO_ALLOWED_HOSTS", "127.0.0.1,localhost").split(",")
 
 INSTALLED_APPS = [
     "apps.workout",
@@ -17,10 +39,11 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
-    "debug_toolbar",
 ]
 
 MIDDLEWARE = [
+    # Primeiro, para medir também os demais middlewares (sessão, autenticação)
+    "apps.workout.middleware.PerformanceMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -28,14 +51,15 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
 ]
 
 ROOT_URLCONF = "workout_tracker.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # DjangoTemplates com medição do tempo de renderização (ver /metrics)
+        "BACKEND": "apps.workout.template_backends.TimedDjangoTemplates",
+        "NAME": "django",
         "DIRS": [os.path.join(BASE_DIR, "templates")],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -45,6 +69,7 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
                 "apps.workout.context_processors.current_session_status",
+                "apps.workout.context_processors.fragment_cache",
             ],
         },
     },
@@ -52,17 +77,127 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "workout_tracker.wsgi.application"
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": os.path.join(BASE_DIR, "db.sqlite3"),
+# Conexões persistentes: por quantos segundos uma conexão é reaproveitada
+# entre requisições (0 fecha ao fim de cada uma). O health check descarta
+# conexões que caíram antes de reutilizá-las.
+CONN_MAX_AGE = int(os.environ.get("DJANGO_CONN_MAX_AGE", 60 if PRODUCTION else 0))
+
+if os.environ.get("POSTGRES_DB"):
+    # O psycopg2 não tem pool próprio no Django (o pool nativo exige o
+    # psycopg 3): a reutilização vem das conexões persistentes
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ["POSTGRES_DB"],
+            "USER": os.environ.get("POSTGRES_USER", ""),
+            "PASSWORD": os.environ.get("POSTGRES_PASSWORD", ""),
+            "HOST": os.environ.get("POSTGRES_HOST", "localhost"),
+            "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+            "CONN_MAX_AGE": CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+        }
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.environ.get("SQLITE_PATH", os.path.join(BASE_DIR, "db.sqlite3")),
+            "CONN_MAX_AGE": CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {
+                # Transações começam com BEGIN IMMEDIATE: quem vai escrever
+                # espera o lock no início (respeitando o busy_timeout) em vez
+                # de falhar com "database is locked" no meio da transação.
+                # Os pragmas (WAL etc.) ficam em apps/workout/db.py.
+                "transaction_mode": "IMMEDIATE",
+            },
+        }
+    }
+# Cache em memória local por padrão. Com mais de um processo (vários workers
+# do servidor, ou o run_jobs), o cache precisa ser compartilhado para que as
+# invalidações valham para todos: DJANGO_CACHE_URL aponta para um Redis
+# (redis://...) ou Memcached (memcached://host:porta), e DJANGO_CACHE_DIR
+# usa um cache em arquivos. Em produção um deles é obrigatório.
+CACHE_BACKENDS = {
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "rediss": "django.core.cache.backends.redis.RedisCache",
+    "memcached": "django.core.cache.backends.memcached.PyMemcacheCache",
+}
+if os.environ.get("DJANGO_CACHE_URL"):
+    scheme, _, address = os.environ["DJANGO_CACHE_URL"].partition("://")
+    if scheme not in CACHE_BACKENDS:
+        raise ImproperlyConfigured(
+            "DJANGO_CACHE_URL deve começar com redis://, rediss:// ou memcached://."
+        )
+    CACHES = {
+        "default": {
+            "BACKEND": CACHE_BACKENDS[scheme],
+            # O Redis recebe a URL inteira; o Memcached, só host:porta
+            "LOCATION": (
+                address if scheme == "memcached" else os.environ["DJANGO_CACHE_URL"]
+            ),
+        }
+    }
+elif os.environ.get("DJANGO_CACHE_DIR"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.environ["DJANGO_CACHE_DIR"],
+        }
+    }
+elif PRODUCTION:
+    raise ImproperlyConfigured(
+        "Defina DJANGO_CACHE_URL ou DJANGO_CACHE_DIR no perfil de produção: o "
+        "cache em memória local não é compartilhado entre os processos."
+    )
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "workout-tracker",
+        }
     }
+
+# Uma linha JSON por requisição (apps.workout.middleware). Em desenvolvimento
+# só as requisições lentas são registradas; DJANGO_REQUEST_LOG_LEVEL=INFO
+# registra todas.
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {"json": {"()": "apps.workout.metrics.JsonFormatter"}},
+    "handlers": {
+        "requests": {"class": "logging.StreamHandler", "formatter": "json"},
+    },
+    "loggers": {
+        "apps.workout.middleware": {
+            "handlers": ["requests"],
+            "level": os.environ.get(
+                "DJANGO_REQUEST_LOG_LEVEL", "INFO" if PRODUCTION else "WARNING"
+            ),
+            "propagate": False,
+        },
+        "apps.workout.querywatch": {
+            "handlers": ["requests"],
+            "level": "WARNING",
+            "propagate": False,
+        },
+    },
 }
+
+# Detector de consultas lentas e repetidas (N+1) por requisição. O relatório
+# fica em /metrics/queries, para a equipe.
+QUERY_WATCH = env_bool("DJANGO_QUERY_WATCH", True)
+SLOW_QUERY_MS = float(os.environ.get("DJANGO_SLOW_QUERY_MS", 100))
+REPEATED_QUERY_THRESHOLD = int(os.environ.get("DJANGO_REPEATED_QUERY_THRESHOLD", 5))
+
 SESSION_COOKIE_AGE = (
     1209600  # Tempo de vida do cookie de sessão em segundos (14 dias por padrão)
 )
+# Em produção a sessão é lida do cache e só vai ao banco quando não está lá
 SESSION_ENGINE = (
-    "django.contrib.sessions.backends.db"  # Armazenamento da sessão no banco de dados
+    "django.contrib.sessions.backends.cached_db"
+    if PRODUCTION
+    else "django.contrib.sessions.backends.db"
 )
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False  # Mantém a sessão mesmo após fechar o navegador
 
@@ -71,6 +206,28 @@ AUTH_USER_MODEL = "workout.User"
 LOGIN_URL = "login"  # Nome da view ou URL que leva à página de login
 LOGIN_REDIRECT_URL = "index"
 
+# Política de senhas. DJANGO_PASSWORD_HASHER escolhe o algoritmo das senhas
+# novas; os demais continuam aceitos no login. O custo de cada algoritmo é
+# configurável e, quando muda, a senha é regravada no próximo login. Meça o
+# efeito na capacidade de logins com "manage.py benchmark_logins".
+PASSWORD_HASHER_CLASSES = {
+    "bcrypt": "apps.workout.hashers.BCryptSHA256PasswordHasher",
+    "pbkdf2": "apps.workout.hashers.PBKDF2PasswordHasher",
+}
+PASSWORD_HASHER = os.environ.get("DJANGO_PASSWORD_HASHER", "bcrypt")
+if PASSWORD_HASHER not in PASSWORD_HASHER_CLASSES:
+    raise ImproperlyConfigured(
+        "DJANGO_PASSWORD_HASHER deve ser um de: "
+        + ", ".join(PASSWORD_HASHER_CLASSES)
+        + "."
+    )
+PASSWORD_HASHERS = [PASSWORD_HASHER_CLASSES[PASSWORD_HASHER]] + [
+    path for name, path in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER
+]
+# Custo do bcrypt (log2 das rodadas; cada +1 dobra o tempo) e iterações do PBKDF2
+BCRYPT_ROUNDS = int(os.environ.get("DJANGO_BCRYPT_ROUNDS", 12))
+PBKDF2_ITERATIONS = int(os.environ.get("DJANGO_PBKDF2_ITERATIONS", 1_000_000))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -93,5 +250,23 @@ USE_L10N = True
 USE_TZ = True
 
 STATIC_URL = "/static/"
-STATICFILES_DIRS = [os.path.join(BASE_DIR, "static")]
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
+
+# Em produção os arquivos estáticos são gerados com "manage.py build_static":
+# nomes com o hash do conteúdo, cópias .gz e .br ao lado de cada arquivo e
+# variantes WebP das imagens de fundo. O WhiteNoise os serve com cache
+# "immutable" (os nomes mudam quando o conteúdo muda) e escolhe a versão
+# comprimida pelo Accept-Encoding. Fica antes dos demais middlewares, de modo
+# que os arquivos estáticos não entram nas métricas das views.
+if PRODUCTION:
+    STORAGES = {
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {
+            "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"
+        },
+    }
+    MIDDLEWARE.insert(0, "whitenoise.middleware.WhiteNoiseMiddleware")
+
+# Planilhas enviadas para importação ficam aqui até o worker (run_jobs) processá-las
+MEDIA_URL = "/media/"
+MEDIA_ROOT = os.path.join(BASE_DIR, "media")